@@ -0,0 +1,43 @@
+import sys
+import time
+from datetime import timedelta
+from src.models.clinica import Clinica
+from benchmarks.generador import GeneradorClinica, cargar_clinica, INICIO, SEMANAS
+
+SEMILLA = 42
+PACIENTES = 5_000
+MEDICOS = 200
+CONSULTAS = 500
+
+
+def filtrando_todos(clinica, matricula, dia):
+    # Como antes: se recorren todos los turnos de la clinica
+    return sorted((turno for turno in clinica.obtener_turnos()
+                   if turno.obtener_medico().obtener_matricula() == matricula
+                   and turno.obtener_fecha_hora().date() == dia),
+                  key=lambda turno: turno.obtener_fecha_hora())
+
+
+def medir(nombre, funcion, generador, matriculas):
+    t0 = time.perf_counter()
+    for _ in range(CONSULTAS):
+        dia = (INICIO + timedelta(days=generador.elegir(range(7 * SEMANAS)))).date()
+        funcion(generador.elegir(matriculas), dia)
+    print(f"  {nombre:<28} {(time.perf_counter() - t0) / CONSULTAS * 1e6:>10.1f} us por consulta")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    generador = GeneradorClinica(SEMILLA)
+    clinica = Clinica()
+    _, medicos, agendados = cargar_clinica(clinica, generador, PACIENTES, MEDICOS, cantidad)
+    matriculas = [medico.obtener_matricula() for medico in medicos]
+    print(f"{agendados} turnos de {MEDICOS} medicos en {7 * SEMANAS} dias")
+
+    medir("filtrando todos los turnos", lambda matricula, dia: filtrando_todos(clinica, matricula, dia),
+          generador, matriculas)
+    medir("agenda del dia", clinica.obtener_agenda_del_dia, generador, matriculas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+CANTIDAD_MEDICOS = 300
+MUESTRA = 1000
+
+
+def crear_clinica():
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad("Clinica", DIAS))
+        clinica.agregar_medico(medico)
+
+    return clinica
+
+
+def agendar(clinica, desde, cantidad, inicio):
+    for i in range(desde, desde + cantidad):
+        matricula = f"MAT{i % CANTIDAD_MEDICOS:05d}"
+        fecha_hora = inicio + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS))
+        clinica.agendar_turno("10000000", matricula, "Clinica", fecha_hora)
+
+
+def main():
+    clinica = crear_clinica()
+    inicio = datetime.now().replace(second=0, microsecond=0) + timedelta(days=1)
+    agendados = 0
+
+    print(f"{'turnos':>10} {'us/turno':>10}")
+    for objetivo in (1_000, 10_000, 100_000):
+        agendar(clinica, agendados, objetivo - agendados - MUESTRA, inicio)
+        agendados = objetivo - MUESTRA
+
+        t0 = time.perf_counter()
+        agendar(clinica, agendados, MUESTRA, inicio)
+        transcurrido = time.perf_counter() - t0
+        agendados = objetivo
+
+        print(f"{objetivo:>10} {transcurrido / MUESTRA * 1e6:>10.2f}")
+
+    desde = inicio + timedelta(days=3)
+    hasta = desde + timedelta(hours=8)
+    t0 = time.perf_counter()
+    for i in range(MUESTRA):
+        clinica.obtener_huecos_libres(f"MAT{i % CANTIDAD_MEDICOS:05d}", desde, hasta)
+    transcurrido = time.perf_counter() - t0
+    print(f"huecos libres: {transcurrido / MUESTRA * 1e6:.2f} us/consulta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import sys
+import time
+from src.models.clinica import Clinica
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes"]
+ESPECIALIDADES = [f"Especialidad {i}" for i in range(50)]
+MUESTRA = 1000
+
+
+def crear_clinica(medicos):
+    # Cada medico atiende una especialidad dos dias de la semana
+    clinica = Clinica()
+    for i in range(medicos):
+        medico = Medico(f"Medico {i}", f"MAT{i:06d}")
+        medico.agregar_especialidad(Especialidad(ESPECIALIDADES[i % len(ESPECIALIDADES)],
+                                                 [DIAS[i % 5], DIAS[(i + 2) % 5]]))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def recorriendo_todos(clinica, especialidad, dia):
+    return [medico for medico in clinica.obtener_medicos()
+            if (medico.obtener_especialidad_para_dia(dia) or "").lower() == especialidad.lower()]
+
+
+def main():
+    medicos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    clinica = crear_clinica(medicos)
+
+    t0 = time.perf_counter()
+    for i in range(MUESTRA):
+        resultado = clinica.buscar_medicos(ESPECIALIDADES[i % len(ESPECIALIDADES)], DIAS[i % 5])
+    indice = (time.perf_counter() - t0) / MUESTRA
+
+    t0 = time.perf_counter()
+    for i in range(MUESTRA // 10):
+        esperado = recorriendo_todos(clinica, ESPECIALIDADES[(MUESTRA - 1) % len(ESPECIALIDADES)], DIAS[(MUESTRA - 1) % 5])
+    recorrido = (time.perf_counter() - t0) / (MUESTRA // 10)
+
+    assert [m.obtener_matricula() for m in resultado] == sorted(m.obtener_matricula() for m in esperado)
+    print(f"{medicos} medicos, {len(resultado)} en el resultado")
+    print(f"  buscar_medicos     {indice * 1e6:>10.1f} us")
+    print(f"  recorrer todos     {recorrido * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import random
+import sys
+import time
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.indice_pacientes import normalizar_nombre
+
+NOMBRES = ["Ana", "José", "María", "Lucía", "Carlos", "Martín", "Sofía", "Julián", "Inés", "Tomás"]
+APELLIDOS = ["López", "Martínez", "García", "Pérez", "Fernández", "Gómez", "Díaz", "Álvarez",
+             "Romero", "Sosa", "Benítez", "Acuña", "Ibáñez", "Muñoz", "Suárez", "Giménez"]
+MUESTRA = 2000
+
+
+def crear_pacientes(cantidad, generador):
+    pacientes = []
+    for i in range(cantidad):
+        # Apellidos con un sufijo numerico para que haya muchos distintos
+        apellido = f"{generador.choice(APELLIDOS)}{generador.randrange(5000)}"
+        nombre = f"{generador.choice(NOMBRES)} {apellido}"
+        fecha = f"{generador.randint(1, 28):02d}/{generador.randint(1, 12):02d}/{generador.randint(1930, 2020)}"
+        pacientes.append(Paciente(nombre, str(10_000_000 + i), fecha))
+    return pacientes
+
+
+def medir(funcion, consultas):
+    t0 = time.perf_counter()
+    for consulta in consultas:
+        resultado = funcion(consulta)
+    return (time.perf_counter() - t0) / len(consultas), resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    generador = random.Random(18)
+    pacientes = crear_pacientes(cantidad, generador)
+
+    clinica = Clinica()
+    t0 = time.perf_counter()
+    clinica.importar_pacientes({"nombre": p.obtener_nombre(), "dni": p.obtener_dni(),
+                                "fecha_nacimiento": p.obtener_fecha_nacimiento()} for p in pacientes)
+    print(f"{cantidad} pacientes importados (con indice) en {time.perf_counter() - t0:.2f} s")
+
+    consultas = [generador.choice(APELLIDOS)[:generador.randint(2, 5)] for _ in range(MUESTRA)]
+    indice, resultado = medir(lambda prefijo: clinica.buscar_pacientes(prefijo, 10), consultas)
+    print(f"  buscar_pacientes(prefijo, 10)     {indice * 1e6:>10.1f} us   ({resultado[0].obtener_nombre()})")
+
+    fechas = [p.obtener_fecha_nacimiento() for p in generador.sample(pacientes, MUESTRA)]
+    indice, _ = medir(lambda fecha: clinica.buscar_pacientes(fecha_nacimiento=fecha), fechas)
+    print(f"  buscar_pacientes(fecha_nacimiento)  {indice * 1e6:>8.1f} us")
+
+    # Sin indice: recorrer todos los pacientes normalizando cada nombre
+    def recorrer(prefijo):
+        prefijo = " " + normalizar_nombre(prefijo)
+        return [p for p in clinica.obtener_pacientes() if prefijo in " " + normalizar_nombre(p.obtener_nombre())][:10]
+
+    recorrido, _ = medir(recorrer, consultas[:5])
+    print(f"  recorrer todos los pacientes      {recorrido * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from src.exportacion import exportar_turnos, exportar_recetas
+from src.models.clinica import Clinica
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.exceptions import TurnoOcupadoException
+from benchmarks.generador import GeneradorClinica, APELLIDOS, ESPECIALIDADES, DIAS_HABILES, INICIO, SEMANAS
+
+try:
+    import resource
+except ImportError:
+    # Solo existe en sistemas tipo Unix
+    resource = None
+
+PERCENTILES = (50, 90, 99)
+# Una de cada tantas operaciones de agendamiento cancela un turno ya dado
+CANCELAR_CADA = 20
+
+
+def parsear_argumentos():
+    parser = argparse.ArgumentParser(description="Cargas sinteticas reproducibles sobre la Clinica")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--pacientes", type=int, default=20_000)
+    parser.add_argument("--medicos", type=int, default=500)
+    parser.add_argument("--turnos", type=int, default=50_000)
+    parser.add_argument("--recetas", type=int, default=10_000)
+    parser.add_argument("--lecturas", type=int, default=20_000)
+    parser.add_argument("--reportes", type=int, default=200)
+    parser.add_argument("--sqlite", action="store_true", help="Usar una base SQLite temporal")
+    parser.add_argument("--memoria", action="store_true",
+                        help="Medir el pico de memoria de cada carga con tracemalloc (mas lento)")
+    parser.add_argument("--salida", metavar="RUTA", help="Guardar los resultados en JSON")
+    parser.add_argument("--comparar", metavar="RUTA", help="Resultados JSON de una corrida anterior")
+    return parser.parse_args()
+
+
+class Carga:
+    # Latencias por operacion de una carga
+    def __init__(self):
+        self.__latencias = {}
+        self.__rechazadas = 0
+        self.__segundos = 0.0
+
+    def medir(self, operacion, funcion, *args):
+        # Devuelve False si el horario ya estaba ocupado
+        inicio = time.perf_counter()
+        try:
+            funcion(*args)
+            return True
+        except TurnoOcupadoException:
+            self.__rechazadas += 1
+            return False
+        finally:
+            self.__latencias.setdefault(operacion, []).append(time.perf_counter() - inicio)
+
+    def correr(self, pasos, medir_memoria):
+        if medir_memoria:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        pasos(self)
+        self.__segundos = time.perf_counter() - inicio
+        pico = None
+        if medir_memoria:
+            pico = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        return self.resultado(pico)
+
+    def resultado(self, memoria_pico):
+        todas = [latencia for latencias in self.__latencias.values() for latencia in latencias]
+        return {
+            "operaciones": len(todas),
+            "segundos": round(self.__segundos, 4),
+            "por_segundo": round(len(todas) / self.__segundos, 1) if self.__segundos else None,
+            "rechazadas": self.__rechazadas,
+            "latencia_us": _percentiles(todas),
+            "por_operacion": {operacion: {"cantidad": len(latencias), "latencia_us": _percentiles(latencias)}
+                              for operacion, latencias in sorted(self.__latencias.items())},
+            "memoria_pico_mb": round(memoria_pico, 1) if memoria_pico is not None else None,
+            "rss_maximo_mb": _rss_maximo(),
+        }
+
+
+def _percentiles(latencias):
+    if not latencias:
+        return {}
+    ordenadas = sorted(latencias)
+    resultado = {f"p{p}": round(ordenadas[min(len(ordenadas) - 1, len(ordenadas) * p // 100)] * 1e6, 1)
+                 for p in PERCENTILES}
+    resultado["max"] = round(ordenadas[-1] * 1e6, 1)
+    return resultado
+
+
+def _rss_maximo():
+    # Pico de memoria del proceso hasta ahora (no baja entre cargas)
+    if resource is None:
+        return None
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo informa en KiB y macOS en bytes
+    return round(maximo / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def agendamiento(clinica, generador, solicitudes, filas, medicos, recetas):
+    dados = []
+    cada_receta = max(1, len(solicitudes) // recetas) if recetas else None
+
+    def pasos(carga):
+        for i, solicitud in enumerate(solicitudes):
+            if carga.medir("agendar_turno", clinica.agendar_turno, *solicitud):
+                dados.append(solicitud)
+            if cada_receta is not None and i % cada_receta == 0:
+                carga.medir("emitir_receta", clinica.emitir_receta, generador.elegir(filas)["dni"],
+                            generador.elegir(medicos).obtener_matricula(), generador.medicamentos())
+            if i % CANCELAR_CADA == CANCELAR_CADA - 1 and dados:
+                _, matricula, _, fecha_hora, _ = dados.pop(len(dados) // 2)
+                carga.medir("cancelar_turno", clinica.cancelar_turno, matricula, fecha_hora)
+
+    return pasos
+
+
+def lectura(clinica, generador, filas, medicos, cantidad):
+    def pasos(carga):
+        for i in range(cantidad):
+            tipo = i % 5
+            if tipo < 2:
+                carga.medir("obtener_historia_clinica", clinica.obtener_historia_clinica, generador.elegir(filas)["dni"])
+            elif tipo == 2:
+                carga.medir("buscar_medicos", clinica.buscar_medicos, generador.elegir(ESPECIALIDADES),
+                            generador.elegir(DIAS_HABILES))
+            elif tipo == 3:
+                carga.medir("buscar_pacientes", clinica.buscar_pacientes, generador.elegir(APELLIDOS)[:3], 10)
+            else:
+                dia = INICIO + timedelta(days=generador.elegir(range(7 * SEMANAS)))
+                carga.medir("obtener_huecos_libres", clinica.obtener_huecos_libres,
+                            generador.elegir(medicos).obtener_matricula(),
+                            dia + timedelta(hours=8), dia + timedelta(hours=20))
+
+    return pasos
+
+
+def reportes(clinica, generador, filas, medicos, cantidad):
+    def exportar_todo():
+        exportar_turnos(clinica, io.StringIO())
+
+    def agenda_de_medico(matricula):
+        exportar_turnos(clinica, io.StringIO(), "jsonl", INICIO, INICIO + timedelta(weeks=1), matricula)
+
+    def recetas_de_paciente(dni):
+        exportar_recetas(clinica, io.StringIO(), "csv", dni=dni)
+
+    def historia_como_texto(dni):
+        clinica.obtener_historia_clinica(dni).render(io.StringIO())
+
+    def primeras_paginas():
+        paginador = clinica.paginar_turnos(20)
+        for _ in range(5):
+            paginador.siguiente()
+
+    def pasos(carga):
+        carga.medir("exportar_turnos_completo", exportar_todo)
+        for i in range(cantidad):
+            tipo = i % 4
+            if tipo == 0:
+                carga.medir("exportar_agenda_semanal", agenda_de_medico, generador.elegir(medicos).obtener_matricula())
+            elif tipo == 1:
+                carga.medir("exportar_recetas_paciente", recetas_de_paciente, generador.elegir(filas)["dni"])
+            elif tipo == 2:
+                carga.medir("historia_como_texto", historia_como_texto, generador.elegir(filas)["dni"])
+            else:
+                carga.medir("paginar_turnos", primeras_paginas)
+
+    return pasos
+
+
+def imprimir(resultados):
+    print(f"Preparacion: {resultados['preparacion_segundos']} s")
+    print(f"{'carga':<30} {'ops':>8} {'ops/s':>10} {'rechazos':>8} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9} "
+          f"{'max us':>10} {'pico MB':>8} {'rss MB':>8}")
+    for nombre, carga in resultados["cargas"].items():
+        latencia = carga["latencia_us"]
+        pico = carga["memoria_pico_mb"] if carga["memoria_pico_mb"] is not None else "-"
+        rss = carga["rss_maximo_mb"] if carga["rss_maximo_mb"] is not None else "-"
+        print(f"{nombre:<30} {carga['operaciones']:>8} {carga['por_segundo']:>10} {carga['rechazadas']:>8} "
+              f"{latencia['p50']:>9} {latencia['p90']:>9} {latencia['p99']:>9} {latencia['max']:>10} "
+              f"{pico:>8} {rss:>8}")
+        for operacion, datos in carga["por_operacion"].items():
+            latencia = datos["latencia_us"]
+            print(f"  {operacion:<28} {datos['cantidad']:>8} {'':>10} {'':>8} {latencia['p50']:>9} "
+                  f"{latencia['p90']:>9} {latencia['p99']:>9} {latencia['max']:>10}")
+
+
+def comparar(resultados, ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        anteriores = json.load(archivo)
+    if anteriores.get("parametros") != resultados["parametros"]:
+        print("Aviso: la corrida anterior uso otros parametros")
+
+    print(f"\nComparacion con {ruta}")
+    print(f"{'carga':<14} {'ops/s':>10} {'p50':>9} {'p99':>9}")
+    for nombre, carga in resultados["cargas"].items():
+        anterior = anteriores.get("cargas", {}).get(nombre)
+        if anterior is None:
+            continue
+        print(f"{nombre:<14} {_variacion(anterior['por_segundo'], carga['por_segundo']):>10} "
+              f"{_variacion(anterior['latencia_us']['p50'], carga['latencia_us']['p50']):>9} "
+              f"{_variacion(anterior['latencia_us']['p99'], carga['latencia_us']['p99']):>9}")
+
+
+def _variacion(anterior, actual):
+    if not anterior:
+        return "-"
+    return f"{(actual - anterior) / anterior * 100:+.1f}%"
+
+
+def main():
+    args = parsear_argumentos()
+    parametros = {clave: valor for clave, valor in vars(args).items() if clave not in ("salida", "comparar")}
+
+    with tempfile.TemporaryDirectory() as directorio:
+        repositorio = RepositorioSQLite(os.path.join(directorio, "clinica.db"), 1000) if args.sqlite else None
+        clinica = Clinica(repositorio=repositorio)
+        generador = GeneradorClinica(args.semilla)
+
+        inicio = time.perf_counter()
+        filas = generador.filas_pacientes(args.pacientes)
+        clinica.importar_pacientes(filas)
+        medicos = generador.medicos(args.medicos)
+        for medico in medicos:
+            clinica.agregar_medico(medico)
+        solicitudes = generador.solicitudes_turnos(filas, medicos, args.turnos)
+        preparacion = time.perf_counter() - inicio
+
+        cargas = {
+            "agendamiento": agendamiento(clinica, generador, solicitudes, filas, medicos, args.recetas),
+            "lectura": lectura(clinica, generador, filas, medicos, args.lecturas),
+            "reportes": reportes(clinica, generador, filas, medicos, args.reportes),
+        }
+        resultados = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "parametros": parametros,
+            "preparacion_segundos": round(preparacion, 3),
+            "cargas": {nombre: Carga().correr(pasos, args.memoria) for nombre, pasos in cargas.items()},
+        }
+        clinica.cerrar()
+
+    imprimir(resultados)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.salida}")
+    if args.comparar:
+        comparar(resultados, args.comparar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from src.persistencia.columnas_turnos import ColumnasTurnos, numpy
+
+ESPECIALIDADES = ("Pediatria", "Cardiologia", "Dermatologia", "Neurologia", "Clinica")
+MEDICOS = 500
+PACIENTES = 100_000
+
+
+def llenar(columnas, cantidad, inicio):
+    aleatorio = random.Random(1)
+    for _ in range(cantidad):
+        columnas.agregar(f"MAT{aleatorio.randrange(MEDICOS):05d}", str(10_000_000 + aleatorio.randrange(PACIENTES)),
+                         aleatorio.choice(ESPECIALIDADES), inicio + timedelta(minutes=15 * aleatorio.randrange(35_040)),
+                         aleatorio.choice((None, 15, 30, 45)))
+
+
+def medir(nombre, funcion):
+    t0 = time.perf_counter()
+    funcion()
+    print(f"  {nombre:<40} {(time.perf_counter() - t0) * 1000:>10.1f} ms")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    inicio = datetime(2030, 1, 1)
+
+    # Con NumPy se mide ademas la version vectorizada sobre los mismos datos
+    modos = [("python", ColumnasTurnos(usar_numpy=False))]
+    if numpy is not None:
+        modos.append(("numpy", ColumnasTurnos()))
+    else:
+        print("NumPy no esta instalado: solo se mide la version en Python")
+
+    t0 = time.perf_counter()
+    for _, columnas in modos:
+        llenar(columnas, cantidad, inicio)
+    print(f"turnos: {cantidad} (carga {time.perf_counter() - t0:.1f} s)")
+
+    un_mes = (inicio + timedelta(days=31), inicio + timedelta(days=62))
+    for modo, columnas in modos:
+        print(modo)
+        medir("contar por especialidad y dia", lambda: columnas.contar(("especialidad", "dia")))
+        medir("minutos por medico (un mes)", lambda: columnas.sumar_minutos("medico", *un_mes))
+        medir("histograma por dia (un año)", lambda: columnas.histograma(inicio, inicio + timedelta(days=365),
+                                                                         timedelta(days=1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+
+TODOS_LOS_DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+
+
+def crear_clinica(journal, medicos):
+    clinica = Clinica(journal, concurrente=True)
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+    for i in range(medicos):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad("Clinica", TODOS_LOS_DIAS))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def medir(hilos, turnos_por_hilo, con_journal):
+    # Cada hilo agenda en su propio medico: el journal (un fsync por confirmacion)
+    # es lo unico que comparten
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = Journal(os.path.join(directorio, "clinica.journal")) if con_journal else None
+        clinica = crear_clinica(journal, hilos)
+        inicio = datetime.now() + timedelta(days=1)
+
+        def agendar(numero):
+            matricula = f"MAT{numero:05d}"
+            for k in range(turnos_por_hilo):
+                clinica.agendar_turno("10000000", matricula, "Clinica", inicio + timedelta(minutes=30 * k), 30)
+
+        trabajadores = [threading.Thread(target=agendar, args=(i,)) for i in range(hilos)]
+        t0 = time.perf_counter()
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+        transcurrido = time.perf_counter() - t0
+
+        total = len(clinica.obtener_turnos())
+        clinica.cerrar()
+        assert total == hilos * turnos_por_hilo
+
+    return total / transcurrido
+
+
+def main():
+    turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 64_000
+
+    for con_journal in (False, True):
+        # Con journal cada turno espera su fsync: se usan menos turnos
+        cantidad = turnos if not con_journal else turnos // 16
+        print("con journal" if con_journal else "sin journal")
+        for hilos in (1, 8, 32):
+            por_segundo = medir(hilos, cantidad // hilos, con_journal)
+            print(f"  {hilos:>2} hilos {por_segundo:>12,.0f} turnos/s")
+
+
+if __name__ == "__main__":
+    main()
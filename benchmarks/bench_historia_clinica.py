@@ -0,0 +1,102 @@
+import io
+import sys
+import time
+from datetime import datetime, timedelta
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.models.receta import Receta
+from src.models.historia_clinica import HistoriaClinica
+
+REPETICIONES = 20
+
+
+def crear_historia(entradas):
+    paciente = Paciente("Paciente Prueba", "10000000", "01/01/1990")
+    medico = Medico("Medico Prueba", "MAT00001")
+    medico.agregar_especialidad(Especialidad("Clinica", ["lunes", "martes", "miercoles", "jueves",
+                                                         "viernes", "sabado", "domingo"]))
+    historia = HistoriaClinica(paciente)
+    inicio = datetime(2030, 1, 1, 8, 0)
+    for i in range(entradas // 2):
+        historia.agregar_turno(Turno(paciente, medico, inicio + timedelta(minutes=30 * i), "Clinica", 30))
+        historia.agregar_receta(Receta(paciente, medico, ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+                                       inicio + timedelta(minutes=30 * i)))
+    return historia, paciente, medico
+
+
+def texto_anterior(historia):
+    # Como se armaba antes: nombres recortados de str() y el resultado con +=
+    def turno_str(turno):
+        duracion_str = f" - Duracion: {turno.obtener_duracion()} min" if turno.obtener_duracion() is not None else ""
+        return (f"Turno: {turno.obtener_paciente().obtener_dni()} "
+                f"({str(turno.obtener_paciente()).split(':')[1].split(',')[0].strip()}) "
+                f"con {str(turno.obtener_medico()).split(',')[0]} "
+                f"- Especialidad: {turno.obtener_especialidad()} "
+                f"- Fecha: {turno.obtener_fecha_hora().strftime('%d/%m/%Y %H:%M')}{duracion_str}")
+
+    def receta_str(receta):
+        nombre_medico = str(receta.obtener_medico()).split(',')[0].replace("Dr. ", "").strip()
+        return (f"Receta - Paciente: {str(receta.obtener_paciente()).split(':')[1].split(',')[0].strip()}"
+                f" - Medico: Dr. {nombre_medico}"
+                f" - Medicamentos: {', '.join(receta.obtener_medicamentos())}"
+                f" - Fecha: {receta.obtener_fecha().strftime('%d/%m/%Y %H:%M')}")
+
+    turnos = historia.obtener_turnos()
+    recetas = historia.obtener_recetas()
+    resultado = f"Historia Clinica de {str(historia.obtener_paciente()).split(':')[1].split(',')[0].strip()}\n"
+    resultado += "=" * 50 + "\n"
+    resultado += f"Turnos ({len(turnos)}):\n"
+    for i, turno in enumerate(turnos, 1):
+        resultado += f"{i}. {turno_str(turno)}\n"
+    resultado += "\n"
+    resultado += f"Recetas ({len(recetas)}):\n"
+    for i, receta in enumerate(recetas, 1):
+        resultado += f"{i}. {receta_str(receta)}\n"
+    return resultado
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - t0) / repeticiones
+
+
+def main():
+    entradas = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    historia, paciente, medico = crear_historia(entradas)
+    print(f"Historia clinica con {entradas} entradas")
+
+    anterior = medir(lambda: texto_anterior(historia))
+    primera = medir(lambda: str(historia), 1)
+    guardado = medir(lambda: str(historia))
+
+    # Un turno nuevo invalida el texto de la historia, pero no el de los turnos y recetas ya armados
+    fecha = datetime(2031, 1, 1, 8, 0)
+
+    def agregar_y_armar():
+        nonlocal fecha
+        fecha += timedelta(minutes=30)
+        historia.agregar_turno(Turno(paciente, medico, fecha, "Clinica", 30))
+        return str(historia)
+
+    cambiado = medir(agregar_y_armar)
+    assert texto_anterior(historia) == str(historia)
+
+    def escribir():
+        historia.agregar_receta(Receta(paciente, medico, ["Paracetamol 500mg"], fecha))
+        historia.render(io.StringIO())
+
+    render = medir(escribir)
+
+    print(f"  como antes (split y +=)        {anterior * 1e3:>9.3f} ms")
+    print(f"  str, primera vez               {primera * 1e3:>9.3f} ms")
+    print(f"  str, sin cambios               {guardado * 1e3:>9.3f} ms")
+    print(f"  str, despues de agregar turno  {cambiado * 1e3:>9.3f} ms")
+    print(f"  render despues de agregar      {render * 1e3:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
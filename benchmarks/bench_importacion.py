@@ -0,0 +1,47 @@
+import csv
+import os
+import sys
+import tempfile
+import time
+from src.importacion import leer_filas
+from src.models.clinica import Clinica
+from src.persistencia.journal import Journal
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def generar_csv(ruta, cantidad):
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["nombre", "dni", "fecha_nacimiento"])
+        for i in range(cantidad):
+            fecha = f"{i % 28 + 1:02d}/{i % 12 + 1:02d}/{1930 + i % 90}"
+            escritor.writerow([f"Paciente {i}", str(10_000_000 + i), fecha])
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_csv = os.path.join(directorio, "pacientes.csv")
+        generar_csv(ruta_csv, cantidad)
+
+        clinica = Clinica(Journal(os.path.join(directorio, "clinica.journal")))
+        t0 = time.perf_counter()
+        resultado = clinica.importar_pacientes(leer_filas(ruta_csv))
+        transcurrido = time.perf_counter() - t0
+        clinica.cerrar()
+
+        print(f"filas:        {cantidad}")
+        print(f"resultado:    {resultado}")
+        print(f"tiempo:       {transcurrido:.2f} s ({cantidad / transcurrido:,.0f} filas/s)")
+        if resource is not None:
+            pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"memoria pico: {pico:.1f} MB (incluye los pacientes cargados en memoria)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.persistencia.journal import Journal
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+CANTIDAD_PACIENTES = 10_000
+CANTIDAD_MEDICOS = 300
+
+
+def generar_eventos(cantidad):
+    for i in range(CANTIDAD_PACIENTES):
+        yield ["P", f"Paciente {i}", str(10_000_000 + i), "01/01/1990"]
+
+    for i in range(CANTIDAD_MEDICOS):
+        yield ["M", f"Medico {i}", f"MAT{i:05d}"]
+        yield ["E", f"MAT{i:05d}", "Clinica", DIAS]
+
+    inicio = datetime(2030, 1, 1, 8, 0)
+    for i in range(cantidad - CANTIDAD_PACIENTES - 2 * CANTIDAD_MEDICOS):
+        fecha_hora = inicio + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS))
+        yield ["T", str(10_000_000 + i % CANTIDAD_PACIENTES), f"MAT{i % CANTIDAD_MEDICOS:05d}",
+               "Clinica", fecha_hora.isoformat(), 30]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.journal")
+
+        t0 = time.perf_counter()
+        journal = Journal(ruta)
+        lote = []
+        for evento in generar_eventos(cantidad):
+            lote.append(evento)
+            if len(lote) == 10_000:
+                journal.registrar_lote(lote)
+                lote = []
+        journal.registrar_lote(lote)
+        journal.cerrar()
+        escritura = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        clinica = Clinica(Journal(ruta))
+        reproduccion = time.perf_counter() - t0
+
+        print(f"eventos:        {cantidad}")
+        print(f"tamaño:         {os.path.getsize(ruta) / 1e6:.1f} MB")
+        print(f"escritura:      {escritura:.2f} s (lotes de 10000)")
+        print(f"reproduccion:   {reproduccion:.2f} s")
+        print(f"turnos:         {len(clinica.obtener_turnos())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.models.receta import Receta
+from src.persistencia.repositorio_memoria import RepositorioMemoria
+
+ESPECIALIDADES = ("Pediatria", "Cardiologia", "Dermatologia", "Neurologia", "Clinica")
+
+
+def texto_nuevo(texto):
+    # Simula un texto recien leido de un archivo: mismo contenido, objeto distinto
+    return "".join(list(texto))
+
+
+def medir(nombre, cantidad, construir):
+    gc.collect()
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    objetos = construir()
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<40} {(despues - antes) / cantidad:>8.1f} bytes/objeto")
+    return objetos
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    inicio = datetime(2030, 1, 1, 8, 0)
+    fechas = [inicio + timedelta(minutes=15 * i) for i in range(cantidad)]
+
+    medicos = []
+    for i, especialidad in enumerate(ESPECIALIDADES):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad(especialidad, ["lunes", "martes", "miercoles", "jueves",
+                                                                "viernes", "sabado", "domingo"]))
+        medicos.append(medico)
+    paciente = Paciente("Paciente Prueba", "10000000", "01/01/1990")
+
+    # Las fechas se crean antes de medir: solo se cuenta lo que agrega cada objeto
+    medir("Paciente", cantidad, lambda: [
+        Paciente(f"Paciente {i}", str(10_000_000 + i), texto_nuevo("01/01/1990")) for i in range(cantidad)])
+    medir("Especialidad", cantidad // 10, lambda: [
+        Especialidad(texto_nuevo("Pediatria"), [texto_nuevo("lunes"), texto_nuevo("jueves")])
+        for _ in range(cantidad // 10)])
+    medir("Turno", cantidad, lambda: [
+        Turno(paciente, medicos[i % 5], fechas[i], texto_nuevo(ESPECIALIDADES[i % 5]), 30) for i in range(cantidad)])
+    medir("Receta", cantidad, lambda: [
+        Receta(paciente, medicos[i % 5], [texto_nuevo("Paracetamol 500mg")], fechas[i]) for i in range(cantidad)])
+
+    def turnos_en_repositorio():
+        repositorio = RepositorioMemoria()
+        repositorio.agregar_paciente(paciente)
+        for medico in medicos:
+            repositorio.agregar_medico(medico)
+        for i in range(cantidad):
+            repositorio.agregar_turno(Turno(paciente, medicos[i % 5], fechas[i],
+                                            texto_nuevo(ESPECIALIDADES[i % 5]), 30))
+        return repositorio
+
+    medir("Turno guardado (repositorio en memoria)", cantidad, turnos_en_repositorio)
+
+
+if __name__ == "__main__":
+    main()
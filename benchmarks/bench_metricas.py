@@ -0,0 +1,55 @@
+import sys
+import time
+from datetime import datetime, timedelta
+from src.metricas import Metricas
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+MEDICOS = 100
+
+
+def crear_clinica(metricas):
+    clinica = Clinica(metricas=metricas)
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+    for i in range(MEDICOS):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad("Clinica", DIAS))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def medir(clinica, cantidad):
+    inicio = datetime(2030, 1, 1, 8, 0)
+    t0 = time.perf_counter()
+    for i in range(cantidad):
+        clinica.agendar_turno("10000000", f"MAT{i % MEDICOS:05d}", "Clinica",
+                              inicio + timedelta(minutes=30 * (i // MEDICOS)), 30)
+    agendar = (time.perf_counter() - t0) / cantidad
+
+    t0 = time.perf_counter()
+    for i in range(cantidad):
+        clinica.buscar_medicos("Clinica", DIAS[i % 7])
+    buscar = (time.perf_counter() - t0) / cantidad
+    return agendar, buscar
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    sin_agendar, sin_buscar = medir(crear_clinica(None), cantidad)
+    metricas = Metricas()
+    con_agendar, con_buscar = medir(crear_clinica(metricas), cantidad)
+
+    print(f"{cantidad} operaciones de cada tipo")
+    print(f"{'':<16} {'sin metricas':>14} {'con metricas':>14}")
+    print(f"{'agendar_turno':<16} {sin_agendar * 1e6:>11.2f} us {con_agendar * 1e6:>11.2f} us")
+    print(f"{'buscar_medicos':<16} {sin_buscar * 1e6:>11.2f} us {con_buscar * 1e6:>11.2f} us")
+    print()
+    print("\n".join(linea for linea in metricas.exportar().splitlines()
+                    if linea.startswith("clinica_operacion_segundos_count")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import io
+import os
+import sys
+import tempfile
+import time
+from src.models.clinica import Clinica
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+
+TAMANO_PAGINA = 20
+
+
+def filas_pacientes(cantidad):
+    return ({"nombre": f"Paciente {i}", "dni": str(10_000_000 + i), "fecha_nacimiento": "01/01/1990"}
+            for i in range(cantidad))
+
+
+def listado_completo(clinica):
+    # Como el menu antes: todos los pacientes formateados de una vez
+    salida = io.StringIO()
+    pacientes = clinica.obtener_pacientes()
+    for i, paciente in enumerate(pacientes, 1):
+        salida.write(f"{i}. {paciente}\n")
+
+
+def paginas(clinica, cantidad_paginas):
+    salida = io.StringIO()
+    paginador = clinica.paginar_pacientes(TAMANO_PAGINA)
+    for _ in range(cantidad_paginas):
+        for i, paciente in enumerate(paginador.siguiente(), paginador.obtener_posicion_inicial()):
+            salida.write(f"{i}. {paciente}\n")
+
+
+def medir(nombre, funcion):
+    t0 = time.perf_counter()
+    funcion()
+    print(f"  {nombre:<28} {(time.perf_counter() - t0) * 1e3:>10.2f} ms")
+
+
+def comparar(nombre, clinica):
+    print(nombre)
+    medir("listado completo", lambda: listado_completo(clinica))
+    medir("primera pagina", lambda: paginas(clinica, 1))
+    medir("diez paginas", lambda: paginas(clinica, 10))
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{cantidad} pacientes, paginas de {TAMANO_PAGINA}")
+
+    clinica = Clinica()
+    clinica.importar_pacientes(filas_pacientes(cantidad))
+    comparar("Memoria", clinica)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        clinica = Clinica(repositorio=RepositorioSQLite(os.path.join(directorio, "clinica.db")))
+        clinica.importar_pacientes(filas_pacientes(cantidad))
+        comparar("SQLite", clinica)
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+CANTIDAD_MEDICOS = 300
+MUESTRA = 1000
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as directorio:
+        repositorio = RepositorioSQLite(os.path.join(directorio, "clinica.db"), tamano_lote=1000)
+        clinica = Clinica(repositorio=repositorio)
+        clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+        for i in range(CANTIDAD_MEDICOS):
+            medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+            medico.agregar_especialidad(Especialidad("Clinica", DIAS))
+            clinica.agregar_medico(medico)
+
+        inicio = datetime.now().replace(second=0, microsecond=0) + timedelta(days=1)
+        print(f"{'turnos':>10} {'us/turno':>10}")
+
+        t0 = time.perf_counter()
+        for i in range(total):
+            matricula = f"MAT{i % CANTIDAD_MEDICOS:05d}"
+            fecha_hora = inicio + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS))
+            clinica.agendar_turno("10000000", matricula, "Clinica", fecha_hora, 30)
+
+            if (i + 1) % (total // 5) == 0:
+                transcurrido = time.perf_counter() - t0
+                print(f"{i + 1:>10} {transcurrido / (total // 5) * 1e6:>10.2f}")
+                t0 = time.perf_counter()
+
+        desde = inicio + timedelta(days=3)
+        t0 = time.perf_counter()
+        for i in range(MUESTRA):
+            clinica.obtener_huecos_libres(f"MAT{i % CANTIDAD_MEDICOS:05d}", desde, desde + timedelta(hours=8))
+        transcurrido = time.perf_counter() - t0
+        print(f"huecos libres: {transcurrido / MUESTRA * 1e6:.2f} us/consulta")
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
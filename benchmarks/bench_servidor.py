@@ -0,0 +1,90 @@
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.servidor import ServidorClinica
+
+TODOS_LOS_DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+MEDICOS = 100
+
+
+def crear_clinica(conexiones):
+    clinica = Clinica(concurrente=True)
+    for i in range(conexiones):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990"))
+    for i in range(MEDICOS):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad("Clinica", TODOS_LOS_DIAS))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def percentil(valores, p):
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+async def cliente(host, puerto, numero, solicitudes, inicio, latencias, errores):
+    # Cada cliente usa su propia conexion y alterna turnos, recetas e historias
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    dni = str(10_000_000 + numero)
+    matricula = f"MAT{numero % MEDICOS:05d}"
+    fecha = inicio + timedelta(minutes=30 * numero)
+
+    for k in range(solicitudes):
+        if k % 3 == 0:
+            accion, datos = "agendar_turno", {"dni": dni, "matricula": matricula, "especialidad": "Clinica",
+                                              "fecha_hora": (fecha + timedelta(days=k)).isoformat(), "duracion": 30}
+        elif k % 3 == 1:
+            accion, datos = "emitir_receta", {"dni": dni, "matricula": matricula, "medicamentos": ["Ibuprofeno"]}
+        else:
+            accion, datos = "obtener_historia_clinica", {"dni": dni}
+
+        t0 = time.perf_counter()
+        escritor.write(json.dumps({"id": k, "accion": accion, "datos": datos}).encode("utf-8") + b"\n")
+        await escritor.drain()
+        respuesta = json.loads(await lector.readline())
+        latencias.append(time.perf_counter() - t0)
+        if not respuesta["ok"]:
+            errores.append(respuesta["error"])
+
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def medir(conexiones, solicitudes, hilos):
+    clinica = crear_clinica(conexiones)
+    servidor = ServidorClinica(clinica, hilos)
+    host, puerto = await servidor.iniciar("127.0.0.1", 0)
+    inicio = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    latencias = []
+    errores = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(cliente(host, puerto, i, solicitudes, inicio, latencias, errores)
+                           for i in range(conexiones)))
+    transcurrido = time.perf_counter() - t0
+    await servidor.cerrar()
+
+    latencias.sort()
+    return len(latencias) / transcurrido, percentil(latencias, 50), percentil(latencias, 99), len(errores)
+
+
+def main():
+    # El generador de carga corre en el mismo proceso que el servidor: los numeros
+    # incluyen el costo del cliente y sirven para comparar configuraciones
+    conexiones = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    solicitudes = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    for hilos in (4, 32):
+        por_segundo, p50, p99, errores = asyncio.run(medir(conexiones, solicitudes, hilos))
+        print(f"{conexiones} conexiones, {hilos:>2} hilos: {por_segundo:>10,.0f} solicitudes/s"
+              f"  p50 {p50 * 1000:>7.2f} ms  p99 {p99 * 1000:>7.2f} ms  errores {errores}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.persistencia.journal import Journal
+from src.persistencia.snapshot import Snapshot
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+CANTIDAD_MEDICOS = 300
+
+
+def generar_eventos(pacientes, turnos):
+    for i in range(pacientes):
+        yield ["P", f"Paciente {i}", str(10_000_000 + i), "01/01/1990"]
+
+    for i in range(CANTIDAD_MEDICOS):
+        yield ["M", f"Medico {i}", f"MAT{i:05d}"]
+        yield ["E", f"MAT{i:05d}", "Clinica", DIAS]
+
+    inicio = datetime(2030, 1, 1, 8, 0)
+    for i in range(turnos):
+        fecha_hora = inicio + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS))
+        yield ["T", str(10_000_000 + i % pacientes), f"MAT{i % CANTIDAD_MEDICOS:05d}",
+               "Clinica", fecha_hora.isoformat(), 30]
+
+
+def main():
+    pacientes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    turnos = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_journal = os.path.join(directorio, "clinica.journal")
+        ruta_snapshot = os.path.join(directorio, "clinica.snapshot")
+
+        journal = Journal(ruta_journal)
+        journal.registrar_lote(generar_eventos(pacientes, turnos))
+        journal.cerrar()
+        tamano_journal = os.path.getsize(ruta_journal)
+
+        t0 = time.perf_counter()
+        clinica = Clinica(Journal(ruta_journal), Snapshot(ruta_snapshot))
+        reproduccion = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        clinica.tomar_snapshot(en_segundo_plano=False)
+        escritura = time.perf_counter() - t0
+        clinica.cerrar()
+
+        t0 = time.perf_counter()
+        Clinica(Journal(ruta_journal), Snapshot(ruta_snapshot)).cerrar()
+        carga = time.perf_counter() - t0
+
+        print(f"pacientes / turnos:      {pacientes} / {turnos}")
+        print(f"journal:                 {tamano_journal / 1e6:.1f} MB, reproduccion {reproduccion:.2f} s")
+        print(f"snapshot:                {os.path.getsize(ruta_snapshot) / 1e6:.1f} MB")
+        print(f"escritura del snapshot:  {escritura:.2f} s")
+        print(f"carga del snapshot:      {carga:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import sys
+import time
+from datetime import timedelta
+from src.models.clinica import Clinica
+from benchmarks.generador import GeneradorClinica, cargar_clinica, INICIO, SEMANAS
+
+SEMILLA = 42
+PACIENTES = 5_000
+MEDICOS = 200
+CONSULTAS = 200
+
+
+def medir(nombre, funcion, generador):
+    t0 = time.perf_counter()
+    for _ in range(CONSULTAS):
+        desde = INICIO + timedelta(days=generador.elegir(range(7 * SEMANAS)))
+        funcion(desde, desde + timedelta(days=1))
+    print(f"  {nombre:<28} {(time.perf_counter() - t0) / CONSULTAS * 1e6:>10.1f} us por consulta")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    generador = GeneradorClinica(SEMILLA)
+    clinica = Clinica()
+    _, _, agendados = cargar_clinica(clinica, generador, PACIENTES, MEDICOS, cantidad)
+    print(f"{agendados} turnos en {7 * SEMANAS} dias, consultas de un dia")
+
+    # Antes: filtrar recorriendo todos los turnos
+    medir("recorrido completo", lambda desde, hasta: list(clinica.iterar_turnos(desde, hasta)), generador)
+    medir("particiones por dia", clinica.obtener_turnos_entre, generador)
+
+    t0 = time.perf_counter()
+    archivados = clinica.archivar_turnos(INICIO + timedelta(weeks=SEMANAS // 2))
+    print(f"  {'archivar la primera mitad':<28} {(time.perf_counter() - t0) * 1e3:>10.2f} ms ({archivados} turnos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import sys
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.exceptions import MedicoNoDisponibleException, TurnoOcupadoException
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes"]
+ESPECIALIDADES = ["Cardiologia", "Pediatria", "Traumatologia", "Dermatologia"]
+MUESTRA = 200
+
+
+def crear_clinica(medicos, inicio, ocupacion):
+    # Cada medico atiende una especialidad y tiene ocupadas las primeras `ocupacion`
+    # medias horas de cada dia laborable de las dos primeras semanas
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+    for i in range(medicos):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad(ESPECIALIDADES[i % len(ESPECIALIDADES)], DIAS))
+        clinica.agregar_medico(medico)
+
+    turnos = []
+    for i in range(medicos):
+        for dia in range(14):
+            fecha = inicio + timedelta(days=dia)
+            if fecha.weekday() >= 5:
+                continue
+            for k in range(ocupacion):
+                turnos.append(("10000000", f"MAT{i:05d}", ESPECIALIDADES[i % len(ESPECIALIDADES)],
+                               fecha + timedelta(minutes=30 * k), 30))
+    clinica.agendar_turnos_lote(turnos)
+    return clinica
+
+
+def por_prueba_y_error(clinica, medicos, especialidad, desde, hasta, cantidad):
+    # Lo que habia que hacer antes: probar cada media hora de cada medico
+    libres = []
+    fecha = desde
+    while fecha < hasta and len(libres) < cantidad:
+        for medico in medicos:
+            try:
+                clinica.validar_especialidad_en_dia(medico, especialidad, fecha.weekday())
+                clinica.validar_turno_no_duplicado(medico.obtener_matricula(), fecha, fecha + timedelta(minutes=30))
+            except (MedicoNoDisponibleException, TurnoOcupadoException):
+                continue
+            if 8 <= fecha.hour < 20:
+                libres.append((medico, fecha))
+        fecha += timedelta(minutes=30)
+    return libres[:cantidad]
+
+
+def main():
+    medicos = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    inicio = (datetime.now() + timedelta(days=7)).replace(hour=8, minute=0, second=0, microsecond=0)
+    inicio -= timedelta(days=inicio.weekday())
+    clinica = crear_clinica(medicos, inicio, 20)
+    lista_medicos = list(clinica.obtener_medicos())
+    desde, hasta = inicio, inicio + timedelta(days=30)
+
+    for cantidad in (1, 10, 100):
+        t0 = time.perf_counter()
+        for _ in range(MUESTRA):
+            libres = clinica.buscar_turnos_libres("Pediatria", desde, hasta, 30, cantidad)
+        heap = (time.perf_counter() - t0) / MUESTRA
+
+        t0 = time.perf_counter()
+        esperado = por_prueba_y_error(clinica, lista_medicos, "Pediatria", desde, hasta, cantidad)
+        prueba = time.perf_counter() - t0
+
+        assert [fecha for _, fecha in libres] == [fecha for _, fecha in esperado]
+        print(f"primeros {cantidad:>3}: heap {heap * 1e3:>8.2f} ms   prueba y error {prueba * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+SESIONES = 10
+MEDICOS = 20
+
+
+def crear_clinica(journal, series):
+    clinica = Clinica(journal)
+    for i in range(series):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990"))
+    for i in range(MEDICOS):
+        medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+        medico.agregar_especialidad(Especialidad("Kinesiologia", DIAS))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def medir(series, con_journal, en_lote):
+    # Cada serie son SESIONES turnos semanales de un paciente, en horarios distintos por paciente
+    with tempfile.TemporaryDirectory() as directorio:
+        journal = Journal(os.path.join(directorio, "clinica.journal")) if con_journal else None
+        clinica = crear_clinica(journal, series)
+        inicio = datetime.now().replace(second=0, microsecond=0) + timedelta(days=1)
+
+        t0 = time.perf_counter()
+        for i in range(series):
+            dni = str(10_000_000 + i)
+            matricula = f"MAT{i % MEDICOS:05d}"
+            primero = inicio + timedelta(minutes=30 * (i // MEDICOS))
+            if en_lote:
+                clinica.agendar_turnos_recurrentes(dni, matricula, "Kinesiologia", primero, SESIONES, duracion=30)
+            else:
+                for k in range(SESIONES):
+                    clinica.agendar_turno(dni, matricula, "Kinesiologia", primero + timedelta(weeks=k), 30)
+        transcurrido = time.perf_counter() - t0
+
+        assert len(clinica.obtener_turnos()) == series * SESIONES
+        clinica.cerrar()
+    return transcurrido / series
+
+
+def main():
+    series = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    for con_journal in (False, True):
+        cantidad = series if not con_journal else series // 10
+        print("con journal" if con_journal else "sin journal")
+        for en_lote in (False, True):
+            por_serie = medir(cantidad, con_journal, en_lote)
+            nombre = "agendar_turnos_recurrentes" if en_lote else f"{SESIONES} x agendar_turno"
+            print(f"  {nombre:<28} {por_serie * 1e6:>10.1f} us/serie")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+REPETICIONES = 200_000
+
+
+def crear_clinica():
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+
+    medico = Medico("Medico Prueba", "MAT00001")
+    medico.agregar_especialidad(Especialidad("Pediatria", ["lunes"]))
+    medico.agregar_especialidad(Especialidad("Cardiologia", ["martes"]))
+    medico.agregar_especialidad(Especialidad("Dermatologia", ["miercoles"]))
+    medico.agregar_especialidad(Especialidad("Neurologia", ["jueves"]))
+    medico.agregar_especialidad(Especialidad("Clinica", ["viernes", "sabado", "domingo"]))
+    clinica.agregar_medico(medico)
+
+    return clinica, medico
+
+
+def medir(nombre, funcion):
+    t0 = time.perf_counter()
+    for _ in range(REPETICIONES):
+        funcion()
+    transcurrido = time.perf_counter() - t0
+    print(f"{nombre:<35} {transcurrido / REPETICIONES * 1e9:>8.0f} ns/llamada")
+
+
+def main():
+    clinica, medico = crear_clinica()
+    fecha_hora = datetime.now() + timedelta(days=7)
+    while fecha_hora.weekday() != 6:
+        fecha_hora += timedelta(days=1)
+    indice = fecha_hora.weekday()
+
+    medir("obtener_especialidad_para_dia", lambda: medico.obtener_especialidad_para_dia("domingo"))
+    medir("obtener_especialidad_para_indice", lambda: medico.obtener_especialidad_para_indice(indice))
+    medir("validar_especialidad_en_dia", lambda: clinica.validar_especialidad_en_dia(medico, "Clinica", indice))
+
+    t0 = time.perf_counter()
+    for i in range(REPETICIONES // 10):
+        clinica.agendar_turno("10000000", "MAT00001", "Clinica", fecha_hora + timedelta(weeks=i))
+    transcurrido = time.perf_counter() - t0
+    print(f"{'agendar_turno':<35} {transcurrido / (REPETICIONES // 10) * 1e9:>8.0f} ns/llamada")
+
+
+if __name__ == "__main__":
+    main()
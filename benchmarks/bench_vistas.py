@@ -0,0 +1,55 @@
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+REPETICIONES = 20
+
+
+def crear_clinica(cantidad):
+    # Un solo paciente con todos los turnos: su historia clinica tambien tiene cantidad turnos
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Prueba", "10000000", "01/01/1990"))
+    medico = Medico("Medico Prueba", "MAT00001")
+    medico.agregar_especialidad(Especialidad("Clinica", ["lunes", "martes", "miercoles", "jueves",
+                                                         "viernes", "sabado", "domingo"]))
+    clinica.agregar_medico(medico)
+
+    inicio = datetime.now() + timedelta(days=1)
+    for i in range(cantidad):
+        clinica.agendar_turno("10000000", "MAT00001", "Clinica", inicio + timedelta(minutes=i))
+    return clinica
+
+
+def medir(nombre, funcion):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for _ in range(REPETICIONES):
+        resultado = funcion()
+        len(resultado)
+        resultado[0]
+    transcurrido = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<40} {transcurrido / REPETICIONES * 1e6:>10.1f} us/llamada {pico:>12,} bytes pico")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    clinica = crear_clinica(cantidad)
+    historia = clinica.obtener_historia_clinica("10000000")
+    print(f"turnos: {cantidad}")
+
+    # "copia" reproduce lo que hacian los getters antes de devolver vistas
+    medir("Clinica.obtener_turnos (copia)", lambda: list(clinica.obtener_turnos()))
+    medir("Clinica.obtener_turnos (vista)", clinica.obtener_turnos)
+    medir("HistoriaClinica.obtener_turnos (copia)", lambda: list(historia.obtener_turnos()))
+    medir("HistoriaClinica.obtener_turnos (vista)", historia.obtener_turnos)
+
+
+if __name__ == "__main__":
+    main()
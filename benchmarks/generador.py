@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timedelta
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.exceptions import TurnoOcupadoException
+
+# Datos sinteticos reproducibles: con la misma semilla se generan siempre los mismos
+# pacientes, medicos y solicitudes de turnos
+NOMBRES = ["Ana", "José", "María", "Lucía", "Carlos", "Martín", "Sofía", "Julián", "Inés", "Tomás",
+           "Valentina", "Mateo", "Camila", "Santiago", "Florencia", "Nicolás"]
+APELLIDOS = ["López", "Martínez", "García", "Pérez", "Fernández", "Gómez", "Díaz", "Álvarez",
+             "Romero", "Sosa", "Benítez", "Acuña", "Ibáñez", "Muñoz", "Suárez", "Giménez"]
+ESPECIALIDADES = ["Clinica Medica", "Pediatria", "Cardiologia", "Dermatologia", "Traumatologia",
+                  "Ginecologia", "Oftalmologia", "Neurologia", "Psiquiatria", "Endocrinologia"]
+# Las especialidades mas pedidas tienen mas medicos
+PESOS_ESPECIALIDADES = [30, 20, 10, 8, 8, 8, 6, 4, 3, 3]
+DIAS_HABILES = ["lunes", "martes", "miercoles", "jueves", "viernes"]
+# Dias desde el lunes
+DESPLAZAMIENTOS = {dia: i for i, dia in enumerate(DIAS_HABILES + ["sabado"])}
+MEDICAMENTOS = ["Paracetamol 500mg", "Ibuprofeno 400mg", "Amoxicilina 500mg", "Omeprazol 20mg",
+                "Loratadina 10mg", "Enalapril 10mg", "Metformina 850mg", "Atorvastatina 20mg"]
+
+# Un lunes lejano: las fechas no dependen del dia en que se corre
+INICIO = datetime(2030, 1, 7)
+SEMANAS = 12
+# Turnos de 30 minutos entre las 8:00 y las 20:00
+HORARIOS = [timedelta(hours=8, minutes=30 * i) for i in range(24)]
+DURACION = 30
+
+
+class GeneradorClinica:
+    def __init__(self, semilla):
+        self.__aleatorio = random.Random(semilla)
+
+    def filas_pacientes(self, cantidad):
+        # Diccionarios como los que recibe Clinica.importar_pacientes
+        aleatorio = self.__aleatorio
+        filas = []
+        for i in range(cantidad):
+            nombre = (f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)} "
+                      f"{aleatorio.choice(APELLIDOS)}")
+            nacimiento = f"{aleatorio.randint(1, 28):02d}/{aleatorio.randint(1, 12):02d}/{aleatorio.randint(1935, 2022)}"
+            filas.append({"nombre": nombre, "dni": str(20_000_000 + i), "fecha_nacimiento": nacimiento})
+        return filas
+
+    def medicos(self, cantidad):
+        # Cada medico tiene una o dos especialidades; cada una se atiende dos o tres dias
+        # habiles distintos y a veces una de ellas tambien el sabado
+        aleatorio = self.__aleatorio
+        medicos = []
+        for i in range(cantidad):
+            medico = Medico(f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}", f"MAT{i:06d}")
+            dias_libres = DIAS_HABILES.copy()
+            aleatorio.shuffle(dias_libres)
+            sabado = aleatorio.random() < 0.2
+            cantidad_tipos = aleatorio.choice((1, 1, 2))
+            tipos = set()
+            while len(tipos) < cantidad_tipos:
+                tipos.add(aleatorio.choices(ESPECIALIDADES, PESOS_ESPECIALIDADES)[0])
+
+            for tipo in sorted(tipos):
+                dias = [dias_libres.pop() for _ in range(min(aleatorio.randint(2, 3), len(dias_libres)))]
+                if sabado:
+                    dias.append("sabado")
+                    sabado = False
+                if dias:
+                    medico.agregar_especialidad(Especialidad(tipo, dias))
+            medicos.append(medico)
+        return medicos
+
+    def solicitudes_turnos(self, filas_pacientes, medicos, cantidad):
+        # (dni, matricula, especialidad, fecha_hora, duracion) en un dia y horario que el
+        # medico atiende; algunas caen en un horario ya ocupado, como en la realidad
+        aleatorio = self.__aleatorio
+        agendas = []
+        for medico in medicos:
+            for especialidad in medico.obtener_especialidades():
+                for dia in especialidad.obtener_dias():
+                    agendas.append((medico.obtener_matricula(), especialidad.obtener_especialidad(),
+                                    DESPLAZAMIENTOS[dia]))
+
+        solicitudes = []
+        for _ in range(cantidad):
+            matricula, especialidad, desplazamiento = aleatorio.choice(agendas)
+            fecha = INICIO + timedelta(days=desplazamiento + 7 * aleatorio.randrange(SEMANAS))
+            solicitudes.append((aleatorio.choice(filas_pacientes)["dni"], matricula, especialidad,
+                                fecha + aleatorio.choice(HORARIOS), DURACION))
+        return solicitudes
+
+    def medicamentos(self):
+        return self.__aleatorio.sample(MEDICAMENTOS, self.__aleatorio.randint(1, 3))
+
+    def elegir(self, secuencia):
+        return self.__aleatorio.choice(secuencia)
+
+    def probabilidad(self, valor):
+        return self.__aleatorio.random() < valor
+
+
+def cargar_clinica(clinica, generador, pacientes, medicos, turnos):
+    # Carga pacientes, medicos y turnos generados; las solicitudes que caen en un
+    # horario ocupado se descartan. Devuelve (filas de pacientes, medicos, turnos agendados)
+    filas = generador.filas_pacientes(pacientes)
+    clinica.importar_pacientes(filas)
+    lista_medicos = generador.medicos(medicos)
+    for medico in lista_medicos:
+        clinica.agregar_medico(medico)
+
+    agendados = 0
+    for solicitud in generador.solicitudes_turnos(filas, lista_medicos, turnos):
+        try:
+            clinica.agendar_turno(*solicitud)
+            agendados += 1
+        except TurnoOcupadoException:
+            pass
+    return filas, lista_medicos, agendados
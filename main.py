@@ -1,14 +1,172 @@
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
 from src.cli import CLI
+from src.exportacion import FORMATOS, exportar_turnos, exportar_recetas
+from src.importacion import leer_filas
+from src.metricas import Metricas
+from src.perfilado import Perfilador
+from src.models.clinica import Clinica
+from src.persistencia.journal import Journal
+from src.persistencia.snapshot import Snapshot
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.servidor import ServidorClinica
+
+MAXIMO_RECHAZOS_MOSTRADOS = 20
+
+def parsear_argumentos():
+    parser = argparse.ArgumentParser(description="Sistema de gestion de clinica")
+    parser.add_argument("--journal", default="clinica.journal",
+                        help="Archivo donde se registran los cambios (por defecto: clinica.journal)")
+    parser.add_argument("--snapshot", default="clinica.snapshot",
+                        help="Archivo del ultimo snapshot binario (por defecto: clinica.snapshot)")
+    parser.add_argument("--snapshot-cada", type=int, default=1000,
+                        help="Cantidad de cambios entre snapshots automaticos (por defecto: 1000)")
+    parser.add_argument("--sqlite", metavar="RUTA",
+                        help="Guardar los datos en una base SQLite en lugar de journal y snapshots")
+    parser.add_argument("--sin-persistencia", action="store_true",
+                        help="No leer ni guardar datos en disco")
+    parser.add_argument("--metricas", action="store_true",
+                        help="Medir la duracion y los errores de cada operacion (opcion 15 del menu)")
+    parser.add_argument("--perfilar", metavar="DIRECTORIO",
+                        help="Perfilar con cProfile cada opcion del menu o el comando y guardar un .prof "
+                             "por llamada en DIRECTORIO; al salir se muestra un resumen")
+    parser.add_argument("--perfilar-memoria", action="store_true",
+                        help="Con --perfilar, informar tambien la memoria asignada (tracemalloc)")
+
+    comandos = parser.add_subparsers(dest="comando")
+    importar = comandos.add_parser("importar", aliases=["import"],
+                                   help="Importar pacientes o medicos desde un archivo CSV o JSONL")
+    importar.add_argument("tipo", choices=["pacientes", "medicos"])
+    importar.add_argument("archivo")
+    importar.add_argument("--lote", type=int, default=1000,
+                          help="Cantidad de filas por lote (por defecto: 1000)")
+
+    exportar = comandos.add_parser("exportar", aliases=["export"],
+                                   help="Exportar turnos o recetas a CSV o JSONL")
+    exportar.add_argument("tipo", choices=["turnos", "recetas"])
+    exportar.add_argument("--formato", choices=FORMATOS, default="csv")
+    exportar.add_argument("--salida", metavar="RUTA",
+                          help="Archivo de salida (por defecto: salida estandar)")
+    exportar.add_argument("--desde", type=datetime.fromisoformat,
+                          help="Fecha inicial inclusive (AAAA-MM-DD o AAAA-MM-DDTHH:MM)")
+    exportar.add_argument("--hasta", type=datetime.fromisoformat,
+                          help="Fecha final exclusive (AAAA-MM-DD o AAAA-MM-DDTHH:MM)")
+    exportar.add_argument("--matricula")
+    exportar.add_argument("--dni")
+
+    archivar = comandos.add_parser("archivar", aliases=["archive"],
+                                   help="Mover a un archivo los turnos anteriores a una fecha y sacarlos de la clinica")
+    archivar.add_argument("--hasta", type=datetime.fromisoformat, required=True,
+                          help="Se archivan los turnos anteriores a esta fecha (AAAA-MM-DD o AAAA-MM-DDTHH:MM)")
+    archivar.add_argument("--salida", metavar="RUTA", required=True,
+                          help="Archivo donde se agregan los turnos archivados")
+    archivar.add_argument("--formato", choices=FORMATOS, default="jsonl")
+
+    servir = comandos.add_parser("servir", aliases=["serve"],
+                                 help="Atender solicitudes JSON por TCP (una por linea)")
+    servir.add_argument("--host", default="127.0.0.1")
+    servir.add_argument("--puerto", type=int, default=8765)
+    servir.add_argument("--hilos", type=int, default=32,
+                        help="Hilos para las operaciones sobre la clinica (por defecto: 32)")
+    return parser.parse_args()
+
+def crear_clinica(args):
+    # El servidor opera sobre la clinica desde varios hilos a la vez
+    concurrente = args.comando in ("servir", "serve")
+    metricas = Metricas() if args.metricas else None
+    if args.sin_persistencia:
+        return Clinica(concurrente=concurrente, metricas=metricas)
+    if args.sqlite:
+        return Clinica(repositorio=RepositorioSQLite(args.sqlite), concurrente=concurrente, metricas=metricas)
+    return Clinica(Journal(args.journal), Snapshot(args.snapshot), args.snapshot_cada, concurrente=concurrente,
+                   metricas=metricas)
+
+def crear_perfilador(args):
+    if args.perfilar is None:
+        return None
+    # En el menu se mide tiempo de CPU: la espera del teclado no cuenta
+    interactivo = args.comando is None
+    return Perfilador(args.perfilar, memoria=args.perfilar_memoria,
+                      reloj=time.process_time if interactivo else time.perf_counter)
+
+def importar(clinica, args):
+    filas = leer_filas(args.archivo)
+
+    if args.tipo == "pacientes":
+        resultado = clinica.importar_pacientes(filas, args.lote)
+    else:
+        resultado = clinica.importar_medicos(filas, args.lote)
+
+    print(resultado)
+    rechazados = resultado.obtener_rechazados()
+    for numero, motivo in rechazados[:MAXIMO_RECHAZOS_MOSTRADOS]:
+        print(f"Fila {numero}: {motivo}")
+    if len(rechazados) > MAXIMO_RECHAZOS_MOSTRADOS:
+        print(f"... y {len(rechazados) - MAXIMO_RECHAZOS_MOSTRADOS} filas rechazadas mas")
+
+def exportar(clinica, args):
+    exportador = exportar_turnos if args.tipo == "turnos" else exportar_recetas
+    filtros = dict(desde=args.desde, hasta=args.hasta, matricula=args.matricula, dni=args.dni)
+
+    if args.salida is None:
+        exportador(clinica, sys.stdout, args.formato, **filtros)
+        return
+
+    with open(args.salida, "w", newline="", encoding="utf-8") as archivo:
+        cantidad = exportador(clinica, archivo, args.formato, **filtros)
+    print(f"Exportados: {cantidad}")
+
+def archivar(clinica, args):
+    # Se agrega al final: archivar varias veces sobre el mismo archivo no pisa lo anterior
+    with open(args.salida, "a", newline="", encoding="utf-8") as archivo:
+        cantidad = clinica.archivar_turnos(args.hasta, archivo, args.formato)
+    print(f"Archivados: {cantidad}")
+
+async def servir(clinica, args):
+    servidor = ServidorClinica(clinica, args.hilos)
+    host, puerto = await servidor.iniciar(args.host, args.puerto)
+    print(f"Escuchando en {host}:{puerto}")
+    try:
+        await servidor.servir()
+    finally:
+        await servidor.cerrar()
 
 def main():
+    args = parsear_argumentos()
+    clinica = None
+    perfilador = None
+
     try:
-        cli = CLI()
-        cli.ejecutar()
+        perfilador = crear_perfilador(args)
+        clinica = crear_clinica(args)
+
+        if args.comando in ("importar", "import"):
+            comando = importar if perfilador is None else perfilador.perfilar(f"importar_{args.tipo}", importar)
+            comando(clinica, args)
+        elif args.comando in ("exportar", "export"):
+            comando = exportar if perfilador is None else perfilador.perfilar(f"exportar_{args.tipo}", exportar)
+            comando(clinica, args)
+        elif args.comando in ("archivar", "archive"):
+            comando = archivar if perfilador is None else perfilador.perfilar("archivar_turnos", archivar)
+            comando(clinica, args)
+        elif args.comando in ("servir", "serve"):
+            asyncio.run(servir(clinica, args))
+        else:
+            cli = CLI(clinica, perfilador)
+            cli.ejecutar()
 
     except KeyboardInterrupt:
         print("\n Sistema terminado por usuario")
     except Exception as e:
         print(f"\nError en el sistema: {e}")
+    finally:
+        if clinica is not None:
+            clinica.cerrar()
+        if perfilador is not None:
+            print(perfilador.resumen(), file=sys.stderr)
     
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,4 +1,5 @@
-from datetime import datetime 
+import sys
+from datetime import datetime, timedelta
 from .models.clinica import Clinica
 from .models.paciente import Paciente
 from .models.medico import Medico
@@ -8,12 +9,27 @@ from .exceptions import (
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
-    RecetaInvalidaException
+    RecetaInvalidaException,
+    TurnoNoEncontradoException
 )
 
+# Elementos por pagina en los listados completos
+TAMANO_PAGINA = 20
+
+# Opciones del menu que se perfilan con --perfilar
+ACCIONES_MENU = ("agregar_paciente", "agregar_medico", "agendar_turno", "agregar_especialidad_a_medico",
+                 "emitir_receta", "ver_historia_clinica", "ver_todos_los_turnos", "ver_todos_los_pacientes",
+                 "ver_todos_los_medicos", "cancelar_turno", "ver_horarios_libres", "buscar_turnos_libres",
+                 "buscar_medicos", "buscar_pacientes", "ver_metricas", "ver_agenda_del_dia")
+
 class CLI:
-    def __init__(self):
-        self.clinica = Clinica()
+    def __init__(self, clinica=None, perfilador=None):
+        self.clinica = clinica if clinica is not None else Clinica()
+
+        # Con perfilador cada opcion del menu corre bajo cProfile
+        if perfilador is not None:
+            for accion in ACCIONES_MENU:
+                setattr(self, accion, perfilador.perfilar(accion, getattr(self, accion)))
 
     def menu(self):
         print("\nSistema de gestion de clinica")
@@ -27,6 +43,13 @@ class CLI:
         print("7 - Ver todos los turnos")
         print("8 - Ver todos los pacientes")
         print("9 - Ver todos los medicos")
+        print("10 - Cancelar turno")
+        print("11 - Ver horarios libres de un medico")
+        print("12 - Buscar primeros turnos libres de una especialidad")
+        print("13 - Buscar medicos por especialidad y dia")
+        print("14 - Buscar pacientes por nombre")
+        print("15 - Ver metricas")
+        print("16 - Ver agenda del dia de un medico")
         print("0 - Salir")
 
     def ejecutar(self):
@@ -57,6 +80,20 @@ class CLI:
                     self.ver_todos_los_pacientes()
                 elif opcion == "9":
                     self.ver_todos_los_medicos()
+                elif opcion == "10":
+                    self.cancelar_turno()
+                elif opcion == "11":
+                    self.ver_horarios_libres()
+                elif opcion == "12":
+                    self.buscar_turnos_libres()
+                elif opcion == "13":
+                    self.buscar_medicos()
+                elif opcion == "14":
+                    self.buscar_pacientes()
+                elif opcion == "15":
+                    self.ver_metricas()
+                elif opcion == "16":
+                    self.ver_agenda_del_dia()
                 else:
                     print("Opcion invalida. Seleccione de vuelta")
             except KeyboardInterrupt:
@@ -150,10 +187,12 @@ class CLI:
 
             fecha_str = input("Fecha del turno (dd/mm/aaaa): ").strip()
             hora_str = input("Hora del turno (HH:MM): ").strip()
+            duracion_str = input("Duracion en minutos (Enter para omitir): ").strip()
 
             fecha_hora = self.parse_fecha_hora(fecha_str, hora_str)
+            duracion = self.parse_duracion(duracion_str)
 
-            self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+            self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora, duracion)
 
             print("Turno agendado")
             print(f"Paciente DNI: {dni}")
@@ -170,6 +209,177 @@ class CLI:
 
         input("\nEnter para continuar")
 
+    def cancelar_turno(self):
+        print("\nCancelar turno")
+        print("-" * 50)
+
+        try:
+            matricula = input("Matricula medico: ").strip()
+
+            fecha_str = input("Fecha del turno (dd/mm/aaaa): ").strip()
+            hora_str = input("Hora del turno (HH:MM): ").strip()
+
+            fecha_hora = self.parse_fecha_hora(fecha_str, hora_str)
+
+            self.clinica.cancelar_turno(matricula, fecha_hora)
+
+            print("Turno cancelado")
+            print(f"Medico: {matricula}")
+            print(f"Fecha: {fecha_hora.strftime('%d/%m/%Y %H:%M')}")
+
+        except (MedicoNoEncontradoException, TurnoNoEncontradoException) as e:
+            print(f"{e}")
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def ver_horarios_libres(self):
+        print("\nHorarios libres de un medico")
+        print("-" * 50)
+
+        try:
+            matricula = input("Matricula medico: ").strip()
+            fecha_str = input("Fecha (dd/mm/aaaa): ").strip()
+            desde_str = input("Desde (HH:MM): ").strip()
+            hasta_str = input("Hasta (HH:MM): ").strip()
+
+            desde = self.parse_fecha_hora(fecha_str, desde_str)
+            hasta = self.parse_fecha_hora(fecha_str, hasta_str)
+
+            huecos = self.clinica.obtener_huecos_libres(matricula, desde, hasta)
+
+            if not huecos:
+                print("No hay horarios libres en ese rango")
+            for inicio, fin in huecos:
+                print(f"{inicio.strftime('%H:%M')} - {fin.strftime('%H:%M')}")
+
+        except MedicoNoEncontradoException as e:
+            print(f"{e}")
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def buscar_turnos_libres(self):
+        print("\nBuscar turnos libres por especialidad")
+        print("-" * 50)
+
+        try:
+            especialidad = input("Especialidad: ").strip()
+            desde_str = input("Desde (dd/mm/aaaa): ").strip()
+            hasta_str = input("Hasta inclusive (dd/mm/aaaa): ").strip()
+            duracion = self.parse_duracion(input("Duracion del turno en minutos: ").strip())
+            cantidad_str = input("Cantidad de turnos (Enter para 10): ").strip()
+
+            desde = self.parse_fecha_hora(desde_str, "00:00")
+            hasta = self.parse_fecha_hora(hasta_str, "00:00") + timedelta(days=1)
+            # Solo el Enter usa la cantidad por defecto: "0" es un error, no 10
+            cantidad = self.parse_cantidad(cantidad_str) if cantidad_str else 10
+
+            libres = self.clinica.buscar_turnos_libres(especialidad, desde, hasta, duracion, cantidad)
+
+            if not libres:
+                print("No hay turnos libres para esa especialidad en ese rango")
+            for medico, fecha_hora in libres:
+                print(f"{fecha_hora.strftime('%d/%m/%Y %H:%M')} - {medico.obtener_nombre()} ({medico.obtener_matricula()})")
+
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def buscar_medicos(self):
+        print("\nBuscar medicos por especialidad y dia")
+        print("-" * 50)
+
+        try:
+            especialidad = input("Especialidad: ").strip()
+            dia = input("Dia de la semana: ").strip()
+
+            medicos = self.clinica.buscar_medicos(especialidad, dia)
+
+            if not medicos:
+                print(f"Ningun medico atiende {especialidad} los {dia}")
+            for medico in medicos:
+                print(f"{medico}")
+
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def buscar_pacientes(self):
+        print("\nBuscar pacientes por nombre")
+        print("-" * 50)
+
+        try:
+            prefijo = input("Comienzo del nombre o apellido: ").strip()
+            fecha_nacimiento = input("Fecha de nacimiento (dd/mm/aaaa, Enter para omitir): ").strip() or None
+
+            pacientes = self.clinica.buscar_pacientes(prefijo, 20, fecha_nacimiento)
+
+            if not pacientes:
+                print("No se encontraron pacientes")
+            for paciente in pacientes:
+                print(f"{paciente}")
+
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def ver_agenda_del_dia(self):
+        print("\nAgenda del dia de un medico")
+        print("-" * 50)
+
+        try:
+            matricula = input("Matricula medico: ").strip()
+            fecha_str = input("Fecha (dd/mm/aaaa, Enter para hoy): ").strip()
+
+            dia = self.parse_fecha_hora(fecha_str, "00:00") if fecha_str else None
+            turnos = self.clinica.obtener_agenda_del_dia(matricula, dia)
+
+            if not turnos:
+                print("El medico no tiene turnos ese dia")
+            for turno in turnos:
+                paciente = turno.obtener_paciente()
+                duracion = f" ({turno.obtener_duracion()} min)" if turno.obtener_duracion() else ""
+                print(f"{turno.obtener_fecha_hora().strftime('%H:%M')}{duracion} - {paciente.obtener_nombre()} "
+                      f"(DNI {paciente.obtener_dni()}) - {turno.obtener_especialidad()}")
+
+        except MedicoNoEncontradoException as e:
+            print(f"{e}")
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
+    def ver_metricas(self):
+        print("\nMetricas")
+        print("-" * 50)
+
+        try:
+            print(self.clinica.obtener_metricas().exportar(), end="")
+        except ValueError as e:
+            print(f"{e} (iniciar con --metricas)")
+        except Exception as e:
+            print(f"Error inesperado: {e}")
+
+        input("\nEnter para continuar")
+
     def agregar_especialidad_a_medico(self):
         print("\nAgregar especialidad a medico")
         print("-" * 50)
@@ -177,14 +387,14 @@ class CLI:
         try:
             matricula = input("Matricula del medico: ").strip()
 
-            medico = self.clinica.obtener_medico_por_matricula(matricula)
+            self.clinica.validar_existencia_medico(matricula)
 
             especialidad_nombre = input("Nombre especialidad: ").strip()
             dias = self.solicitar_dias_atencion()
 
             if dias:
                 especialidad = Especialidad(especialidad_nombre, dias)
-                medico.agregar_especialidad(especialidad)
+                self.clinica.agregar_especialidad_a_medico(matricula, especialidad)
 
                 print("Especialidad agregada")
                 print(f"{especialidad}")
@@ -248,7 +458,7 @@ class CLI:
             historia = self.clinica.obtener_historia_clinica(dni)
 
             print("\n" + "-" * 50)
-            print(historia)
+            historia.render(sys.stdout)
             print("-" * 50)
 
         except PacienteNoEncontradoException as e:
@@ -263,64 +473,76 @@ class CLI:
         print("-" * 50)
 
         try:
-            turnos = self.clinica.obtener_turnos()
+            matricula = input("Matricula medico (Enter para todos): ").strip() or None
+            desde_str = input("Desde (dd/mm/aaaa, Enter sin limite): ").strip()
+            hasta_str = input("Hasta inclusive (dd/mm/aaaa, Enter sin limite): ").strip()
 
-            if not turnos:
-                print("No hay turnos agendados")
-
-            else:
-                print(f"Total de turnos: {len(turnos)}")
-                print("-" * 80)
+            desde = self.parse_fecha_hora(desde_str, "00:00") if desde_str else None
+            hasta = self.parse_fecha_hora(hasta_str, "00:00") + timedelta(days=1) if hasta_str else None
 
-            for i, turno in enumerate(turnos, 1):
-                print(f"{i}. {turno}")
+            paginador = self.clinica.paginar_turnos(TAMANO_PAGINA, desde, hasta, matricula)
+            self.mostrar_paginas(paginador, "No hay turnos agendados")
 
+        except MedicoNoEncontradoException as e:
+            print(f"{e}")
+        except ValueError as e:
+            print(f"Error en los datos: {e}")
         except Exception as e:
             print(f"Error inesperado: {e}")
 
-        input("\nEnter para continuar")
-
     def ver_todos_los_pacientes(self):
         print("\nTodos los pacientes")
         print("-" * 50)
 
         try:
-            pacientes = self.clinica.obtener_pacientes()
-            
-            if not pacientes:
-                print("No hay pacientes registrados")
-            else:
-                print(f"Total de pacientes: {len(pacientes)}")
-                print("-" * 50)
-
-                for i, paciente in enumerate(pacientes, 1):
-                    print(f"{i}. {paciente}")
-
+            self.mostrar_paginas(self.clinica.paginar_pacientes(TAMANO_PAGINA), "No hay pacientes registrados")
         except Exception as e:
             print(f"Error inesperado: {e}")
-
-        input("\nEnter para continuar")
     
     def ver_todos_los_medicos(self):
         print("\nTodos los medicos")
         print("-" * 50)
 
         try:
-            medicos = self.clinica.obtener_medicos()
-
-            if not medicos:
-                print("No hay medicos registrados")
-            else:
-                print(f"Total de medicos: {len(medicos)}")
-                print(f"-" * 50)
-
-                for i, medico in enumerate(medicos, 1):
-                    print(f"{i}. {medico}")
-     
+            self.mostrar_paginas(self.clinica.paginar_medicos(TAMANO_PAGINA), "No hay medicos registrados")
         except Exception as e:
             print(f"Error inesperado: {e}")
 
-        input("\nEnter para continuar")
+    def mostrar_paginas(self, paginador, mensaje_vacio):
+        # Solo se arma el texto de la pagina que se muestra
+        pagina = paginador.siguiente()
+        if not pagina:
+            print(mensaje_vacio)
+            input("\nEnter para continuar")
+            return
+
+        mostrar = True
+        while True:
+            if mostrar:
+                print("-" * 50)
+                for i, elemento in enumerate(pagina, paginador.obtener_posicion_inicial()):
+                    print(f"{i}. {elemento}")
+                print("-" * 50)
+
+                opciones = []
+                if paginador.hay_anterior():
+                    opciones.append("a - anterior")
+                if paginador.hay_siguiente():
+                    opciones.append("s - siguiente")
+                opciones.append("Enter - volver")
+                print(f"Pagina {paginador.obtener_numero_pagina()} | " + ", ".join(opciones))
+
+            opcion = input("Selecciona una opcion: ").strip().lower()
+            mostrar = True
+            if not opcion:
+                return
+            if opcion == "s" and paginador.hay_siguiente():
+                pagina = paginador.siguiente()
+            elif opcion == "a" and paginador.hay_anterior():
+                pagina = paginador.anterior()
+            else:
+                print("Opcion invalida")
+                mostrar = False
 
     def parse_fecha_hora(self, fecha_str, hora_str):
         try:
@@ -329,4 +551,16 @@ class CLI:
         except ValueError:
             raise ValueError("Formato de fecha u hora invalido. (dd/mm/aaaa)")
 
+    def parse_duracion(self, duracion_str):
+        if not duracion_str:
+            return None
+        if not duracion_str.isdigit():
+            raise ValueError("La duracion debe ser un numero entero de minutos")
+        return int(duracion_str)
+
+    def parse_cantidad(self, cantidad_str):
+        if not cantidad_str.isdigit() or int(cantidad_str) <= 0:
+            raise ValueError("La cantidad debe ser un numero entero positivo")
+        return int(cantidad_str)
+
     
\ No newline at end of file
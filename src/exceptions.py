@@ -12,4 +12,7 @@ class TurnoOcupadoException(Exception):
     pass
 
 class RecetaInvalidaException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class TurnoNoEncontradoException(Exception):
+    pass
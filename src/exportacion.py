@@ -0,0 +1,70 @@
+import csv
+import json
+
+FORMATOS = ("csv", "jsonl")
+
+COLUMNAS_TURNOS = ["fecha_hora", "dni", "paciente", "matricula", "medico", "especialidad", "duracion"]
+COLUMNAS_RECETAS = ["fecha", "dni", "paciente", "matricula", "medico", "medicamentos"]
+
+_codificador = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def filas_turnos(turnos):
+    # Generador: convierte cada turno en una fila a medida que se recorre
+    for turno in turnos:
+        paciente = turno.obtener_paciente()
+        medico = turno.obtener_medico()
+        yield [turno.obtener_fecha_hora().isoformat(), paciente.obtener_dni(), paciente.obtener_nombre(),
+               medico.obtener_matricula(), medico.obtener_nombre(), turno.obtener_especialidad(),
+               turno.obtener_duracion()]
+
+def filas_recetas(recetas):
+    for receta in recetas:
+        paciente = receta.obtener_paciente()
+        medico = receta.obtener_medico()
+        yield [receta.obtener_fecha().isoformat(), paciente.obtener_dni(), paciente.obtener_nombre(),
+               medico.obtener_matricula(), medico.obtener_nombre(), receta.obtener_medicamentos()]
+
+def escribir_filas(archivo, columnas, filas, formato, encabezado=True):
+    # Escribe fila por fila en archivo (un archivo abierto o sys.stdout) y
+    # devuelve la cantidad escrita; nunca arma la salida completa en memoria.
+    # Sin encabezado el CSV continua uno ya escrito (al agregar al final)
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportacion no soportado: {formato} (use csv o jsonl)")
+
+    cantidad = 0
+    if formato == "csv":
+        escritor = csv.writer(archivo)
+        if encabezado:
+            escritor.writerow(columnas)
+        for fila in filas:
+            escritor.writerow([_valor_csv(valor) for valor in fila])
+            cantidad += 1
+    else:
+        for fila in filas:
+            archivo.write(_codificador.encode(dict(zip(columnas, fila))))
+            archivo.write("\n")
+            cantidad += 1
+    return cantidad
+
+def archivo_vacio(archivo):
+    # Un archivo abierto en modo "a" queda posicionado al final; sys.stdout no informa posicion
+    try:
+        return archivo.tell() == 0
+    except (OSError, ValueError):
+        return True
+
+def exportar_turnos(clinica, archivo, formato="csv", desde=None, hasta=None, matricula=None, dni=None):
+    turnos = clinica.iterar_turnos(desde, hasta, matricula, dni)
+    return escribir_filas(archivo, COLUMNAS_TURNOS, filas_turnos(turnos), formato)
+
+def exportar_recetas(clinica, archivo, formato="csv", desde=None, hasta=None, matricula=None, dni=None):
+    recetas = clinica.iterar_recetas(desde, hasta, matricula, dni)
+    return escribir_filas(archivo, COLUMNAS_RECETAS, filas_recetas(recetas), formato)
+
+def _valor_csv(valor):
+    if valor is None:
+        return ""
+    if isinstance(valor, list):
+        return "; ".join(valor)
+    return valor
@@ -0,0 +1,47 @@
+import csv
+import json
+import os
+
+class ResultadoImportacion:
+    def __init__(self):
+        self.__importados = 0
+        self.__rechazados = []
+
+    def sumar_importados(self, cantidad):
+        self.__importados += cantidad
+
+    def rechazar(self, numero_fila, motivo):
+        self.__rechazados.append((numero_fila, motivo))
+
+    def obtener_importados(self):
+        return self.__importados
+
+    def obtener_rechazados(self):
+        # Los duplicados se detectan al cerrar cada lote, por eso se ordena por fila
+        return sorted(self.__rechazados)
+
+    def __str__(self):
+        return f"Importados: {self.__importados} - Rechazados: {len(self.__rechazados)}"
+
+
+def leer_filas(ruta):
+    # Generador: nunca tiene mas de una fila del archivo en memoria
+    extension = os.path.splitext(ruta)[1].lower()
+
+    if extension == ".csv":
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            yield from csv.DictReader(archivo)
+
+    elif extension in (".jsonl", ".json"):
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                if not linea.strip():
+                    continue
+                try:
+                    yield json.loads(linea)
+                except ValueError:
+                    # Se devuelve igual para que la fila se informe como rechazada
+                    yield None
+
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {extension} (use .csv o .jsonl)")
@@ -0,0 +1,126 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+
+# Limites superiores (en segundos) de los buckets de latencia, como los "le" de Prometheus
+LIMITES_LATENCIA = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+                    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histograma:
+    # Cantidad de mediciones por bucket (el ultimo es +Inf), suma y total
+    __slots__ = ("__cuentas", "__suma", "__lock")
+
+    def __init__(self):
+        self.__cuentas = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.__suma = 0.0
+        self.__lock = threading.Lock()
+
+    def registrar(self, segundos):
+        indice = bisect_left(LIMITES_LATENCIA, segundos)
+        with self.__lock:
+            self.__cuentas[indice] += 1
+            self.__suma += segundos
+
+    def obtener_cuentas(self):
+        with self.__lock:
+            return list(self.__cuentas)
+
+    def obtener_suma(self):
+        return self.__suma
+
+    def obtener_total(self):
+        with self.__lock:
+            return sum(self.__cuentas)
+
+
+class Metricas:
+    # Latencia por operacion, errores por operacion y tipo de excepcion, y valores
+    # que se leen al exportar (tamaños de indices). Solo cuesta algo si se le pasa a
+    # la Clinica: sin metricas los metodos no se envuelven
+    def __init__(self, prefijo="clinica"):
+        if not prefijo or not prefijo.strip():
+            raise ValueError("El prefijo de las metricas no debe estar vacio")
+
+        self.__prefijo = prefijo.strip()
+        self.__histogramas = {}
+        self.__errores = {}
+        self.__medidas = {}
+        self.__lock = threading.Lock()
+
+    def medir(self, operacion, funcion):
+        # Devuelve la funcion envuelta: registra cuanto tarda y cuenta las excepciones
+        histograma = self.obtener_histograma(operacion)
+        reloj = time.perf_counter
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            except Exception as e:
+                self.contar_error(operacion, e)
+                raise
+            finally:
+                histograma.registrar(reloj() - inicio)
+
+        return medida
+
+    def obtener_histograma(self, operacion):
+        with self.__lock:
+            histograma = self.__histogramas.get(operacion)
+            if histograma is None:
+                histograma = self.__histogramas[operacion] = Histograma()
+            return histograma
+
+    def contar_error(self, operacion, excepcion):
+        clave = (operacion, type(excepcion).__name__)
+        with self.__lock:
+            self.__errores[clave] = self.__errores.get(clave, 0) + 1
+
+    def obtener_errores(self):
+        with self.__lock:
+            return dict(self.__errores)
+
+    def registrar_medida(self, nombre, ayuda, funcion):
+        # funcion() se llama recien al exportar, asi no agrega trabajo a las operaciones
+        if not nombre or not nombre.strip():
+            raise ValueError("El nombre de la medida no debe estar vacio")
+        with self.__lock:
+            self.__medidas[nombre.strip()] = (ayuda, funcion)
+
+    def exportar(self):
+        # Formato de texto de Prometheus
+        with self.__lock:
+            histogramas = sorted(self.__histogramas.items())
+            errores = sorted(self.__errores.items())
+            medidas = sorted(self.__medidas.items())
+
+        nombre = f"{self.__prefijo}_operacion_segundos"
+        lineas = [f"# HELP {nombre} Duracion de las operaciones de la clinica",
+                  f"# TYPE {nombre} histogram"]
+        for operacion, histograma in histogramas:
+            cuentas = histograma.obtener_cuentas()
+            acumulado = 0
+            for limite, cuenta in zip(LIMITES_LATENCIA, cuentas):
+                acumulado += cuenta
+                lineas.append(f'{nombre}_bucket{{operacion="{operacion}",le="{limite:g}"}} {acumulado}')
+            acumulado += cuentas[-1]
+            lineas.append(f'{nombre}_bucket{{operacion="{operacion}",le="+Inf"}} {acumulado}')
+            lineas.append(f'{nombre}_sum{{operacion="{operacion}"}} {histograma.obtener_suma():.9f}')
+            lineas.append(f'{nombre}_count{{operacion="{operacion}"}} {acumulado}')
+
+        nombre = f"{self.__prefijo}_errores_total"
+        lineas.append(f"# HELP {nombre} Excepciones por operacion y tipo")
+        lineas.append(f"# TYPE {nombre} counter")
+        for (operacion, excepcion), cantidad in errores:
+            lineas.append(f'{nombre}{{operacion="{operacion}",excepcion="{excepcion}"}} {cantidad}')
+
+        for medida, (ayuda, funcion) in medidas:
+            nombre = f"{self.__prefijo}_{medida}"
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} gauge")
+            lineas.append(f"{nombre} {funcion()}")
+
+        return "\n".join(lineas) + "\n"
@@ -0,0 +1,94 @@
+from bisect import bisect_left, bisect_right
+
+def calcular_huecos(intervalos, desde, hasta):
+    # intervalos: pares (inicio, fin) ordenados por inicio que terminan despues de desde
+    huecos = []
+    cursor = desde
+
+    for inicio, fin in intervalos:
+        if inicio >= hasta:
+            break
+        if inicio > cursor:
+            huecos.append((cursor, inicio))
+        cursor = max(cursor, fin)
+
+    if cursor < hasta:
+        huecos.append((cursor, hasta))
+    return huecos
+
+class AgendaMedico:
+    # Intervalos [inicio, fin) ordenados por inicio y sin superposiciones,
+    # por eso los fines tambien quedan ordenados y se puede usar bisect en ambos
+    __slots__ = ("__inicios", "__fines", "__turnos")
+
+    def __init__(self):
+        self.__inicios = []
+        self.__fines = []
+        self.__turnos = []
+
+    def obtener_superpuesto(self, inicio, fin):
+        i = bisect_right(self.__inicios, inicio)
+
+        if i > 0 and (self.__inicios[i - 1] == inicio or self.__fines[i - 1] > inicio):
+            return self.__turnos[i - 1]
+        if i < len(self.__inicios) and self.__inicios[i] < fin:
+            return self.__turnos[i]
+        return None
+
+    def agregar(self, turno):
+        inicio = turno.obtener_fecha_hora()
+        fin = turno.obtener_fin()
+
+        # Caso comun: el turno va despues del ultimo de la agenda
+        if not self.__inicios or (inicio > self.__inicios[-1] and inicio >= self.__fines[-1]):
+            self.__inicios.append(inicio)
+            self.__fines.append(fin)
+            self.__turnos.append(turno)
+            return
+
+        if self.obtener_superpuesto(inicio, fin) is not None:
+            raise ValueError(f"El turno se superpone con otro turno en {inicio}")
+
+        i = bisect_right(self.__inicios, inicio)
+        self.__inicios.insert(i, inicio)
+        self.__fines.insert(i, fin)
+        self.__turnos.insert(i, turno)
+
+    def obtener_turno(self, fecha_hora):
+        i = bisect_left(self.__inicios, fecha_hora)
+        if i < len(self.__inicios) and self.__inicios[i] == fecha_hora:
+            return self.__turnos[i]
+        return None
+
+    def eliminar(self, fecha_hora):
+        i = bisect_left(self.__inicios, fecha_hora)
+        if i == len(self.__inicios) or self.__inicios[i] != fecha_hora:
+            return None
+
+        del self.__inicios[i]
+        del self.__fines[i]
+        return self.__turnos.pop(i)
+
+    def quitar_anteriores(self, hasta):
+        # Saca los turnos que empiezan antes de hasta; la agenda sigue ordenada
+        i = bisect_left(self.__inicios, hasta)
+        quitados = self.__turnos[:i]
+        del self.__inicios[:i]
+        del self.__fines[:i]
+        del self.__turnos[:i]
+        return quitados
+
+    def obtener_huecos(self, desde, hasta):
+        i = bisect_left(self.__fines, desde)
+        j = bisect_left(self.__inicios, hasta, lo=i)
+        return calcular_huecos(zip(self.__inicios[i:j], self.__fines[i:j]), desde, hasta)
+
+    def obtener_entre(self, desde=None, hasta=None):
+        # Copia solo el tramo [desde, hasta) en orden de inicio: recorrerlo no depende
+        # de que la agenda siga sin cambios
+        i = 0 if desde is None else bisect_left(self.__inicios, desde)
+        j = len(self.__inicios) if hasta is None else bisect_left(self.__inicios, hasta)
+        return self.__turnos[i:j]
+
+    def __len__(self):
+        return len(self.__turnos)
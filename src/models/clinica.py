@@ -1,24 +1,156 @@
-from datetime import datetime
+import gc
+import heapq
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta, time
+from itertools import islice
 from .paciente import Paciente
 from .medico import Medico
-from .especialidad import Especialidad
+from .especialidad import Especialidad, DIAS_SEMANA, obtener_id_especialidad, obtener_indice_dia
 from .turno import Turno
+from .agenda_medico import AgendaMedico
+from .indice_especialidades import IndiceEspecialidades
+from .indice_pacientes import IndicePacientes
 from .receta import Receta
-from .historia_clinica import HistoriaClinica
+from .paginador import Paginador
+from ..persistencia.repositorio_memoria import RepositorioMemoria
+from ..importacion import ResultadoImportacion
+from ..exportacion import COLUMNAS_TURNOS, FORMATOS, archivo_vacio, escribir_filas, filas_turnos
 from ..exceptions import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
-    RecetaInvalidaException
+    RecetaInvalidaException,
+    TurnoNoEncontradoException
 )
 
+# Cantidad de locks entre los que se reparten los medicos en modo concurrente
+FRANJAS_LOCKS = 64
+
+_SIN_BLOQUEO = nullcontext()
+
+# Horario de atencion que se usa al buscar turnos libres
+JORNADA_INICIO = time(8, 0)
+JORNADA_FIN = time(20, 0)
+
+# Errores que puede dar un turno del lote antes de mirar la agenda
+ERRORES_TURNO = (ValueError, PacienteNoEncontradoException, MedicoNoEncontradoException,
+                 MedicoNoDisponibleException)
+
+# Operaciones que se miden cuando la clinica tiene metricas
+OPERACIONES_MEDIDAS = ("agregar_paciente", "buscar_pacientes", "agregar_medico", "agregar_especialidad_a_medico",
+                       "buscar_medicos", "agendar_turno", "agendar_turnos_lote", "agendar_turnos_recurrentes",
+                       "cancelar_turno", "obtener_huecos_libres", "buscar_turnos_libres", "emitir_receta",
+                       "obtener_historia_clinica", "importar_pacientes", "importar_medicos",
+                       "obtener_turnos_entre", "archivar_turnos", "obtener_agenda_del_dia")
+
+class _Bloqueo:
+    # Toma varios locks en el orden recibido y los suelta en orden inverso
+    __slots__ = ("__locks",)
+
+    def __init__(self, locks):
+        self.__locks = locks
+
+    def __enter__(self):
+        for lock in self.__locks:
+            lock.acquire()
+
+    def __exit__(self, *excepcion):
+        for lock in reversed(self.__locks):
+            lock.release()
+
+def _leer_fecha(valor):
+    # El journal guarda las fechas en ISO; el snapshot ya las devuelve como datetime
+    if isinstance(valor, datetime):
+        return valor
+    return datetime.fromisoformat(valor)
+
+def _redondear_a_grilla(fecha_hora, hora_inicio, duracion):
+    # Primer horario hora_inicio + k * duracion del dia que no es anterior a fecha_hora
+    inicio = datetime.combine(fecha_hora.date(), hora_inicio)
+    if fecha_hora <= inicio:
+        return inicio
+    return inicio + duracion * -(-(fecha_hora - inicio) // duracion)
+
 class Clinica:
-    def __init__(self):
-        self.__pacientes = {}
-        self.__medicos = {}
-        self.__turnos = []
-        self.__historias_clinicas = {}
+    def __init__(self, journal=None, snapshot=None, snapshot_cada=None, repositorio=None, columnas_turnos=None,
+                 concurrente=False, metricas=None, reloj=datetime.now):
+        if snapshot_cada is not None and snapshot_cada < 1:
+            raise ValueError("La cantidad de eventos entre snapshots debe ser mayor a cero")
+        
+        self.__repositorio = repositorio if repositorio is not None else RepositorioMemoria()
+        self.__journal = None
+        self.__snapshot = snapshot
+        self.__snapshot_cada = snapshot_cada
+        self.__registrados_en_snapshot = 0
+        self.__hilo_snapshot = None
+        self.__lock_snapshot = threading.Lock()
+        self.__columnas_turnos = None
+        self.__indice_especialidades = None
+        self.__indice_pacientes = None
+        self.__metricas = None
+        # Hora actual para validar fechas pasadas y buscar turnos libres desde ahora
+        self.__reloj = reloj
+
+        # Modo concurrente: las operaciones de un medico toman el lock de su franja
+        # (hash de la matricula), asi medicos distintos agendan en paralelo. Las altas
+        # de pacientes, medicos y especialidades pasan ademas por un lock comun
+        self.__lock_altas = threading.Lock() if concurrente else None
+        self.__franjas = [threading.Lock() for _ in range(FRANJAS_LOCKS)] if concurrente else None
+
+        # Se carga el ultimo snapshot y despues solo la cola del journal que no cubre
+        generacion = 0
+        if snapshot is not None:
+            generacion = snapshot.obtener_generacion()
+            self.__reproducir(snapshot.leer())
+
+        if journal is not None:
+            self.__reproducir(journal.leer(generacion))
+            journal.descartar_anteriores(generacion)
+            self.__journal = journal
+
+        # El indice de especialidades se arma una vez con los medicos ya cargados
+        indice = IndiceEspecialidades()
+        # Se recorre el repositorio sin copiar la lista de medicos
+        for medico in self.__repositorio.iterar_medicos():
+            indice.agregar_medico(medico)
+        self.__indice_especialidades = indice
+
+        # Igual el indice de pacientes por nombre y fecha de nacimiento: se ordena una sola vez
+        indice = IndicePacientes()
+        indice.agregar_varios(self.__repositorio.iterar_pacientes())
+        self.__indice_pacientes = indice
+
+        # Las columnas se llenan una vez con el estado ya cargado (de memoria o de SQLite)
+        if columnas_turnos is not None:
+            for turno in self.__repositorio.iterar_turnos():
+                self.__agregar_a_columnas(columnas_turnos, turno)
+            self.__columnas_turnos = columnas_turnos
+
+        if metricas is not None:
+            self.__instrumentar(metricas)
+
+    def __instrumentar(self, metricas):
+        # Cada operacion medida se reemplaza en la instancia por su version envuelta;
+        # sin metricas se llama directo al metodo y no hay ningun costo
+        for operacion in OPERACIONES_MEDIDAS:
+            setattr(self, operacion, metricas.medir(operacion, getattr(self, operacion)))
+
+        metricas.registrar_medida("indice_pacientes_claves", "Claves en el indice de pacientes por nombre",
+                                  lambda: len(self.__indice_pacientes))
+        metricas.registrar_medida("indice_especialidades_entradas",
+                                  "Pares (medico, dia) en el indice de especialidades",
+                                  lambda: len(self.__indice_especialidades))
+        if self.__columnas_turnos is not None:
+            metricas.registrar_medida("columnas_turnos", "Turnos en las columnas de estadisticas",
+                                      lambda: len(self.__columnas_turnos))
+        self.__metricas = metricas
+
+    def obtener_metricas(self):
+        if self.__metricas is None:
+            raise ValueError("La clinica no tiene metricas configuradas")
+        return self.__metricas
 
     # Pacientes
 
@@ -28,18 +160,48 @@ class Clinica:
         
         dni = paciente.obtener_dni()
 
-        if dni in self.__pacientes:
-            raise ValueError(f"Ya existe un paciente con DNI: {dni}")
-        
-        self.__pacientes[dni] = paciente
-        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        with self.__bloquear(altas=True):
+            if self.__repositorio.obtener_paciente(dni) is not None:
+                raise ValueError(f"Ya existe un paciente con DNI: {dni}")
+            
+            self.__registrar(["P", paciente.obtener_nombre(), dni, paciente.obtener_fecha_nacimiento()])
+            self.__repositorio.agregar_paciente(paciente)
+            self.__indice_pacientes.agregar(paciente)
+        self.__snapshot_periodico()
 
     def obtener_pacientes(self):
-        return list(self.__pacientes.values())
+        return self.__repositorio.obtener_pacientes()
+
+    def iterar_pacientes(self):
+        return self.__repositorio.iterar_pacientes()
+
+    def paginar_pacientes(self, tamano=20):
+        return Paginador(self.__repositorio.iterar_pacientes(), tamano)
+
+    def buscar_pacientes(self, prefijo="", limite=10, fecha_nacimiento=None):
+        # Pacientes cuyo nombre tiene una palabra que empieza con el prefijo (sin distinguir
+        # mayusculas ni acentos), en orden alfabetico. Con fecha_nacimiento (dd/mm/aaaa)
+        # solo se buscan entre los nacidos ese dia
+        if limite < 1:
+            raise ValueError("El limite debe ser mayor a cero")
+
+        if fecha_nacimiento is not None:
+            dnis = self.__indice_pacientes.buscar_por_nacimiento(fecha_nacimiento, prefijo, limite)
+        elif not prefijo or not prefijo.strip():
+            raise ValueError("Debe indicar el comienzo del nombre o la fecha de nacimiento")
+        else:
+            dnis = self.__indice_pacientes.buscar(prefijo, limite)
+
+        return [self.__repositorio.obtener_paciente(dni) for dni in dnis]
     
     def validar_existencia_paciente(self, dni):
-        if dni not in self.__pacientes:
+        self.__obtener_paciente(dni)
+
+    def __obtener_paciente(self, dni):
+        paciente = self.__repositorio.obtener_paciente(dni)
+        if paciente is None:
             raise PacienteNoEncontradoException(f"No se encontro el paciente con DNI: {dni}")
+        return paciente
         
     # Medicos
 
@@ -48,97 +210,708 @@ class Clinica:
             raise ValueError("Debe proporcionar un Medico valido")
         
         matricula = medico.obtener_matricula()
+        eventos = [["M", medico.obtener_nombre(), matricula]]
+        for especialidad in medico.obtener_especialidades():
+            eventos.append(self.__evento_especialidad(matricula, especialidad))
 
-        if matricula in self.__medicos:
-            raise ValueError(f"Ya existe el medico con matricula: {matricula}")
-        
-        self.__medicos[matricula] = medico
+        with self.__bloquear(altas=True):
+            if self.__repositorio.obtener_medico(matricula) is not None:
+                raise ValueError(f"Ya existe el medico con matricula: {matricula}")
+            
+            self.__registrar_lote(eventos)
+            self.__repositorio.agregar_medico(medico)
+            self.__indice_especialidades.agregar_medico(medico)
+        self.__snapshot_periodico()
+
+    def agregar_especialidad_a_medico(self, matricula, especialidad):
+        with self.__bloquear(matricula, altas=True):
+            medico = self.obtener_medico_por_matricula(matricula)
+            medico.validar_especialidad_nueva(especialidad)
+
+            # Se valida antes de registrar: el journal solo tiene eventos que se pueden aplicar
+            self.__registrar(self.__evento_especialidad(matricula, especialidad))
+            self.__guardar_especialidad(matricula, especialidad)
+        self.__snapshot_periodico()
+
+    def __evento_especialidad(self, matricula, especialidad):
+        return ["E", matricula, especialidad.obtener_especialidad(), especialidad.obtener_dias()]
 
     def obtener_medicos(self):
-        return list(self.__medicos.values())
+        return self.__repositorio.obtener_medicos()
+
+    def iterar_medicos(self):
+        return self.__repositorio.iterar_medicos()
+
+    def paginar_medicos(self, tamano=20):
+        return Paginador(self.__repositorio.iterar_medicos(), tamano)
+
+    def buscar_medicos(self, especialidad, dia):
+        # Medicos que atienden la especialidad ese dia (nombre como "lunes" o indice de
+        # weekday()), ordenados por matricula. Solo se leen los medicos del resultado
+        indice_dia = dia if isinstance(dia, int) else obtener_indice_dia(dia)
+        if indice_dia is None or not 0 <= indice_dia < 7:
+            raise ValueError(f"Dia invalido: {dia}")
+
+        id_especialidad = obtener_id_especialidad(especialidad)
+        if id_especialidad is None:
+            return []
+
+        matriculas = self.__indice_especialidades.obtener_matriculas(id_especialidad, indice_dia)
+        return [self.__repositorio.obtener_medico(matricula) for matricula in sorted(matriculas)]
     
     def obtener_medico_por_matricula(self, matricula):
-        if matricula not in self.__medicos:
+        medico = self.__repositorio.obtener_medico(matricula)
+        if medico is None:
             raise MedicoNoEncontradoException(f"No se encontro medico con matricula: {matricula}")
         
-        return self.__medicos[matricula]
+        return medico
     
     def validar_existencia_medico(self, matricula):
-        if matricula not in self.__medicos:
-            raise MedicoNoEncontradoException(f"No se encontro medico con matricula: {matricula}")
+        self.obtener_medico_por_matricula(matricula)
         
     # Turnos
 
-    def agendar_turno(self, dni, matricula, especialidad, fecha_hora):
-        self.validar_existencia_paciente(dni)
-        paciente = self.__pacientes[dni]
-
-        self.validar_existencia_medico(matricula)
-        medico = self.__medicos[matricula]
+    def agendar_turno(self, dni, matricula, especialidad, fecha_hora, duracion=None):
+        paciente = self.__obtener_paciente(dni)
+        medico = self.obtener_medico_por_matricula(matricula)
 
         self.validar_fecha_no_pasada(fecha_hora)
 
-        dia_semana = self.obtener_dia_semana_español(fecha_hora)
-        
-        self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
+        # La verificacion de superposicion y el alta quedan dentro del lock del medico
+        with self.__bloquear(matricula):
+            self.validar_especialidad_en_dia(medico, especialidad, fecha_hora.weekday())
+
+            turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
+
+            self.validar_turno_no_duplicado(matricula, fecha_hora, turno.obtener_fin())
+
+            self.__registrar(["T", dni, matricula, especialidad, fecha_hora.isoformat(), duracion])
+            self.__repositorio.agregar_turno(turno)
+            if self.__columnas_turnos is not None:
+                self.__agregar_a_columnas(self.__columnas_turnos, turno)
+        self.__snapshot_periodico()
+
+    def agendar_turnos_lote(self, solicitudes):
+        # solicitudes: tuplas (dni, matricula, especialidad, fecha_hora[, duracion]).
+        # Se agendan todos o ninguno: si uno falla se lanza su excepcion (indicando
+        # la posicion en el lote) sin haber guardado nada. Devuelve los turnos creados
+        turnos = self.__crear_turnos_lote(solicitudes)
+        if not turnos:
+            return turnos
+
+        matriculas = {turno.obtener_medico().obtener_matricula() for turno in turnos}
+        with self.__bloquear(*matriculas):
+            self.__validar_lote_sin_superposiciones(turnos)
+
+            self.__registrar_lote([["T", turno.obtener_paciente().obtener_dni(),
+                                    turno.obtener_medico().obtener_matricula(), turno.obtener_especialidad(),
+                                    turno.obtener_fecha_hora().isoformat(), turno.obtener_duracion()]
+                                   for turno in turnos])
+            with self.__repositorio.lote():
+                for turno in turnos:
+                    self.__repositorio.agregar_turno(turno)
+            if self.__columnas_turnos is not None:
+                for turno in turnos:
+                    self.__agregar_a_columnas(self.__columnas_turnos, turno)
+        self.__snapshot_periodico()
+        return turnos
+
+    def agendar_turnos_recurrentes(self, dni, matricula, especialidad, inicio, cantidad,
+                                   frecuencia=timedelta(weeks=1), duracion=None):
+        # Serie de turnos (por ejemplo 10 sesiones semanales) con las mismas reglas que el lote
+        if cantidad < 1:
+            raise ValueError("La cantidad de turnos debe ser mayor a cero")
+        if frecuencia <= timedelta(0):
+            raise ValueError("La frecuencia debe ser mayor a cero")
+
+        return self.agendar_turnos_lote([(dni, matricula, especialidad, inicio + frecuencia * i, duracion)
+                                         for i in range(cantidad)])
+
+    def __crear_turnos_lote(self, solicitudes):
+        # Validaciones que no dependen de la agenda: cada paciente y medico se busca una sola vez
+        pacientes = {}
+        medicos = {}
+        turnos = []
+
+        for numero, solicitud in enumerate(solicitudes, 1):
+            try:
+                if len(solicitud) not in (4, 5):
+                    raise ValueError("Cada turno debe tener dni, matricula, especialidad, fecha_hora y duracion opcional")
+                dni, matricula, especialidad, fecha_hora = solicitud[:4]
+                duracion = solicitud[4] if len(solicitud) == 5 else None
+
+                paciente = pacientes.get(dni)
+                if paciente is None:
+                    paciente = pacientes[dni] = self.__obtener_paciente(dni)
+                medico = medicos.get(matricula)
+                if medico is None:
+                    medico = medicos[matricula] = self.obtener_medico_por_matricula(matricula)
+
+                self.validar_fecha_no_pasada(fecha_hora)
+                self.validar_especialidad_en_dia(medico, especialidad, fecha_hora.weekday())
+                turnos.append(Turno(paciente, medico, fecha_hora, especialidad, duracion))
+            except ERRORES_TURNO as e:
+                raise type(e)(f"Turno {numero} del lote: {e}") from e
 
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
+        return turnos
 
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos.append(turno)
+    def __validar_lote_sin_superposiciones(self, turnos):
+        # Contra los turnos guardados y entre los turnos del mismo lote (una agenda
+        # temporal por medico con la misma busqueda binaria que la agenda real)
+        agendas = {}
+        for numero, turno in enumerate(turnos, 1):
+            matricula = turno.obtener_medico().obtener_matricula()
+            inicio = turno.obtener_fecha_hora()
+            try:
+                self.validar_turno_no_duplicado(matricula, inicio, turno.obtener_fin())
 
-        self.__historias_clinicas[dni].agregar_turno(turno)
+                agenda = agendas.get(matricula)
+                if agenda is None:
+                    agenda = agendas[matricula] = AgendaMedico()
+                otro = agenda.obtener_superpuesto(inicio, turno.obtener_fin())
+                if otro is not None:
+                    raise TurnoOcupadoException(
+                        f"Se superpone con otro turno del lote en {otro.obtener_fecha_hora()}"
+                    )
+                agenda.agregar(turno)
+            except TurnoOcupadoException as e:
+                raise TurnoOcupadoException(f"Turno {numero} del lote: {e}") from e
+
+    def cancelar_turno(self, matricula, fecha_hora):
+        self.validar_existencia_medico(matricula)
+
+        with self.__bloquear(matricula):
+            if self.__repositorio.obtener_turno(matricula, fecha_hora) is None:
+                raise TurnoNoEncontradoException(f"El medico no tiene un turno agendado en {fecha_hora}")
+
+            self.__registrar(["C", matricula, fecha_hora.isoformat()])
+            self.__repositorio.eliminar_turno(matricula, fecha_hora)
+            if self.__columnas_turnos is not None:
+                self.__columnas_turnos.eliminar(matricula, fecha_hora)
+        self.__snapshot_periodico()
 
     def obtener_turnos(self):
-        return self.__turnos.copy()
+        return self.__repositorio.obtener_turnos()
+
+    def iterar_turnos(self, desde=None, hasta=None, matricula=None, dni=None):
+        # Generador filtrado que no copia los turnos; los filtros se validan
+        # antes de empezar a recorrer
+        self.__validar_filtros(desde, hasta, matricula, dni)
+        if matricula is None:
+            return self.__repositorio.iterar_turnos(desde, hasta, matricula, dni)
+        # El repositorio copia el tramo de la agenda al llamarlo, con el medico bloqueado
+        with self.__bloquear(matricula):
+            return self.__repositorio.iterar_turnos(desde, hasta, matricula, dni)
+
+    def paginar_turnos(self, tamano=20, desde=None, hasta=None, matricula=None, dni=None):
+        # Cursor sobre iterar_turnos: cada pagina sigue leyendo desde donde termino la anterior
+        return Paginador(self.iterar_turnos(desde, hasta, matricula, dni), tamano)
+
+    def obtener_agenda_del_dia(self, matricula, dia=None):
+        # Turnos del medico en el dia (date o datetime; por defecto hoy) ordenados por horario.
+        # Es un rango de la agenda del medico (o del indice (matricula, fecha_hora) en SQLite):
+        # no se recorre ningun otro turno
+        self.validar_existencia_medico(matricula)
+        if dia is None:
+            dia = self.__reloj()
+        inicio = datetime.combine(dia.date() if isinstance(dia, datetime) else dia, time())
+        with self.__bloquear(matricula):
+            return self.__repositorio.obtener_turnos_entre(inicio, inicio + timedelta(days=1), matricula)
+
+    def obtener_turnos_entre(self, desde, hasta, matricula=None):
+        # Turnos con desde <= fecha_hora < hasta ordenados por horario. Solo se leen
+        # los dias del rango, no todos los turnos como en iterar_turnos
+        if desde is None or hasta is None:
+            raise ValueError("Debe indicar el inicio y el fin del rango")
+        self.__validar_filtros(desde, hasta, matricula, None)
+        if matricula is None:
+            # Las particiones por dia tienen su propio lock
+            return self.__repositorio.obtener_turnos_entre(desde, hasta)
+        with self.__bloquear(matricula):
+            return self.__repositorio.obtener_turnos_entre(desde, hasta, matricula)
+
+    def archivar_turnos(self, hasta, archivo=None, formato="jsonl"):
+        # Saca los turnos anteriores a hasta (dias enteros salvo el propio dia de hasta).
+        # Si se pasa un archivo se escriben ahi antes de borrarlos. Devuelve cuantos se archivaron
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de exportacion no soportado: {formato} (use csv o jsonl)")
+
+        with self.__bloquear_todo():
+            turnos = self.__repositorio.obtener_turnos_entre(datetime.min, hasta)
+            if not turnos:
+                return 0
+
+            if archivo is not None:
+                # Archivar otra vez sobre el mismo archivo no repite el encabezado del CSV
+                escribir_filas(archivo, COLUMNAS_TURNOS, filas_turnos(turnos), formato, archivo_vacio(archivo))
+            self.__registrar(["A", hasta.isoformat()])
+            self.__repositorio.archivar_turnos(hasta)
+            if self.__columnas_turnos is not None:
+                self.__columnas_turnos.eliminar_anteriores(hasta)
+        self.__snapshot_periodico()
+        return len(turnos)
     
-    def validar_turno_no_duplicado(self, matricula, fecha_hora):
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and
-                 turno.obtener_fecha_hora() == fecha_hora):
-                raise TurnoOcupadoException(f"El medico ya tiene un turno agendado en {fecha_hora}")
+    def obtener_columnas_turnos(self):
+        if self.__columnas_turnos is None:
+            raise ValueError("La clinica no tiene columnas de turnos configuradas")
+        return self.__columnas_turnos
+
+    def __agregar_a_columnas(self, columnas, turno):
+        columnas.agregar(turno.obtener_medico().obtener_matricula(), turno.obtener_paciente().obtener_dni(),
+                         turno.obtener_especialidad(), turno.obtener_fecha_hora(), turno.obtener_duracion())
+
+    def validar_turno_no_duplicado(self, matricula, fecha_hora, fin=None):
+        # Busqueda binaria (o por indice) en la agenda del medico: no recorre todos los turnos
+        ocupado = self.__repositorio.obtener_turno_superpuesto(matricula, fecha_hora, fin or fecha_hora)
+        if ocupado is not None:
+            raise TurnoOcupadoException(
+                f"El medico ya tiene un turno agendado en {ocupado.obtener_fecha_hora()}"
+            )
+
+    def obtener_huecos_libres(self, matricula, desde, hasta):
+        self.validar_existencia_medico(matricula)
+
+        if desde >= hasta:
+            raise ValueError("El inicio del rango debe ser anterior al fin")
+        
+        with self.__bloquear(matricula):
+            return self.__repositorio.obtener_huecos(matricula, desde, hasta)
+
+    def buscar_turnos_libres(self, especialidad, desde, hasta, duracion, cantidad=10,
+                             hora_inicio=JORNADA_INICIO, hora_fin=JORNADA_FIN):
+        # Los primeros `cantidad` turnos libres de `duracion` minutos para la especialidad
+        # entre desde y hasta: lista de (medico, fecha_hora) ordenada por fecha. Cada medico
+        # que atiende la especialidad genera sus horarios libres en orden y se mezclan con
+        # un heap, asi solo se miran los dias y huecos necesarios para llegar a `cantidad`
+        if desde >= hasta:
+            raise ValueError("El inicio del rango debe ser anterior al fin")
+        if duracion is None or duracion <= 0:
+            raise ValueError("La duracion debe ser mayor a cero")
+        if cantidad < 1:
+            raise ValueError("La cantidad de turnos debe ser mayor a cero")
+        if hora_inicio >= hora_fin:
+            raise ValueError("La hora de inicio debe ser anterior a la hora de fin")
+
+        id_especialidad = obtener_id_especialidad(especialidad)
+        if id_especialidad is None:
+            return []
+
+        # Si la busqueda empieza en el pasado se arranca en el proximo horario de la grilla
+        # del dia (hora_inicio + k * duracion), no en el segundo exacto de ahora
+        ahora = self.__reloj()
+        if ahora > desde:
+            desde = _redondear_a_grilla(ahora, hora_inicio, timedelta(minutes=duracion))
+        medicos = {}
+        candidatos = []
+        for matricula in sorted(self.__indice_especialidades.obtener_matriculas(id_especialidad)):
+            medicos[matricula] = self.__repositorio.obtener_medico(matricula)
+            candidatos.append(self.__turnos_libres_de_medico(medicos[matricula], id_especialidad, desde, hasta,
+                                                             timedelta(minutes=duracion), hora_inicio, hora_fin))
+
+        return [(medicos[matricula], fecha_hora)
+                for fecha_hora, matricula in islice(heapq.merge(*candidatos), cantidad)]
+
+    def __turnos_libres_de_medico(self, medico, id_especialidad, desde, hasta, duracion, hora_inicio, hora_fin):
+        # Generador de (fecha_hora, matricula) en orden: recorre los dias en que el medico
+        # atiende la especialidad y parte cada hueco libre de su agenda en turnos de `duracion`
+        matricula = medico.obtener_matricula()
+        dia = desde.date()
+        while dia <= hasta.date():
+            if medico.obtener_id_especialidad_para_indice(dia.weekday()) == id_especialidad:
+                inicio = max(datetime.combine(dia, hora_inicio), desde)
+                fin = min(datetime.combine(dia, hora_fin), hasta)
+
+                if inicio + duracion <= fin:
+                    # Los huecos del dia se leen con el medico bloqueado, pero el lock
+                    # no se mantiene mientras se entregan los horarios
+                    with self.__bloquear(matricula):
+                        huecos = []
+                        for hueco_inicio, hueco_fin in self.__repositorio.obtener_huecos(matricula, inicio, fin):
+                            # Un turno sin duracion ocupa solo su horario de inicio, que puede ser el inicio del hueco
+                            if self.__repositorio.obtener_turno(matricula, hueco_inicio) is not None:
+                                hueco_inicio += duracion
+                            huecos.append((hueco_inicio, hueco_fin))
+
+                    for fecha_hora, hueco_fin in huecos:
+                        while fecha_hora + duracion <= hueco_fin:
+                            yield fecha_hora, matricula
+                            fecha_hora += duracion
+            dia += timedelta(days=1)
 
     def obtener_dia_semana_español(self, fecha_hora):
-        dias = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
-        return dias[fecha_hora.weekday()]
+        return DIAS_SEMANA[fecha_hora.weekday()]
     
     def validar_fecha_no_pasada(self, fecha_hora):
-        if fecha_hora < datetime.now():
+        if fecha_hora < self.__reloj():
             fecha_str = fecha_hora.strftime("%d/%m/%Y %H:%M")
             raise ValueError(f"No se puede agendar un turno en el pasado: {fecha_str}")
 
     def validar_especialidad_en_dia(self, medico, especialidad_solicitada, dia_semana):
-        especialidad_disponible = medico.obtener_especialidad_para_dia(dia_semana)
+        # dia_semana es el nombre del dia o su indice de weekday(), que es lo que pasa
+        # agendar_turno para no buscar el nombre en cada alta
+        indice_dia = dia_semana if isinstance(dia_semana, int) else obtener_indice_dia(dia_semana)
+        if isinstance(dia_semana, int):
+            dia_semana = DIAS_SEMANA[indice_dia]
+        # Se comparan los ids de especialidad: el nombre se normalizo una sola vez al registrarlo
+        id_disponible = medico.obtener_id_especialidad_para_indice(indice_dia) if indice_dia is not None else None
         
-        if especialidad_disponible is None:
+        if id_disponible is None:
             raise MedicoNoDisponibleException(
                 f"El medico no atiende los {dia_semana}"
             )
         
-        if especialidad_disponible.lower() != especialidad_solicitada.lower():
+        if id_disponible != obtener_id_especialidad(especialidad_solicitada):
             raise MedicoNoDisponibleException(
                 f"El medico no atiende {especialidad_solicitada} los dias {dia_semana}\n"
-                f"Atiende: {especialidad_disponible}"
+                f"Atiende: {medico.obtener_especialidad_para_indice(indice_dia)}"
             )
         
     # Recetas
     
     def emitir_receta(self, dni, matricula, medicamentos):
-        self.validar_existencia_paciente(dni)
-        paciente = self.__pacientes[dni]
-
-        self.validar_existencia_medico(matricula)
-        medico = self.__medicos[matricula]
+        paciente = self.__obtener_paciente(dni)
+        medico = self.obtener_medico_por_matricula(matricula)
 
         if not medicamentos:
             raise RecetaInvalidaException("Debe haber al menos un medicamento")
         
         receta = Receta(paciente, medico, medicamentos)
         
-        self.__historias_clinicas[dni].agregar_receta(receta)
+        with self.__bloquear(matricula):
+            self.__registrar(["R", dni, matricula, receta.obtener_medicamentos(), receta.obtener_fecha().isoformat()])
+            self.__repositorio.agregar_receta(receta)
+        self.__snapshot_periodico()
+
+    def iterar_recetas(self, desde=None, hasta=None, matricula=None, dni=None):
+        self.__validar_filtros(desde, hasta, matricula, dni)
+        return self.__repositorio.iterar_recetas(desde, hasta, matricula, dni)
+
+    def __validar_filtros(self, desde, hasta, matricula, dni):
+        if desde is not None and hasta is not None and desde >= hasta:
+            raise ValueError("El inicio del rango debe ser anterior al fin")
+        if matricula is not None:
+            self.validar_existencia_medico(matricula)
+        if dni is not None:
+            self.validar_existencia_paciente(dni)
 
     # Historias Clinicas
     
     def obtener_historia_clinica(self, dni):
-        self.validar_existencia_paciente(dni)
-        return self.__historias_clinicas[dni]
\ No newline at end of file
+        historia = self.__repositorio.obtener_historia_clinica(dni)
+        if historia is None:
+            raise PacienteNoEncontradoException(f"No se encontro el paciente con DNI: {dni}")
+        return historia
+
+    # Importacion masiva
+
+    def importar_pacientes(self, filas, tamano_lote=1000):
+        # filas: iterable de diccionarios con nombre, dni y fecha_nacimiento.
+        # Se valida y guarda de a lotes (un fsync por lote); las filas invalidas
+        # se informan en el resultado sin cortar la importacion
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a cero")
+        
+        resultado = ResultadoImportacion()
+        lote = []
+
+        for numero, fila in enumerate(filas, 1):
+            if not isinstance(fila, dict):
+                resultado.rechazar(numero, "Fila con formato invalido")
+                continue
+            try:
+                paciente = Paciente(fila.get("nombre"), fila.get("dni"), fila.get("fecha_nacimiento"))
+            except (ValueError, AttributeError) as e:
+                resultado.rechazar(numero, str(e))
+                continue
+
+            lote.append((numero, paciente))
+            if len(lote) >= tamano_lote:
+                self.__importar_lote_pacientes(lote, resultado)
+                self.__snapshot_periodico()
+                lote = []
+
+        self.__importar_lote_pacientes(lote, resultado)
+        self.__snapshot_periodico()
+        return resultado
+
+    def __importar_lote_pacientes(self, lote, resultado):
+        validos = []
+        dnis = set()
+
+        with self.__bloquear(altas=True):
+            for numero, paciente in lote:
+                dni = paciente.obtener_dni()
+                if dni in dnis or self.__repositorio.obtener_paciente(dni) is not None:
+                    resultado.rechazar(numero, f"Ya existe un paciente con DNI: {dni}")
+                    continue
+                
+                dnis.add(dni)
+                validos.append(paciente)
+
+            if not validos:
+                return
+            
+            self.__registrar_lote([["P", paciente.obtener_nombre(), paciente.obtener_dni(),
+                                    paciente.obtener_fecha_nacimiento()] for paciente in validos])
+            with self.__repositorio.lote():
+                for paciente in validos:
+                    self.__repositorio.agregar_paciente(paciente)
+            self.__indice_pacientes.agregar_varios(validos)
+        resultado.sumar_importados(len(validos))
+
+    def importar_medicos(self, filas, tamano_lote=1000):
+        # filas: iterable de diccionarios con nombre, matricula y opcionalmente
+        # especialidad y dias (lista o texto separado por ";"). Un medico con varias
+        # especialidades ocupa una fila por especialidad
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a cero")
+        
+        # Las filas se validan contra los medicos ya guardados: no puede haber otras altas en el medio
+        with self.__bloquear(altas=True):
+            resultado = self.__importar_medicos(filas, tamano_lote)
+        self.__snapshot_periodico()
+        return resultado
+
+    def __importar_medicos(self, filas, tamano_lote):
+        resultado = ResultadoImportacion()
+        nuevos = {}
+        existentes = {}
+        pendientes = []
+        # (matricula, id de especialidad) de pendientes, para no recorrer la lista en cada fila
+        claves_pendientes = set()
+        aceptadas = 0
+
+        for numero, fila in enumerate(filas, 1):
+            if not isinstance(fila, dict):
+                resultado.rechazar(numero, "Fila con formato invalido")
+                continue
+            try:
+                matricula = (fila.get("matricula") or "").strip()
+                especialidad = self.__leer_especialidad(fila)
+
+                medico = nuevos.get(matricula) or existentes.get(matricula)
+                if medico is None and matricula:
+                    medico = self.__repositorio.obtener_medico(matricula)
+                    if medico is not None:
+                        existentes[matricula] = medico
+
+                if medico is None:
+                    medico = Medico(fila.get("nombre"), matricula)
+                    if especialidad is not None:
+                        medico.agregar_especialidad(especialidad)
+                    nuevos[matricula] = medico
+                elif especialidad is None:
+                    raise ValueError(f"Ya existe el medico con matricula: {matricula}")
+                elif matricula in nuevos:
+                    medico.agregar_especialidad(especialidad)
+                else:
+                    # Al medico ya guardado se le agrega recien cuando el lote queda registrado
+                    medico.validar_especialidad_nueva(especialidad)
+                    clave = (matricula, especialidad.obtener_id())
+                    if clave in claves_pendientes:
+                        raise ValueError(f"La especialidad {especialidad.obtener_especialidad()} "
+                                         "ya esta registrada para este medico.")
+                    claves_pendientes.add(clave)
+                    pendientes.append((matricula, especialidad))
+
+            except (ValueError, AttributeError) as e:
+                resultado.rechazar(numero, str(e))
+                continue
+
+            aceptadas += 1
+            if aceptadas >= tamano_lote:
+                self.__importar_lote_medicos(nuevos, pendientes)
+                resultado.sumar_importados(aceptadas)
+                nuevos, existentes, pendientes, aceptadas = {}, {}, [], 0
+                claves_pendientes = set()
+
+        self.__importar_lote_medicos(nuevos, pendientes)
+        resultado.sumar_importados(aceptadas)
+        return resultado
+
+    def __leer_especialidad(self, fila):
+        if not fila.get("especialidad"):
+            return None
+        
+        dias = fila.get("dias") or []
+        if isinstance(dias, str):
+            dias = [dia for dia in dias.split(";") if dia.strip()]
+        return Especialidad(fila["especialidad"], dias)
+
+    def __importar_lote_medicos(self, nuevos, pendientes):
+        eventos = []
+        for matricula, medico in nuevos.items():
+            eventos.append(["M", medico.obtener_nombre(), matricula])
+            for especialidad in medico.obtener_especialidades():
+                eventos.append(self.__evento_especialidad(matricula, especialidad))
+        for matricula, especialidad in pendientes:
+            eventos.append(self.__evento_especialidad(matricula, especialidad))
+
+        if not eventos:
+            return
+        
+        # Los medicos existentes que reciben especialidades pueden estar agendando turnos
+        with self.__bloquear(*[matricula for matricula, _ in pendientes]):
+            self.__registrar_lote(eventos)
+            with self.__repositorio.lote():
+                for medico in nuevos.values():
+                    self.__repositorio.agregar_medico(medico)
+                    self.__indice_especialidades.agregar_medico(medico)
+                for matricula, especialidad in pendientes:
+                    self.__guardar_especialidad(matricula, especialidad)
+
+    # Persistencia
+
+    def __registrar(self, evento):
+        if self.__journal is None:
+            return
+        
+        self.__journal.registrar(evento)
+
+    def __registrar_lote(self, eventos):
+        if self.__journal is None:
+            return
+        
+        self.__journal.registrar_lote(eventos)
+
+    def __bloquear(self, *claves, altas=False):
+        if self.__franjas is None:
+            return _SIN_BLOQUEO
+        
+        # Siempre el lock de altas primero y las franjas en orden creciente: sin deadlocks
+        locks = [self.__lock_altas] if altas else []
+        locks += [self.__franjas[i] for i in sorted({hash(clave) % FRANJAS_LOCKS for clave in claves})]
+        return locks[0] if len(locks) == 1 else _Bloqueo(locks)
+
+    def __bloquear_todo(self):
+        if self.__franjas is None:
+            return _SIN_BLOQUEO
+        return _Bloqueo([self.__lock_altas] + self.__franjas)
+
+    def __eventos_desde_snapshot(self):
+        if self.__journal is None:
+            return 0
+        return self.__journal.obtener_registrados() - self.__registrados_en_snapshot
+
+    def __snapshot_periodico(self):
+        # Se llama al terminar cada operacion, fuera de los locks. El snapshot toma
+        # todos los locks, asi que el estado capturado coincide con el corte del journal
+        if (self.__snapshot is None or self.__snapshot_cada is None or
+                self.__eventos_desde_snapshot() < self.__snapshot_cada):
+            return
+        if self.__hilo_snapshot is not None and self.__hilo_snapshot.is_alive():
+            return
+        # Si otro hilo ya esta tomando el snapshot no hace falta esperarlo
+        if not self.__lock_snapshot.acquire(blocking=False):
+            return
+        
+        try:
+            if self.__eventos_desde_snapshot() >= self.__snapshot_cada:
+                self.__capturar_snapshot(en_segundo_plano=True)
+        finally:
+            self.__lock_snapshot.release()
+
+    def tomar_snapshot(self, en_segundo_plano=True):
+        if self.__snapshot is None:
+            raise ValueError("La clinica no tiene un snapshot configurado")
+        
+        with self.__lock_snapshot:
+            self.__capturar_snapshot(en_segundo_plano)
+
+    def __capturar_snapshot(self, en_segundo_plano):
+        self.esperar_snapshot()
+
+        # Solo se copian referencias: los pacientes, turnos y recetas no cambian
+        # despues de creados, asi que se pueden serializar en otro hilo. Las
+        # listas si se copian porque los repositorios devuelven vistas vivas
+        with self.__bloquear_todo():
+            pacientes = list(self.__repositorio.obtener_pacientes())
+            medicos = [(medico, medico.obtener_especialidades()) for medico in self.__repositorio.obtener_medicos()]
+            turnos = list(self.__repositorio.obtener_turnos())
+            recetas = list(self.__repositorio.obtener_recetas())
+
+            generacion = 0
+            if self.__journal is not None:
+                generacion = self.__journal.rotar()
+                self.__registrados_en_snapshot = self.__journal.obtener_registrados()
+
+        def escribir():
+            self.__snapshot.escribir(pacientes, medicos, turnos, recetas, generacion)
+            if self.__journal is not None:
+                self.__journal.descartar_anteriores(generacion)
+
+        if not en_segundo_plano:
+            escribir()
+            return
+        
+        self.__hilo_snapshot = threading.Thread(target=escribir, name="snapshot-clinica")
+        self.__hilo_snapshot.start()
+
+    def esperar_snapshot(self):
+        if self.__hilo_snapshot is not None:
+            self.__hilo_snapshot.join()
+            self.__hilo_snapshot = None
+
+    def __reproducir(self, eventos):
+        # Cada evento construye directamente el objeto final, sin volver a validar
+        # fechas pasadas ni superposiciones (ya se validaron al registrarlo)
+        aplicar = {
+            "P": self.__reproducir_paciente,
+            "M": self.__reproducir_medico,
+            "E": self.__reproducir_especialidad,
+            "T": self.__reproducir_turno,
+            "C": self.__reproducir_cancelacion,
+            "R": self.__reproducir_receta,
+            "A": self.__reproducir_archivo,
+        }
+
+        # El recolector de ciclos no encuentra nada que liberar mientras se cargan
+        # millones de objetos nuevos; se pausa durante la reproduccion
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            for evento in eventos:
+                aplicar[evento[0]](*evento[1:])
+        finally:
+            if gc_activo:
+                gc.enable()
+
+    def __reproducir_paciente(self, nombre, dni, fecha_nacimiento):
+        self.__repositorio.agregar_paciente(Paciente(nombre, dni, fecha_nacimiento))
+
+    def __reproducir_medico(self, nombre, matricula):
+        self.__repositorio.agregar_medico(Medico(nombre, matricula))
+
+    def __reproducir_especialidad(self, matricula, tipo, dias):
+        self.__guardar_especialidad(matricula, Especialidad(tipo, dias))
+
+    def __guardar_especialidad(self, matricula, especialidad):
+        medico = self.__repositorio.obtener_medico(matricula)
+        medico.agregar_especialidad(especialidad)
+        self.__repositorio.agregar_especialidad(matricula, especialidad)
+        # Mientras se reproduce el journal el indice todavia no existe: se arma al final
+        if self.__indice_especialidades is not None:
+            self.__indice_especialidades.agregar(medico, especialidad)
+
+    def __reproducir_turno(self, dni, matricula, especialidad, fecha_hora, duracion):
+        turno = Turno(self.__repositorio.obtener_paciente(dni), self.__repositorio.obtener_medico(matricula),
+                      _leer_fecha(fecha_hora), especialidad, duracion)
+        self.__repositorio.agregar_turno(turno)
+
+    def __reproducir_cancelacion(self, matricula, fecha_hora):
+        self.__repositorio.eliminar_turno(matricula, _leer_fecha(fecha_hora))
+
+    def __reproducir_archivo(self, hasta):
+        self.__repositorio.archivar_turnos(_leer_fecha(hasta))
+
+    def __reproducir_receta(self, dni, matricula, medicamentos, fecha):
+        receta = Receta(self.__repositorio.obtener_paciente(dni), self.__repositorio.obtener_medico(matricula),
+                        medicamentos, _leer_fecha(fecha))
+        self.__repositorio.agregar_receta(receta)
+
+    def cerrar(self):
+        self.esperar_snapshot()
+
+        if self.__journal is not None:
+            self.__journal.cerrar()
+        self.__repositorio.cerrar()
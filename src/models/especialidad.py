@@ -1,63 +1,102 @@
+import sys
+import threading
+from .registro_ids import RegistroIds
+
+DIAS_SEMANA = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+
+# Nombre de dia (con y sin acentos) -> indice de datetime.weekday()
+INDICE_DIAS = {
+    "lunes": 0, "martes": 1, "miercoles": 2, "miércoles": 2, "jueves": 3,
+    "viernes": 4, "sabado": 5, "sábado": 5, "domingo": 6
+}
+
+def obtener_indice_dia(dia):
+    indice = INDICE_DIAS.get(dia)
+    if indice is None:
+        indice = INDICE_DIAS.get(dia.strip().lower())
+    return indice
+
+# Cada especialidad distinta (sin distinguir mayusculas ni espacios en los extremos;
+# los acentos si cuentan) recibe un id entero compartido por todos los medicos
+_REGISTRO_ESPECIALIDADES = RegistroIds()
+_NOMBRES_ESPECIALIDADES = []
+# Texto tal como llega -> id, para no normalizar dos veces el mismo texto
+_IDS_POR_TEXTO = {}
+# Se registra desde varios hilos en modo concurrente (altas de medicos de distintas
+# franjas y ColumnasTurnos.agregar); las lecturas del id ya registrado no lo toman
+_LOCK_REGISTRO = threading.Lock()
+
+def registrar_especialidad(nombre):
+    numero = _IDS_POR_TEXTO.get(nombre)
+    if numero is not None:
+        return numero
+
+    with _LOCK_REGISTRO:
+        numero = _REGISTRO_ESPECIALIDADES.registrar(nombre.strip().casefold())
+        if numero == len(_NOMBRES_ESPECIALIDADES):
+            _NOMBRES_ESPECIALIDADES.append(sys.intern(nombre.strip()))
+        _IDS_POR_TEXTO[nombre] = numero
+    return numero
+
+def obtener_id_especialidad(nombre):
+    # None si ningun medico registro esa especialidad
+    numero = _IDS_POR_TEXTO.get(nombre)
+    if numero is None:
+        numero = _REGISTRO_ESPECIALIDADES.obtener_id(nombre.strip().casefold())
+        if numero is not None:
+            _IDS_POR_TEXTO[nombre] = numero
+    return numero
+
+def obtener_nombre_especialidad(numero):
+    return _NOMBRES_ESPECIALIDADES[numero]
+
+def cantidad_especialidades():
+    return len(_NOMBRES_ESPECIALIDADES)
+
 class Especialidad:
+    __slots__ = ("__tipo", "__id", "__dias", "__indices_dias")
+
     def __init__(self, tipo, dias):
         if not tipo or not tipo.strip():
             raise ValueError("La especialidad no debe estar vacia")
         if not dias:
             raise ValueError("Debe haber minimo un dia de atencion")
-        
-        self.__dias_validos = {
-            "lunes", "martes", "miercoles", "miércoles", "jueves", 
-            "viernes", "sabado", "sábado", "domingo"
-        }
 
-        dias_normalizados =  []
+        dias_normalizados = []
+        indices = []
         for dia in dias:
             dia_normalizado = dia.strip().lower()
+            indice = INDICE_DIAS.get(dia_normalizado)
 
-            if dia_normalizado not in self.__dias_validos:
+            if indice is None:
                 raise ValueError(f"Dia invalido: {dia}")
             
-            if not self._dia_ya_agregado(dia_normalizado, dias_normalizados):
-                dias_normalizados.append(dia_normalizado)
-
-        self.__tipo = tipo.strip()
-        self.__dias = dias_normalizados
-
-    def _dia_ya_agregado(self, dia_nuevo, dias_existentes):
-        equivalencias = {
-            "miercoles": "miércoles",
-            "miércoles": "miercoles",
-            "sabado": "sábado",
-            "sábado": "sabado"
-        }
-
-        for dia_existente in dias_existentes:
-            if (dia_nuevo == dia_existente or
-                equivalencias.get(dia_nuevo) == dia_existente or
-                equivalencias.get(dia_existente) == dia_nuevo):
-                return True
-        return False
+            if indice not in indices:
+                dias_normalizados.append(sys.intern(dia_normalizado))
+                indices.append(indice)
+
+        self.__tipo = sys.intern(tipo.strip())
+        self.__id = registrar_especialidad(self.__tipo)
+        self.__dias = tuple(dias_normalizados)
+        self.__indices_dias = frozenset(indices)
         
     def verificar_dia(self, dia):
-        dia_normalizado = dia.strip().lower()
+        return obtener_indice_dia(dia) in self.__indices_dias
 
-        if dia_normalizado in self.__dias:
-            return True
-        
-        equivalencias = {
-        "miercoles": "miércoles",
-        "miércoles": "miercoles",
-        "sabado": "sábado",
-        "sábado": "sabado"
-        }
-        
-        dia_equivalente = equivalencias.get(dia_normalizado)
-        if dia_equivalente and dia_equivalente in self.__dias:
-            return True
-        return False
+    def verificar_indice_dia(self, indice):
+        return indice in self.__indices_dias
+
+    def obtener_indices_dias(self):
+        return self.__indices_dias
 
     def obtener_especialidad(self):
             return self.__tipo
+
+    def obtener_id(self):
+        return self.__id
+
+    def obtener_dias(self):
+        return list(self.__dias)
     
     def __str__(self):
         dias_str = ", ".join(self.__dias)
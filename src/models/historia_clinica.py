@@ -1,8 +1,18 @@
+import threading
 from .paciente import Paciente
 from .turno import Turno
 from .receta import Receta
+from .vista import VistaLista
+
+# Los cambios de una historia (lista y version juntas) no se mezclan entre hilos: en modo
+# concurrente dos medicos distintos pueden agregar a la misma historia a la vez. Es un lock
+# comun y no uno por historia para no sumar un objeto mas por paciente; lo que protege es
+# un append y un incremento
+_LOCK_CAMBIOS = threading.Lock()
 
 class HistoriaClinica:
+    __slots__ = ("__paciente", "__turnos", "__recetas", "__version", "__texto")
+
     def __init__(self, paciente):
         if paciente is None:
             raise ValueError("El paciente no debe ser None")
@@ -12,6 +22,9 @@ class HistoriaClinica:
         self.__paciente = paciente
         self.__turnos = []
         self.__recetas = []
+        # Cada cambio incrementa la version; el texto guardado vale solo para su version
+        self.__version = 0
+        self.__texto = None
 
     def agregar_turno(self, turno):
         if turno is None:
@@ -19,7 +32,24 @@ class HistoriaClinica:
         if not isinstance(turno, Turno):
             raise ValueError("Debe proporcionar un turno valido")
         
-        self.__turnos.append(turno)
+        with _LOCK_CAMBIOS:
+            self.__turnos.append(turno)
+            self.__version += 1
+
+    def eliminar_turno(self, turno):
+        with _LOCK_CAMBIOS:
+            if turno not in self.__turnos:
+                raise ValueError("El turno no pertenece a esta historia clinica")
+
+            self.__turnos.remove(turno)
+            self.__version += 1
+
+    def eliminar_turnos(self, turnos):
+        # Varios turnos de una vez (al archivar): una sola pasada por la lista
+        quitar = {id(turno) for turno in turnos}
+        with _LOCK_CAMBIOS:
+            self.__turnos[:] = [turno for turno in self.__turnos if id(turno) not in quitar]
+            self.__version += 1
 
     def agregar_receta(self, receta):
         if receta is None:
@@ -27,35 +57,55 @@ class HistoriaClinica:
         if not isinstance(receta, Receta):
             raise ValueError("Debe proporcionar una Receta valida")
         
-        self.__recetas.append(receta)
+        with _LOCK_CAMBIOS:
+            self.__recetas.append(receta)
+            self.__version += 1
     
+    def obtener_paciente(self):
+        return self.__paciente
+
     def obtener_turnos(self):
-        return self.__turnos.copy()
+        return VistaLista(self.__turnos)
     
     def obtener_recetas(self):
-        return self.__recetas.copy()
+        return VistaLista(self.__recetas)
+
+    def iterar_turnos(self):
+        return iter(self.__turnos)
+
+    def iterar_recetas(self):
+        return iter(self.__recetas)
     
     def __str__(self):
-        nombre_paciente = str(self.__paciente).split(':')[1].split(',')[0].strip()
-
-        resultado = f"Historia Clinica de {nombre_paciente}\n"
-        resultado += "=" * 50 + "\n"
+        # La version se lee antes de armar el texto: si cambia mientras tanto, no se reutiliza
+        version = self.__version
+        if self.__texto is None or self.__texto[0] != version:
+            self.__texto = (version, "".join(self.__partes()))
+        return self.__texto[1]
 
-        resultado += f"Turnos ({len(self.__turnos)}):\n"
-        if self.__turnos:
-            for i, turno in enumerate(self.__turnos, 1):
-                resultado += f"{i}. {turno}\n"
+    def render(self, archivo):
+        # Escribe la historia por partes sin armar el texto completo en memoria
+        if self.__texto is not None and self.__texto[0] == self.__version:
+            archivo.write(self.__texto[1])
         else:
-            resultado += "No hay turnos registrados\n"
+            archivo.writelines(self.__partes())
 
-        resultado += "\n"
+    def __partes(self):
+        turnos = tuple(self.__turnos)
+        recetas = tuple(self.__recetas)
 
-        resultado += f"Recetas ({len(self.__recetas)}):\n"
-        if self.__recetas:
-            for i, receta in enumerate(self.__recetas, 1):
-                resultado += f"{i}. {receta}\n"
+        yield f"Historia Clinica de {self.__paciente.obtener_nombre()}\n{'=' * 50}\n"
+
+        yield f"Turnos ({len(turnos)}):\n"
+        if turnos:
+            yield from (f"{i}. {turno}\n" for i, turno in enumerate(turnos, 1))
         else:
-            resultado += "No hay recetas registradas\n"
+            yield "No hay turnos registrados\n"
+
+        yield "\n"
 
-        return resultado
-            
\ No newline at end of file
+        yield f"Recetas ({len(recetas)}):\n"
+        if recetas:
+            yield from (f"{i}. {receta}\n" for i, receta in enumerate(recetas, 1))
+        else:
+            yield "No hay recetas registradas\n"
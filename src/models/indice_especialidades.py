@@ -0,0 +1,43 @@
+class IndiceEspecialidades:
+    # Indice invertido: (id de especialidad, dia) -> matriculas de los medicos que la
+    # atienden ese dia, y id de especialidad -> matriculas que la atienden algun dia.
+    # Se mantiene al guardar medicos y especialidades, asi buscar por especialidad
+    # no recorre todos los medicos
+    __slots__ = ("__por_dia", "__por_especialidad")
+
+    def __init__(self):
+        self.__por_dia = {}
+        self.__por_especialidad = {}
+
+    def agregar_medico(self, medico):
+        for especialidad in medico.obtener_especialidades():
+            self.agregar(medico, especialidad)
+
+    def agregar(self, medico, especialidad):
+        # Se llama con la especialidad ya agregada al medico. Un dia que ya tenia otra
+        # especialidad sigue con la anterior (igual que al agendar), por eso se consulta
+        # la tabla por dia del medico
+        matricula = medico.obtener_matricula()
+        id_especialidad = especialidad.obtener_id()
+
+        for indice in especialidad.obtener_indices_dias():
+            if medico.obtener_id_especialidad_para_indice(indice) != id_especialidad:
+                continue
+            self.__agregar(self.__por_dia, (id_especialidad, indice), matricula)
+            self.__agregar(self.__por_especialidad, id_especialidad, matricula)
+
+    def __agregar(self, indice, clave, matricula):
+        matriculas = indice.get(clave)
+        if matriculas is None:
+            matriculas = indice[clave] = set()
+        matriculas.add(matricula)
+
+    def obtener_matriculas(self, id_especialidad, indice_dia=None):
+        # Copia: el conjunto puede crecer mientras se recorre el resultado
+        if indice_dia is None:
+            return tuple(self.__por_especialidad.get(id_especialidad, ()))
+        return tuple(self.__por_dia.get((id_especialidad, indice_dia), ()))
+
+    def __len__(self):
+        # Cantidad de pares (medico, dia) indexados
+        return sum(len(matriculas) for matriculas in self.__por_dia.values())
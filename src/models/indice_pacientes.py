@@ -0,0 +1,131 @@
+import heapq
+import threading
+import unicodedata
+from collections import defaultdict
+from bisect import bisect_left, insort
+from math import isqrt
+
+# Separa el texto indexado del DNI dentro de cada clave; ordena antes que cualquier letra
+SEPARADOR = "\x00"
+# Las altas van primero a una lista ordenada chica; se pasan a la lista principal cuando
+# superan max(MINIMO_PENDIENTES, raiz cuadrada del tamaño del indice * FACTOR_PENDIENTES)
+MINIMO_PENDIENTES = 1024
+FACTOR_PENDIENTES = 16
+
+
+def _quitar_acentos(texto):
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(caracter for caracter in descompuesto if not unicodedata.combining(caracter))
+
+
+# Nombres y apellidos se repiten mucho: cada palabra distinta se normaliza una sola vez
+_PALABRAS_NORMALIZADAS = {}
+MAXIMO_PALABRAS_NORMALIZADAS = 1 << 18
+
+
+def _normalizar_palabra(palabra):
+    normalizada = palabra.casefold()
+    if not normalizada.isascii():
+        normalizada = _quitar_acentos(normalizada)
+    return normalizada
+
+
+def normalizar_nombre(texto):
+    # Sin acentos, sin distinguir mayusculas y con un solo espacio entre palabras
+    palabras = []
+    for palabra in texto.split():
+        normalizada = _PALABRAS_NORMALIZADAS.get(palabra)
+        if normalizada is None:
+            normalizada = _normalizar_palabra(palabra)
+            if len(_PALABRAS_NORMALIZADAS) < MAXIMO_PALABRAS_NORMALIZADAS:
+                _PALABRAS_NORMALIZADAS[palabra] = normalizada
+        palabras.append(normalizada)
+    return " ".join(palabras)
+
+
+class IndicePacientes:
+    # Busqueda por prefijo de nombre: listas ordenadas de claves "texto\0dni" con una
+    # clave por cada palabra del nombre hasta el final ("ana maria lopez", "maria lopez",
+    # "lopez"), asi un prefijo del apellido o del nombre completo se resuelve con bisect.
+    # Insertar en una lista de millones de claves mueve toda la cola: las altas se
+    # insertan en una lista chica de pendientes (tambien ordenada) y cada tanto se
+    # ordenan juntas con la principal. Las busquedas miran las dos.
+    # Indice secundario: fecha de nacimiento -> (nombre normalizado, DNI)
+    __slots__ = ("__claves", "__pendientes", "__por_nacimiento", "__lock")
+
+    def __init__(self):
+        self.__claves = []
+        self.__pendientes = []
+        self.__por_nacimiento = defaultdict(list)
+        self.__lock = threading.Lock()
+
+    def agregar(self, paciente):
+        nombre, claves = self.__indexar(paciente)
+        with self.__lock:
+            for clave in claves:
+                insort(self.__pendientes, clave)
+            self.__agregar_nacimiento(paciente, nombre)
+            self.__pasar_pendientes()
+
+    def agregar_varios(self, pacientes):
+        # Carga inicial o lote de importacion: se ordena una sola vez al final
+        indexados = [(paciente, *self.__indexar(paciente)) for paciente in pacientes]
+        with self.__lock:
+            for paciente, nombre, claves in indexados:
+                self.__pendientes.extend(claves)
+                self.__agregar_nacimiento(paciente, nombre)
+            self.__pendientes.sort()
+            self.__pasar_pendientes()
+
+    def __indexar(self, paciente):
+        sufijo = SEPARADOR + paciente.obtener_dni()
+        nombre = normalizar_nombre(paciente.obtener_nombre())
+        claves = [nombre + sufijo]
+        espacio = nombre.find(" ")
+        while espacio >= 0:
+            claves.append(nombre[espacio + 1:] + sufijo)
+            espacio = nombre.find(" ", espacio + 1)
+        return nombre, claves
+
+    def __agregar_nacimiento(self, paciente, nombre):
+        self.__por_nacimiento[paciente.obtener_fecha_nacimiento()].append((nombre, paciente.obtener_dni()))
+
+    def __pasar_pendientes(self):
+        if len(self.__pendientes) <= max(MINIMO_PENDIENTES, isqrt(len(self.__claves)) * FACTOR_PENDIENTES):
+            return
+        # Timsort detecta las dos partes ya ordenadas y solo las mezcla
+        self.__claves.extend(self.__pendientes)
+        self.__claves.sort()
+        self.__pendientes = []
+
+    def buscar(self, prefijo, limite):
+        # DNIs cuyo nombre tiene alguna palabra (o secuencia de palabras hasta el final)
+        # que empieza con el prefijo, en orden alfabetico y sin repetir
+        prefijo = normalizar_nombre(prefijo)
+        dnis = {}
+        with self.__lock:
+            for clave in heapq.merge(_rango(self.__claves, prefijo), _rango(self.__pendientes, prefijo)):
+                dnis.setdefault(clave[clave.rindex(SEPARADOR) + 1:], None)
+                if len(dnis) >= limite:
+                    break
+        return list(dnis)
+
+    def buscar_por_nacimiento(self, fecha_nacimiento, prefijo, limite):
+        # Pocos pacientes comparten fecha: se filtran por prefijo recorriendo los de esa fecha
+        prefijo = " " + normalizar_nombre(prefijo)
+        with self.__lock:
+            pacientes = list(self.__por_nacimiento.get(fecha_nacimiento.strip(), ()))
+        pacientes.sort()
+        return [dni for nombre, dni in pacientes if prefijo in " " + nombre][:limite]
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__claves) + len(self.__pendientes)
+
+
+def _rango(claves, prefijo):
+    # Recorre por indice desde la posicion encontrada (islice avanzaria desde el principio).
+    # Ningun caracter de un nombre normalizado es mayor a "\U0010ffff"
+    inicio = bisect_left(claves, prefijo)
+    fin = bisect_left(claves, prefijo + "\U0010ffff", inicio)
+    return (claves[i] for i in range(inicio, fin))
@@ -1,6 +1,8 @@
-from .especialidad import Especialidad
+from .especialidad import Especialidad, obtener_indice_dia
 
 class Medico:
+    __slots__ = ("__nombre", "__matricula", "__especialidades", "__especialidad_por_dia")
+
     def __init__(self, nombre, matricula):
         if not nombre or not nombre.strip():
             raise ValueError("El nombre del medico no debe estar vacio")
@@ -10,24 +12,53 @@ class Medico:
         self.__nombre = nombre.strip()
         self.__matricula = matricula.strip()
         self.__especialidades = []
+        # Tabla de 7 posiciones indexada por datetime.weekday()
+        self.__especialidad_por_dia = [None] * 7
 
     def agregar_especialidad(self, especialidad):
+        self.validar_especialidad_nueva(especialidad)
+        self.__especialidades.append(especialidad)
+
+        for indice in especialidad.obtener_indices_dias():
+            if self.__especialidad_por_dia[indice] is None:
+                self.__especialidad_por_dia[indice] = especialidad
+
+    def validar_especialidad_nueva(self, especialidad):
         if not isinstance(especialidad, Especialidad):
             raise ValueError("Debe proporcionar una especialidad valida")
         for esp_existente in self.__especialidades:
-            if esp_existente.obtener_especialidad() == especialidad.obtener_especialidad():
+            if esp_existente.obtener_id() == especialidad.obtener_id():
                 raise ValueError(f"La especialidad {especialidad.obtener_especialidad()} ya esta registrada para este medico.")
-        self.__especialidades.append(especialidad)
 
     def obtener_especialidad_para_dia(self, dia):
-        for especialidad in self.__especialidades:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-            
-        return None
+        indice = obtener_indice_dia(dia)
+        if indice is None:
+            return None
+        
+        return self.obtener_especialidad_para_indice(indice)
+
+    def obtener_especialidad_para_indice(self, indice):
+        especialidad = self.__especialidad_por_dia[indice]
+        if especialidad is None:
+            return None
+        
+        return especialidad.obtener_especialidad()
+    
+    def obtener_id_especialidad_para_indice(self, indice):
+        especialidad = self.__especialidad_por_dia[indice]
+        if especialidad is None:
+            return None
+        
+        return especialidad.obtener_id()
     
     def obtener_matricula(self):
         return self.__matricula
+
+    def obtener_nombre(self):
+        return self.__nombre
+
+    def obtener_especialidades(self):
+        return self.__especialidades.copy()
     
     def __str__(self):
         especialidades_str = ""
@@ -1,6 +1,19 @@
+import sys
 from datetime import datetime
+from functools import lru_cache
+
+@lru_cache(maxsize=65536)
+def _fecha_valida(fecha):
+    # Las fechas de nacimiento se repiten mucho en cargas masivas: cada texto se parsea una sola vez
+    try:
+        datetime.strptime(fecha, "%d/%m/%Y")
+        return True
+    except ValueError:
+        return False
 
 class Paciente:
+    __slots__ = ("__nombre", "__dni", "__fecha_nacimiento")
+
     def __init__(self, nombre, dni, fecha_nacimiento):
     
         if not nombre or not nombre.strip():
@@ -17,17 +30,20 @@ class Paciente:
         
         self.__nombre = nombre.strip()
         self.__dni = dni.strip()
-        self.__fecha_nacimiento = fecha_nacimiento.strip()
+        # Muchos pacientes comparten fecha de nacimiento: se guarda un solo texto por fecha
+        self.__fecha_nacimiento = sys.intern(fecha_nacimiento.strip())
     
     def _validar_fecha(self, fecha):
-        try:
-            datetime.strptime(fecha.strip(), "%d/%m/%Y")
-            return True
-        except ValueError:
-            return False
+        return _fecha_valida(fecha.strip())
     
     def obtener_dni(self):
         return self.__dni
+
+    def obtener_nombre(self):
+        return self.__nombre
+
+    def obtener_fecha_nacimiento(self):
+        return self.__fecha_nacimiento
     
     def __str__(self):
         return f"Paciente: {self.__nombre}, DNI: {self.__dni}, Nacimiento: {self.__fecha_nacimiento}"
\ No newline at end of file
@@ -0,0 +1,58 @@
+from itertools import islice
+
+_SIN_ELEMENTO = object()
+
+
+class Paginador:
+    # Recorre un iterable de a una pagina por vez sin cargarlo completo. Las paginas
+    # ya leidas se guardan para volver atras; la siguiente se lee recien cuando se pide
+    __slots__ = ("__iterador", "__tamano", "__paginas", "__actual", "__proximo")
+
+    def __init__(self, iterable, tamano=20):
+        if not isinstance(tamano, int) or tamano < 1:
+            raise ValueError("El tamaño de pagina debe ser un numero entero mayor a cero")
+
+        self.__iterador = iter(iterable)
+        self.__tamano = tamano
+        self.__paginas = []
+        self.__actual = -1
+        # Un elemento leido de antemano para saber si hay otra pagina
+        self.__proximo = next(self.__iterador, _SIN_ELEMENTO)
+
+    def siguiente(self):
+        # Devuelve la pagina siguiente (lista vacia si no hay mas) y pasa a ser la actual
+        if self.__actual + 1 < len(self.__paginas):
+            self.__actual += 1
+            return self.__paginas[self.__actual]
+        if self.__proximo is _SIN_ELEMENTO:
+            return []
+
+        pagina = [self.__proximo]
+        pagina.extend(islice(self.__iterador, self.__tamano - 1))
+        self.__proximo = next(self.__iterador, _SIN_ELEMENTO)
+        self.__paginas.append(pagina)
+        self.__actual += 1
+        return pagina
+
+    def anterior(self):
+        if self.__actual <= 0:
+            return []
+        self.__actual -= 1
+        return self.__paginas[self.__actual]
+
+    def hay_siguiente(self):
+        return self.__actual + 1 < len(self.__paginas) or self.__proximo is not _SIN_ELEMENTO
+
+    def hay_anterior(self):
+        return self.__actual > 0
+
+    def obtener_numero_pagina(self):
+        # 1 para la primera pagina; 0 antes de pedir alguna
+        return self.__actual + 1
+
+    def obtener_posicion_inicial(self):
+        # Posicion (desde 1) del primer elemento de la pagina actual, para numerar el listado
+        return self.__actual * self.__tamano + 1
+
+    def obtener_tamano(self):
+        return self.__tamano
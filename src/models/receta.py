@@ -1,9 +1,12 @@
+import sys
 from datetime import datetime
 from .paciente import Paciente
 from .medico import Medico
 
 class Receta:
-    def __init__(self, paciente, medico, medicamentos):
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__fecha", "__texto")
+
+    def __init__(self, paciente, medico, medicamentos, fecha=None):
         if paciente is None:
             raise ValueError("El paciente no debe ser None")
         if not isinstance(paciente, Paciente):
@@ -19,20 +22,32 @@ class Receta:
         for medicamento in medicamentos:
             if not medicamento or not medicamento.strip():
                 raise ValueError("Los medicamentos no pueden estar vacios")
+        if fecha is not None and not isinstance(fecha, datetime):
+            raise ValueError("Debe proporcionar una fecha valida")
             
         self.__paciente = paciente
         self.__medico = medico 
-        self.__medicamentos = [med.strip() for med in medicamentos]
-        self.__fecha = datetime.now()
+        self.__medicamentos = tuple(sys.intern(med.strip()) for med in medicamentos)
+        self.__fecha = fecha if fecha is not None else datetime.now()
+        # La receta no cambia despues de creada: el texto se arma la primera vez que se pide
+        self.__texto = None
 
-    def __str__(self):
-        fecha_str = self.__fecha.strftime("%d/%m/%Y %H:%M")
-        medicamentos_str = ", ".join(self.__medicamentos)
+    def obtener_paciente(self):
+        return self.__paciente
+
+    def obtener_medico(self):
+        return self.__medico
 
-        nombre_paciente = str(self.__paciente).split(':')[1].split(',')[0].strip()
-        nombre_medico = str(self.__medico).split(',')[0].replace("Dr. ", "").strip()
+    def obtener_medicamentos(self):
+        return list(self.__medicamentos)
 
-        return (f"Receta - Paciente: {nombre_paciente}"
-                f" - Medico: Dr. {nombre_medico}"
-                f" - Medicamentos: {medicamentos_str}"
-                f" - Fecha: {fecha_str}")
\ No newline at end of file
+    def obtener_fecha(self):
+        return self.__fecha
+
+    def __str__(self):
+        if self.__texto is None:
+            self.__texto = (f"Receta - Paciente: {self.__paciente.obtener_nombre()}"
+                            f" - Medico: Dr. {self.__medico.obtener_nombre()}"
+                            f" - Medicamentos: {', '.join(self.__medicamentos)}"
+                            f" - Fecha: {self.__fecha:%d/%m/%Y %H:%M}")
+        return self.__texto
@@ -0,0 +1,27 @@
+class RegistroIds:
+    # Asigna ids enteros densos (0, 1, 2, ...) a claves de texto en orden de
+    # registro, para indexar listas en lugar de diccionarios por texto
+    __slots__ = ("__ids", "__claves")
+
+    def __init__(self):
+        self.__ids = {}
+        self.__claves = []
+
+    def registrar(self, clave):
+        numero = self.__ids.get(clave)
+        if numero is None:
+            numero = self.__ids[clave] = len(self.__claves)
+            self.__claves.append(clave)
+        return numero
+
+    def obtener_id(self, clave):
+        return self.__ids.get(clave)
+
+    def obtener_clave(self, numero):
+        return self.__claves[numero]
+
+    def __contains__(self, clave):
+        return clave in self.__ids
+
+    def __len__(self):
+        return len(self.__claves)
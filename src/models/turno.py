@@ -1,9 +1,13 @@
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 from .paciente import Paciente
 from .medico import Medico
 
 class Turno:
-    def __init__(self, paciente, medico, fecha_hora, especialidad):
+    # Sin __dict__ por instancia: puede haber millones de turnos en memoria
+    __slots__ = ("__paciente", "__medico", "__fecha_hora", "__especialidad", "__duracion", "__fin", "__texto")
+
+    def __init__(self, paciente, medico, fecha_hora, especialidad, duracion=None):
         if paciente is None:
             raise ValueError("El paciente no puede ser None")
         if not isinstance(paciente, Paciente):
@@ -18,21 +22,41 @@ class Turno:
             raise ValueError("Debe proporcionar una fecha valida yyyy/mm/dd")
         if not especialidad or not especialidad.strip():
             raise ValueError("La especialidad no debe estar vacia")
+        if duracion is not None and (not isinstance(duracion, int) or duracion <= 0):
+            raise ValueError("La duracion debe ser un numero entero de minutos mayor a cero")
         
         self.__paciente = paciente
         self.__medico = medico
         self.__fecha_hora = fecha_hora
-        self.__especialidad = especialidad.strip()
+        self.__especialidad = sys.intern(especialidad.strip())
+        self.__duracion = duracion
+        self.__fin = fecha_hora if duracion is None else fecha_hora + timedelta(minutes=duracion)
+        # El turno no cambia despues de creado: el texto se arma la primera vez que se pide
+        self.__texto = None
+
+    def obtener_paciente(self):
+        return self.__paciente
 
     def obtener_medico(self):
         return self.__medico
     
     def obtener_fecha_hora(self):
         return self.__fecha_hora
+
+    def obtener_especialidad(self):
+        return self.__especialidad
+    
+    def obtener_duracion(self):
+        return self.__duracion
+
+    def obtener_fin(self):
+        return self.__fin
     
     def __str__(self):
-        fecha_str = self.__fecha_hora.strftime("%d/%m/%Y %H:%M")
-        return (f"Turno: {self.__paciente.obtener_dni()} ({str(self.__paciente).split(':')[1].split(',')[0].strip()}) "
-                f"con {str(self.__medico).split(',')[0]} "
-                f"- Especialidad: {self.__especialidad} "
-                f"- Fecha: {fecha_str}")
\ No newline at end of file
+        if self.__texto is None:
+            duracion_str = f" - Duracion: {self.__duracion} min" if self.__duracion is not None else ""
+            self.__texto = (f"Turno: {self.__paciente.obtener_dni()} ({self.__paciente.obtener_nombre()}) "
+                            f"con Dr. {self.__medico.obtener_nombre()} "
+                            f"- Especialidad: {self.__especialidad} "
+                            f"- Fecha: {self.__fecha_hora:%d/%m/%Y %H:%M}{duracion_str}")
+        return self.__texto
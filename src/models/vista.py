@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+
+class VistaLista(Sequence):
+    # Vista de solo lectura sobre una lista: no copia los elementos y muestra
+    # los cambios que se hagan despues en la lista original
+    __slots__ = ("__lista",)
+
+    def __init__(self, lista):
+        self.__lista = lista
+
+    def __len__(self):
+        return len(self.__lista)
+
+    def __getitem__(self, indice):
+        # Un slice devuelve una lista nueva solo con los elementos pedidos
+        return self.__lista[indice]
+
+    def __iter__(self):
+        return iter(self.__lista)
+
+    def __reversed__(self):
+        return reversed(self.__lista)
+
+    def __contains__(self, elemento):
+        return elemento in self.__lista
+
+    def index(self, elemento, *args):
+        return self.__lista.index(elemento, *args)
+
+    def count(self, elemento):
+        return self.__lista.count(elemento)
+
+    def __eq__(self, otro):
+        if isinstance(otro, VistaLista):
+            return self.__lista == otro.__lista
+        if isinstance(otro, list):
+            return self.__lista == otro
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"VistaLista({self.__lista!r})"
@@ -0,0 +1,115 @@
+import cProfile
+import functools
+import os
+import pstats
+import time
+import tracemalloc
+
+# Funciones mostradas por accion en el resumen
+CANTIDAD_RESUMEN = 15
+
+# Las asignaciones de tracemalloc y del propio perfilador no se informan
+_FILTROS_MEMORIA = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+
+class Perfilador:
+    # Corre cada accion envuelta bajo cProfile (y opcionalmente tracemalloc), guarda un
+    # archivo .prof por llamada en el directorio y acumula las estadisticas por accion
+    # para el resumen. Una accion que se llama dentro de otra ya perfilada no abre un
+    # perfil propio: cProfile no admite dos activos a la vez
+    def __init__(self, directorio, cantidad=CANTIDAD_RESUMEN, memoria=False, reloj=time.perf_counter):
+        if not directorio:
+            raise ValueError("El directorio de perfiles no debe estar vacio")
+        if cantidad < 1:
+            raise ValueError("La cantidad de funciones del resumen debe ser mayor a cero")
+
+        os.makedirs(directorio, exist_ok=True)
+        self.__directorio = directorio
+        self.__cantidad = cantidad
+        self.__memoria = memoria
+        self.__reloj = reloj
+        self.__llamadas = 0
+        self.__activo = False
+        # accion -> [llamadas, pstats.Stats acumuladas, asignaciones del ultimo llamado]
+        self.__acciones = {}
+
+    def perfilar(self, accion, funcion):
+        @functools.wraps(funcion)
+        def perfilada(*args, **kwargs):
+            if self.__activo:
+                return funcion(*args, **kwargs)
+            return self.__correr(accion, funcion, args, kwargs)
+
+        return perfilada
+
+    def __correr(self, accion, funcion, args, kwargs):
+        self.__activo = True
+        self.__llamadas += 1
+        ruta = os.path.join(self.__directorio, f"{self.__llamadas:04d}-{accion}.prof")
+        perfil = cProfile.Profile(self.__reloj)
+
+        iniciado_aca = self.__memoria and not tracemalloc.is_tracing()
+        if iniciado_aca:
+            tracemalloc.start()
+        antes = tracemalloc.take_snapshot().filter_traces(_FILTROS_MEMORIA) if self.__memoria else None
+
+        try:
+            perfil.enable()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                perfil.disable()
+        finally:
+            asignaciones = None
+            if antes is not None:
+                despues = tracemalloc.take_snapshot().filter_traces(_FILTROS_MEMORIA)
+                diferencias = despues.compare_to(antes, "lineno")
+                asignaciones = [diferencia for diferencia in diferencias if diferencia.size_diff > 0][:self.__cantidad]
+                if iniciado_aca:
+                    tracemalloc.stop()
+
+            perfil.dump_stats(ruta)
+            self.__acumular(accion, perfil, asignaciones)
+            self.__activo = False
+
+    def __acumular(self, accion, perfil, asignaciones):
+        datos = self.__acciones.get(accion)
+        if datos is None:
+            self.__acciones[accion] = [1, pstats.Stats(perfil), asignaciones]
+            return
+        datos[0] += 1
+        datos[1].add(perfil)
+        if asignaciones is not None:
+            datos[2] = asignaciones
+
+    def obtener_acciones(self):
+        # accion -> cantidad de llamadas perfiladas
+        return {accion: datos[0] for accion, datos in self.__acciones.items()}
+
+    def resumen(self):
+        # Por accion: llamadas, tiempo total y las funciones con mas tiempo acumulado
+        lineas = [f"Perfiles guardados en {self.__directorio}"]
+        for accion, (llamadas, estadisticas, asignaciones) in sorted(self.__acciones.items()):
+            lineas.append("")
+            lineas.append(f"{accion}: {llamadas} llamadas, {estadisticas.total_tt:.3f} s")
+            lineas.append(f"  {'llamadas':>10} {'propio s':>10} {'acumulado s':>12}  funcion")
+
+            funciones = sorted(estadisticas.stats.items(), key=lambda item: item[1][3], reverse=True)
+            for (archivo, linea, nombre), (_, cantidad, propio, acumulado, _) in funciones[:self.__cantidad]:
+                lineas.append(f"  {cantidad:>10} {propio:>10.4f} {acumulado:>12.4f}  "
+                              f"{_ubicacion(archivo, linea, nombre)}")
+
+            if asignaciones:
+                lineas.append("  memoria asignada (ultima llamada):")
+                for diferencia in asignaciones:
+                    marco = diferencia.traceback[0]
+                    lineas.append(f"  {diferencia.size_diff / 1024:>10.1f} KiB  {os.path.basename(marco.filename)}"
+                                  f":{marco.lineno}")
+        return "\n".join(lineas) + "\n"
+
+
+def _ubicacion(archivo, linea, nombre):
+    # Las funciones integradas aparecen con archivo "~"
+    if archivo == "~":
+        return nombre
+    return f"{nombre} ({os.path.basename(archivo)}:{linea})"
@@ -0,0 +1,266 @@
+import threading
+from array import array
+from collections import Counter, defaultdict
+from datetime import timedelta
+from ..models.especialidad import (
+    DIAS_SEMANA,
+    registrar_especialidad,
+    obtener_nombre_especialidad,
+    cantidad_especialidades
+)
+from ..models.registro_ids import RegistroIds
+from .snapshot import EPOCA, MICROSEGUNDO
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DIMENSIONES = ("medico", "paciente", "especialidad", "dia", "hora")
+
+MICROSEGUNDOS_HORA = 3_600_000_000
+MICROSEGUNDOS_DIA = 24 * MICROSEGUNDOS_HORA
+DIA_EPOCA = EPOCA.weekday()
+# Hasta esta cantidad de combinaciones se cuenta con un bincount denso
+MAXIMO_GRUPOS_DIRECTOS = 1 << 20
+
+
+def _a_entero(fecha):
+    return (fecha - EPOCA) // MICROSEGUNDO
+
+
+class ColumnasTurnos:
+    # Copia de los turnos en columnas paralelas de enteros de 64 bits (una fila por
+    # turno) para consultas de agregacion. Medicos y pacientes se guardan como ids
+    # densos propios y las especialidades con el id compartido de Especialidad.
+    # Con NumPy instalado las agregaciones se hacen vectorizadas sobre las mismas
+    # columnas, sin copiarlas
+    def __init__(self, usar_numpy=True):
+        self.__fechas = array("q")             # microsegundos desde EPOCA
+        self.__medicos = array("q")
+        self.__pacientes = array("q")
+        self.__especialidades = array("q")
+        self.__duraciones = array("q")         # minutos, 0 = sin duracion
+        self.__columnas = (self.__fechas, self.__medicos, self.__pacientes,
+                           self.__especialidades, self.__duraciones)
+
+        self.__ids = {"medico": RegistroIds(), "paciente": RegistroIds()}
+        self.__numpy = numpy if usar_numpy else None
+        # Una fila ocupa cinco arreglos y NumPy no deja agrandar un arreglo mientras
+        # lo esta leyendo: altas, bajas y consultas no se mezclan entre hilos
+        self.__lock = threading.Lock()
+
+    def agregar(self, matricula, dni, especialidad, fecha_hora, duracion=None):
+        with self.__lock:
+            self.__fechas.append(_a_entero(fecha_hora))
+            self.__medicos.append(self.__ids["medico"].registrar(matricula))
+            self.__pacientes.append(self.__ids["paciente"].registrar(dni))
+            # Las especialidades se agrupan sin distinguir mayusculas, igual que al agendar
+            self.__especialidades.append(registrar_especialidad(especialidad))
+            self.__duraciones.append(duracion or 0)
+
+    def eliminar(self, matricula, fecha_hora):
+        with self.__lock:
+            return self.__eliminar(matricula, fecha_hora)
+
+    def __eliminar(self, matricula, fecha_hora):
+        id_medico = self.__ids["medico"].obtener_id(matricula)
+        if id_medico is None:
+            return False
+
+        valor = _a_entero(fecha_hora)
+        i = -1
+        try:
+            while True:
+                i = self.__fechas.index(valor, i + 1)
+                if self.__medicos[i] == id_medico:
+                    break
+        except ValueError:
+            return False
+
+        # La ultima fila pasa al lugar de la eliminada: el orden no importa para agregar
+        ultima = len(self.__fechas) - 1
+        for columna in self.__columnas:
+            columna[i] = columna[ultima]
+            columna.pop()
+        return True
+
+    def eliminar_anteriores(self, fecha_hora):
+        # Una pasada por las columnas: quedan las filas con fecha >= fecha_hora
+        valor = _a_entero(fecha_hora)
+        with self.__lock:
+            quedan = [i for i, fecha in enumerate(self.__fechas) if fecha >= valor]
+            eliminadas = len(self.__fechas) - len(quedan)
+            if eliminadas:
+                for columna in self.__columnas:
+                    columna[:] = array("q", [columna[i] for i in quedan])
+            return eliminadas
+
+    def __len__(self):
+        return len(self.__fechas)
+
+    def contar(self, por, desde=None, hasta=None):
+        # por: una dimension o una tupla de dimensiones de DIMENSIONES. Devuelve
+        # {grupo: cantidad de turnos} solo con los grupos que tienen turnos
+        return self.__agrupar(self.__leer_dimensiones(por), None, desde, hasta)
+
+    def sumar_minutos(self, por, desde=None, hasta=None):
+        # Minutos ocupados por grupo (los turnos sin duracion no suman)
+        return self.__agrupar(self.__leer_dimensiones(por), self.__duraciones, desde, hasta)
+
+    def histograma(self, desde, hasta, intervalo):
+        # Cantidad de turnos por intervalo entre desde y hasta: [(inicio, cantidad), ...]
+        if desde >= hasta:
+            raise ValueError("El inicio del rango debe ser anterior al fin")
+        if intervalo <= timedelta(0):
+            raise ValueError("El intervalo debe ser mayor a cero")
+
+        inicio, fin = _a_entero(desde), _a_entero(hasta)
+        paso = intervalo // MICROSEGUNDO
+        cantidad = -(-(fin - inicio) // paso)
+
+        with self.__lock:
+            if self.__numpy is not None and self.__fechas:
+                np = self.__numpy
+                fechas = np.frombuffer(self.__fechas, dtype=np.int64)
+                seleccion = fechas[(fechas >= inicio) & (fechas < fin)]
+                conteos = np.bincount((seleccion - inicio) // paso, minlength=cantidad).tolist()
+                del fechas, seleccion
+            else:
+                conteos = [0] * cantidad
+                for fecha in self.__fechas:
+                    if inicio <= fecha < fin:
+                        conteos[(fecha - inicio) // paso] += 1
+
+        return [(desde + intervalo * i, conteo) for i, conteo in enumerate(conteos)]
+
+    def __leer_dimensiones(self, por):
+        dimensiones = (por,) if isinstance(por, str) else tuple(por)
+        if not dimensiones:
+            raise ValueError("Debe indicar al menos una dimension")
+        for dimension in dimensiones:
+            if dimension not in DIMENSIONES:
+                raise ValueError(f"Dimension invalida: {dimension} (use {', '.join(DIMENSIONES)})")
+        return dimensiones
+
+    def __agrupar(self, dimensiones, pesos, desde, hasta):
+        inicio = _a_entero(desde) if desde is not None else None
+        fin = _a_entero(hasta) if hasta is not None else None
+
+        with self.__lock:
+            if self.__numpy is not None and self.__fechas:
+                grupos = self.__agrupar_numpy(dimensiones, pesos, inicio, fin)
+            else:
+                grupos = self.__agrupar_python(dimensiones, pesos, inicio, fin)
+
+        resultado = {}
+        for codigos, valor in grupos:
+            etiquetas = tuple(self.__etiqueta(dimension, codigo) for dimension, codigo in zip(dimensiones, codigos))
+            resultado[etiquetas[0] if len(etiquetas) == 1 else etiquetas] = valor
+        return resultado
+
+    def __agrupar_numpy(self, dimensiones, pesos, inicio, fin):
+        # Cada combinacion de dimensiones se codifica en un solo entero y se cuenta con bincount
+        np = self.__numpy
+        fechas = np.frombuffer(self.__fechas, dtype=np.int64)
+
+        codigo = 0
+        tamanos = []
+        for dimension in dimensiones:
+            valores, tamano = self.__codigos_numpy(np, dimension, fechas)
+            codigo = codigo * tamano + valores
+            tamanos.append(tamano)
+        total = 1
+        for tamano in tamanos:
+            total *= tamano
+
+        seleccion = None
+        if inicio is not None:
+            seleccion = fechas >= inicio
+        if fin is not None:
+            seleccion = fechas < fin if seleccion is None else seleccion & (fechas < fin)
+
+        valores_pesos = np.frombuffer(pesos, dtype=np.int64) if pesos is not None else None
+        if seleccion is not None:
+            codigo = codigo[seleccion]
+            if valores_pesos is not None:
+                valores_pesos = valores_pesos[seleccion]
+
+        if total <= max(len(codigo), MAXIMO_GRUPOS_DIRECTOS):
+            conteos = np.bincount(codigo, weights=valores_pesos, minlength=total)
+            presentes = np.flatnonzero(conteos)
+            valores = conteos[presentes]
+        else:
+            # Demasiadas combinaciones posibles (por ejemplo paciente x medico):
+            # se cuentan solo las que aparecen
+            presentes, inversa = np.unique(codigo, return_inverse=True)
+            valores = np.bincount(inversa, weights=valores_pesos)
+
+        grupos = []
+        for grupo, valor in zip(presentes.tolist(), valores.tolist()):
+            valor = int(valor)
+            if not valor:
+                continue
+            codigos = []
+            for tamano in reversed(tamanos):
+                grupo, resto = divmod(grupo, tamano)
+                codigos.append(resto)
+            grupos.append((tuple(reversed(codigos)), valor))
+        return grupos
+
+    def __codigos_numpy(self, np, dimension, fechas):
+        if dimension == "dia":
+            return (fechas // MICROSEGUNDOS_DIA + DIA_EPOCA) % 7, 7
+        if dimension == "hora":
+            return (fechas // MICROSEGUNDOS_HORA) % 24, 24
+
+        columna = self.__columna(dimension)
+        tamano = cantidad_especialidades() if dimension == "especialidad" else len(self.__ids[dimension])
+        return np.frombuffer(columna, dtype=np.int64), max(tamano, 1)
+
+    def __agrupar_python(self, dimensiones, pesos, inicio, fin):
+        filas = None
+        if inicio is not None or fin is not None:
+            inicio = inicio if inicio is not None else -2 ** 63
+            fin = fin if fin is not None else 2 ** 63
+            filas = [fila for fila, fecha in enumerate(self.__fechas) if inicio <= fecha < fin]
+
+        valores_por_dimension = []
+        for dimension in dimensiones:
+            columna = self.__columna(dimension)
+            valores = columna if filas is None else [columna[fila] for fila in filas]
+            convertir = _CONVERSORES.get(dimension)
+            valores_por_dimension.append(map(convertir, valores) if convertir is not None else valores)
+        claves = zip(*valores_por_dimension)
+
+        if pesos is None:
+            return list(Counter(claves).items())
+
+        totales = defaultdict(int)
+        for clave, peso in zip(claves, pesos if filas is None else [pesos[fila] for fila in filas]):
+            totales[clave] += peso
+        return [(clave, valor) for clave, valor in totales.items() if valor]
+
+    def __columna(self, dimension):
+        if dimension in ("dia", "hora"):
+            return self.__fechas
+        if dimension == "medico":
+            return self.__medicos
+        if dimension == "paciente":
+            return self.__pacientes
+        return self.__especialidades
+
+    def __etiqueta(self, dimension, codigo):
+        if dimension == "dia":
+            return DIAS_SEMANA[codigo]
+        if dimension == "hora":
+            return codigo
+        if dimension == "especialidad":
+            return obtener_nombre_especialidad(codigo)
+        return self.__ids[dimension].obtener_clave(codigo)
+
+
+_CONVERSORES = {
+    "dia": lambda fecha: (fecha // MICROSEGUNDOS_DIA + DIA_EPOCA) % 7,
+    "hora": lambda fecha: (fecha // MICROSEGUNDOS_HORA) % 24,
+}
@@ -0,0 +1,168 @@
+import glob
+import json
+import os
+import threading
+
+codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+decodificar = json.JSONDecoder().decode
+
+EVENTO_GENERACION = "J"
+
+class Journal:
+    # Registro de solo agregado: un evento por linea, en JSON compacto.
+    # Los eventos pendientes se escriben juntos con un unico fsync (group commit).
+    # Al rotar, el archivo actual pasa a "<ruta>.<generacion>" y se empieza una
+    # generacion nueva; los segmentos viejos se borran cuando un snapshot los cubre
+    def __init__(self, ruta, tamano_lote=1):
+        if not ruta:
+            raise ValueError("La ruta del journal no debe estar vacia")
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a cero")
+        
+        self.__ruta = ruta
+        self.__tamano_lote = tamano_lote
+        self.__archivo = None
+        self.__pendientes = []
+        self.__registrados = 0
+        self.__confirmados = 0
+        self.__lock_pendientes = threading.Lock()
+        self.__lock_escritura = threading.Lock()
+        self.__generacion = self.__leer_generacion(ruta)
+
+    def obtener_ruta(self):
+        return self.__ruta
+
+    def obtener_generacion(self):
+        return self.__generacion
+
+    def obtener_registrados(self):
+        # Eventos registrados desde que se abrio el journal (confirmados o pendientes)
+        return self.__registrados
+
+    def leer(self, desde_generacion=0):
+        for generacion, ruta in self.__segmentos_anteriores():
+            if generacion >= desde_generacion:
+                yield from self.__leer_archivo(ruta)
+
+        yield from self.__leer_archivo(self.__ruta)
+
+    def registrar(self, evento):
+        linea = codificar(evento)
+
+        with self.__lock_pendientes:
+            self.__pendientes.append(linea)
+            self.__registrados += 1
+            numero = self.__registrados
+            completo = len(self.__pendientes) >= self.__tamano_lote
+
+        if completo:
+            self.__confirmar_hasta(numero)
+
+    def registrar_lote(self, eventos):
+        lineas = [codificar(evento) for evento in eventos]
+        if not lineas:
+            return
+
+        with self.__lock_pendientes:
+            self.__pendientes.extend(lineas)
+            self.__registrados += len(lineas)
+            numero = self.__registrados
+
+        self.__confirmar_hasta(numero)
+
+    def confirmar(self):
+        with self.__lock_pendientes:
+            numero = self.__registrados
+
+        self.__confirmar_hasta(numero)
+
+    def rotar(self):
+        self.confirmar()
+
+        with self.__lock_escritura:
+            if self.__archivo is not None:
+                self.__archivo.close()
+                self.__archivo = None
+
+            if os.path.exists(self.__ruta):
+                os.replace(self.__ruta, f"{self.__ruta}.{self.__generacion}")
+
+            self.__generacion += 1
+            self.__archivo = open(self.__ruta, "a", encoding="utf-8")
+            self.__archivo.write(codificar([EVENTO_GENERACION, self.__generacion]) + "\n")
+            self.__archivo.flush()
+            os.fsync(self.__archivo.fileno())
+
+        return self.__generacion
+
+    def descartar_anteriores(self, hasta_generacion):
+        for generacion, ruta in self.__segmentos_anteriores():
+            if generacion < hasta_generacion:
+                os.remove(ruta)
+
+    def cerrar(self):
+        self.confirmar()
+
+        with self.__lock_escritura:
+            if self.__archivo is not None:
+                self.__archivo.close()
+                self.__archivo = None
+
+    def __confirmar_hasta(self, numero):
+        with self.__lock_escritura:
+            # Otro hilo ya escribio este evento junto con los suyos
+            if self.__confirmados >= numero:
+                return
+            
+            with self.__lock_pendientes:
+                lineas = self.__pendientes
+                self.__pendientes = []
+                hasta = self.__registrados
+
+            if self.__archivo is None:
+                self.__archivo = open(self.__ruta, "a", encoding="utf-8")
+
+            self.__archivo.write("\n".join(lineas) + "\n")
+            self.__archivo.flush()
+            os.fsync(self.__archivo.fileno())
+            self.__confirmados = hasta
+
+    def __segmentos_anteriores(self):
+        segmentos = []
+        for ruta in glob.glob(glob.escape(self.__ruta) + ".*"):
+            sufijo = ruta[len(self.__ruta) + 1:]
+            if sufijo.isdigit():
+                segmentos.append((int(sufijo), ruta))
+        return sorted(segmentos)
+
+    def __leer_archivo(self, ruta):
+        if not os.path.exists(ruta):
+            return
+        
+        with open(ruta, "rb") as archivo:
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    # Escritura cortada por una caida: se descarta la ultima linea incompleta
+                    self.__truncar(ruta, os.path.getsize(ruta) - len(linea))
+                    return
+                
+                evento = decodificar(linea.decode("utf-8"))
+                if evento[0] != EVENTO_GENERACION:
+                    yield evento
+
+    def __leer_generacion(self, ruta):
+        if not os.path.exists(ruta):
+            return 0
+        
+        with open(ruta, "rb") as archivo:
+            linea = archivo.readline()
+
+        if linea.endswith(b"\n"):
+            evento = decodificar(linea.decode("utf-8"))
+            if evento[0] == EVENTO_GENERACION:
+                return evento[1]
+        return 0
+
+    def __truncar(self, ruta, posicion):
+        with open(ruta, "r+b") as archivo:
+            archivo.truncate(posicion)
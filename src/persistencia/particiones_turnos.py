@@ -0,0 +1,97 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+
+class ParticionesTurnos:
+    # Turnos agrupados por dia: cada particion es una lista de (fecha_hora, matricula, turno)
+    # ordenada por horario y los dias con turnos se guardan ordenados aparte. Una consulta
+    # por rango solo recorre las particiones de esos dias; archivar saca dias enteros.
+    # (fecha_hora, matricula) no se repite, asi que la tupla nunca compara turnos.
+    # Un mismo dia lo comparten todos los medicos y la Clinica concurrente solo toma el
+    # lock del medico: las particiones tienen su propio lock
+    __slots__ = ("__particiones", "__dias", "__cantidad", "__lock")
+
+    def __init__(self):
+        self.__particiones = {}
+        self.__dias = []
+        self.__cantidad = 0
+        self.__lock = threading.Lock()
+
+    def agregar(self, turno):
+        fecha_hora = turno.obtener_fecha_hora()
+        dia = fecha_hora.date()
+        entrada = (fecha_hora, turno.obtener_medico().obtener_matricula(), turno)
+
+        with self.__lock:
+            particion = self.__particiones.get(dia)
+            if particion is None:
+                particion = self.__particiones[dia] = []
+                insort(self.__dias, dia)
+
+            # Caso comun: el turno es el ultimo del dia
+            if not particion or entrada[:2] > particion[-1][:2]:
+                particion.append(entrada)
+            else:
+                particion.insert(bisect_left(particion, entrada[:2]), entrada)
+            self.__cantidad += 1
+
+    def eliminar(self, turno):
+        # El repositorio solo elimina turnos que agrego: si no esta, las particiones
+        # quedaron desincronizadas y no se sigue en silencio
+        fecha_hora = turno.obtener_fecha_hora()
+        dia = fecha_hora.date()
+        clave = (fecha_hora, turno.obtener_medico().obtener_matricula())
+
+        with self.__lock:
+            particion = self.__particiones.get(dia)
+            i = bisect_left(particion, clave) if particion is not None else 0
+            if particion is None or i == len(particion) or particion[i][:2] != clave:
+                raise ValueError(f"El turno de {clave[1]} en {fecha_hora} no esta en las particiones")
+
+            del particion[i]
+            self.__cantidad -= 1
+            if not particion:
+                del self.__particiones[dia]
+                del self.__dias[bisect_left(self.__dias, dia)]
+
+    def obtener_entre(self, desde, hasta):
+        # Turnos con desde <= fecha_hora < hasta en orden de horario (y matricula).
+        # Se copian bajo el lock: mientras se recorren otro hilo puede agendar
+        resultado = []
+        with self.__lock:
+            inicio = bisect_left(self.__dias, desde.date())
+            fin = bisect_right(self.__dias, hasta.date())
+            for dia in self.__dias[inicio:fin]:
+                particion = self.__particiones[dia]
+                i = bisect_left(particion, (desde,)) if dia == desde.date() else 0
+                j = bisect_left(particion, (hasta,)) if dia == hasta.date() else len(particion)
+                resultado.extend(entrada[2] for entrada in particion[i:j])
+        return resultado
+
+    def quitar_anteriores(self, hasta):
+        # Saca y devuelve, en orden, los turnos con fecha_hora < hasta: los dias
+        # anteriores completos y el comienzo del dia de hasta
+        quitados = []
+        with self.__lock:
+            fin = bisect_left(self.__dias, hasta.date())
+            for dia in self.__dias[:fin]:
+                quitados.extend(entrada[2] for entrada in self.__particiones.pop(dia))
+            del self.__dias[:fin]
+
+            particion = self.__particiones.get(hasta.date())
+            if particion is not None:
+                j = bisect_left(particion, (hasta,))
+                quitados.extend(entrada[2] for entrada in particion[:j])
+                del particion[:j]
+                if not particion:
+                    del self.__particiones[hasta.date()]
+                    del self.__dias[0]
+
+            self.__cantidad -= len(quitados)
+        return quitados
+
+    def obtener_cantidad_particiones(self):
+        return len(self.__dias)
+
+    def __len__(self):
+        return self.__cantidad
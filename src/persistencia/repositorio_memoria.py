@@ -0,0 +1,190 @@
+from contextlib import contextmanager
+from ..models.historia_clinica import HistoriaClinica
+from ..models.agenda_medico import AgendaMedico
+from ..models.registro_ids import RegistroIds
+from ..models.vista import VistaLista
+from .particiones_turnos import ParticionesTurnos
+
+
+def _filtrar(turnos, desde, hasta, paciente):
+    for turno in turnos:
+        fecha_hora = turno.obtener_fecha_hora()
+        if desde is not None and fecha_hora < desde:
+            continue
+        if hasta is not None and fecha_hora >= hasta:
+            continue
+        if paciente is not None and turno.obtener_paciente() is not paciente:
+            continue
+        yield turno
+
+
+class RepositorioMemoria:
+    # Guarda todo en memoria; es el almacenamiento por defecto de la Clinica.
+    # Cada DNI y matricula recibe un id entero denso al registrarse y los
+    # pacientes, medicos, historias y agendas se guardan en listas indexadas por ese id
+    def __init__(self):
+        self.__ids_pacientes = RegistroIds()
+        self.__ids_medicos = RegistroIds()
+        self.__pacientes = []
+        self.__historias_clinicas = []
+        self.__medicos = []
+        self.__agendas = []
+        self.__turnos = []
+        # Los mismos turnos agrupados por dia para consultas por rango de fechas
+        self.__particiones = ParticionesTurnos()
+
+        # Las vistas de solo lectura se crean una vez y siguen a los datos
+        self.__vista_pacientes = VistaLista(self.__pacientes)
+        self.__vista_medicos = VistaLista(self.__medicos)
+        self.__vista_turnos = VistaLista(self.__turnos)
+
+    # Pacientes
+
+    def agregar_paciente(self, paciente):
+        # El id se registra al final: un lector que ya lo ve encuentra la historia creada
+        self.__pacientes.append(paciente)
+        self.__historias_clinicas.append(HistoriaClinica(paciente))
+        self.__ids_pacientes.registrar(paciente.obtener_dni())
+
+    def obtener_paciente(self, dni):
+        numero = self.__ids_pacientes.obtener_id(dni)
+        return self.__pacientes[numero] if numero is not None else None
+
+    def obtener_pacientes(self):
+        return self.__vista_pacientes
+
+    def iterar_pacientes(self):
+        return iter(self.__pacientes)
+
+    # Medicos
+
+    def agregar_medico(self, medico):
+        self.__medicos.append(medico)
+        self.__agendas.append(AgendaMedico())
+        self.__ids_medicos.registrar(medico.obtener_matricula())
+
+    def agregar_especialidad(self, matricula, especialidad):
+        # El medico guardado es el mismo objeto que ya recibio la especialidad
+        pass
+
+    def obtener_medico(self, matricula):
+        numero = self.__ids_medicos.obtener_id(matricula)
+        return self.__medicos[numero] if numero is not None else None
+
+    def obtener_medicos(self):
+        return self.__vista_medicos
+
+    def iterar_medicos(self):
+        return iter(self.__medicos)
+
+    # Turnos
+
+    def agregar_turno(self, turno):
+        self.__turnos.append(turno)
+        self.__agenda(turno.obtener_medico().obtener_matricula()).agregar(turno)
+        self.__historia(turno.obtener_paciente().obtener_dni()).agregar_turno(turno)
+        self.__particiones.agregar(turno)
+
+    def eliminar_turno(self, matricula, fecha_hora):
+        turno = self.__agenda(matricula).eliminar(fecha_hora)
+        if turno is None:
+            return None
+        
+        self.__turnos.remove(turno)
+        self.__historia(turno.obtener_paciente().obtener_dni()).eliminar_turno(turno)
+        self.__particiones.eliminar(turno)
+        return turno
+
+    def obtener_turno(self, matricula, fecha_hora):
+        return self.__agenda(matricula).obtener_turno(fecha_hora)
+
+    def obtener_turno_superpuesto(self, matricula, inicio, fin):
+        return self.__agenda(matricula).obtener_superpuesto(inicio, fin)
+
+    def obtener_huecos(self, matricula, desde, hasta):
+        return self.__agenda(matricula).obtener_huecos(desde, hasta)
+
+    def obtener_turnos(self):
+        return self.__vista_turnos
+
+    def obtener_turnos_entre(self, desde, hasta, matricula=None):
+        # Ordenados por horario; solo se recorren los dias del rango (o la agenda del medico)
+        if matricula is not None:
+            return self.__agenda(matricula).obtener_entre(desde, hasta)
+        return self.__particiones.obtener_entre(desde, hasta)
+
+    def archivar_turnos(self, hasta):
+        # Saca de memoria los turnos que empiezan antes de hasta y los devuelve
+        quitados = self.__particiones.quitar_anteriores(hasta)
+        if not quitados:
+            return quitados
+
+        for agenda in self.__agendas:
+            agenda.quitar_anteriores(hasta)
+        por_paciente = {}
+        for turno in quitados:
+            por_paciente.setdefault(turno.obtener_paciente().obtener_dni(), []).append(turno)
+        for dni, turnos in por_paciente.items():
+            self.__historia(dni).eliminar_turnos(turnos)
+
+        archivados = {id(turno) for turno in quitados}
+        self.__turnos[:] = [turno for turno in self.__turnos if id(turno) not in archivados]
+        return quitados
+
+    def iterar_turnos(self, desde=None, hasta=None, matricula=None, dni=None):
+        # El tramo de la agenda se copia aca, al llamar, y no al empezar a recorrer:
+        # asi quien tenga el lock del medico lo lee completo
+        paciente = self.obtener_paciente(dni) if dni is not None else None
+        if matricula is not None:
+            return _filtrar(self.__agenda(matricula).obtener_entre(desde, hasta), None, None, paciente)
+        if dni is not None:
+            return _filtrar(self.__historia(dni).iterar_turnos(), desde, hasta, paciente)
+        return _filtrar(self.__turnos, desde, hasta, None)
+
+    # Recetas e historias clinicas
+
+    def agregar_receta(self, receta):
+        self.__historia(receta.obtener_paciente().obtener_dni()).agregar_receta(receta)
+
+    def obtener_recetas(self):
+        return [receta for historia in self.__historias_clinicas
+                for receta in historia.iterar_recetas()]
+
+    def iterar_recetas(self, desde=None, hasta=None, matricula=None, dni=None):
+        medico = self.obtener_medico(matricula) if matricula is not None else None
+        if matricula is not None and medico is None:
+            return
+        historias = [self.__historia(dni)] if dni is not None else self.__historias_clinicas
+
+        for historia in historias:
+            for receta in historia.iterar_recetas():
+                fecha = receta.obtener_fecha()
+                if desde is not None and fecha < desde:
+                    continue
+                if hasta is not None and fecha >= hasta:
+                    continue
+                if medico is not None and receta.obtener_medico() is not medico:
+                    continue
+                yield receta
+
+    def obtener_historia_clinica(self, dni):
+        numero = self.__ids_pacientes.obtener_id(dni)
+        return self.__historias_clinicas[numero] if numero is not None else None
+
+    def __historia(self, dni):
+        return self.__historias_clinicas[self.__ids_pacientes.obtener_id(dni)]
+
+    def __agenda(self, matricula):
+        return self.__agendas[self.__ids_medicos.obtener_id(matricula)]
+
+    # Transacciones
+
+    @contextmanager
+    def lote(self):
+        yield
+
+    def confirmar(self):
+        pass
+
+    def cerrar(self):
+        pass
@@ -0,0 +1,398 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.especialidad import Especialidad
+from ..models.turno import Turno
+from ..models.receta import Receta
+from ..models.historia_clinica import HistoriaClinica
+from ..models.agenda_medico import calcular_huecos
+from ..exceptions import TurnoOcupadoException
+from .snapshot import EPOCA, MICROSEGUNDO
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL UNIQUE,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL UNIQUE,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL,
+    UNIQUE (matricula, tipo)
+);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes(dni),
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    especialidad TEXT NOT NULL,
+    fecha_hora INTEGER NOT NULL,
+    fin INTEGER NOT NULL,
+    duracion INTEGER,
+    UNIQUE (matricula, fecha_hora)
+);
+CREATE INDEX IF NOT EXISTS turnos_dni ON turnos (dni);
+CREATE INDEX IF NOT EXISTS turnos_fecha_hora ON turnos (fecha_hora);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes(dni),
+    matricula TEXT NOT NULL REFERENCES medicos(matricula),
+    fecha INTEGER NOT NULL,
+    medicamentos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recetas_dni ON recetas (dni);
+"""
+
+# Las sentencias son constantes para que sqlite3 reutilice la version preparada
+# (cache de sentencias de la conexion) en cada llamada
+INSERTAR_PACIENTE = "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+OBTENER_PACIENTE = "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni = ?"
+OBTENER_PACIENTES = "SELECT nombre, dni, fecha_nacimiento FROM pacientes ORDER BY id"
+
+INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+OBTENER_MEDICO = "SELECT nombre, matricula FROM medicos WHERE matricula = ?"
+OBTENER_MEDICOS = "SELECT nombre, matricula FROM medicos ORDER BY id"
+INSERTAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)"
+OBTENER_ESPECIALIDADES = "SELECT tipo, dias FROM especialidades WHERE matricula = ? ORDER BY id"
+
+COLUMNAS_TURNO = "dni, matricula, especialidad, fecha_hora, duracion"
+INSERTAR_TURNO = ("INSERT INTO turnos (dni, matricula, especialidad, fecha_hora, fin, duracion) "
+                  "VALUES (?, ?, ?, ?, ?, ?)")
+ELIMINAR_TURNO = "DELETE FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+OBTENER_TURNO = f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+TURNO_ANTERIOR = (f"SELECT {COLUMNAS_TURNO}, fin FROM turnos WHERE matricula = ? AND fecha_hora <= ? "
+                  "ORDER BY fecha_hora DESC LIMIT 1")
+TURNO_SIGUIENTE = (f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE matricula = ? AND fecha_hora > ? "
+                   "AND fecha_hora < ? ORDER BY fecha_hora LIMIT 1")
+TURNOS_EN_RANGO = ("SELECT fecha_hora, fin FROM turnos WHERE matricula = ? AND fecha_hora > ? "
+                   "AND fecha_hora < ? ORDER BY fecha_hora")
+OBTENER_TURNOS = f"SELECT {COLUMNAS_TURNO} FROM turnos ORDER BY id"
+TURNOS_EN_RANGO_DE_MEDICO = (f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE matricula = ? AND fecha_hora >= ? "
+                             "AND fecha_hora < ? ORDER BY fecha_hora")
+TURNOS_ENTRE = (f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE fecha_hora >= ? AND fecha_hora < ? "
+                "ORDER BY fecha_hora, matricula")
+TURNOS_ANTERIORES = f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE fecha_hora < ? ORDER BY fecha_hora, matricula"
+ARCHIVAR_TURNOS = "DELETE FROM turnos WHERE fecha_hora < ?"
+TURNOS_DE_PACIENTE = f"SELECT {COLUMNAS_TURNO} FROM turnos WHERE dni = ? ORDER BY id"
+
+INSERTAR_RECETA = "INSERT INTO recetas (dni, matricula, fecha, medicamentos) VALUES (?, ?, ?, ?)"
+OBTENER_RECETAS = "SELECT dni, matricula, fecha, medicamentos FROM recetas ORDER BY id"
+RECETAS_DE_PACIENTE = "SELECT dni, matricula, fecha, medicamentos FROM recetas WHERE dni = ? ORDER BY id"
+
+# Filas leidas por vuelta al recorrer una consulta sin cargarla completa
+FILAS_POR_LECTURA = 500
+
+# Mensaje de sqlite3.IntegrityError cuando el medico ya tiene un turno en ese horario
+RESTRICCION_TURNO_UNICO = "UNIQUE constraint failed: turnos.matricula, turnos.fecha_hora"
+
+
+def _a_entero(fecha):
+    return (fecha - EPOCA) // MICROSEGUNDO
+
+def _a_fecha(entero):
+    return EPOCA + timedelta(microseconds=entero)
+
+def _filtros(columna_fecha, desde, hasta, matricula, dni):
+    condiciones = []
+    parametros = []
+    if matricula is not None:
+        condiciones.append("matricula = ?")
+        parametros.append(matricula)
+    if dni is not None:
+        condiciones.append("dni = ?")
+        parametros.append(dni)
+    if desde is not None:
+        condiciones.append(f"{columna_fecha} >= ?")
+        parametros.append(_a_entero(desde))
+    if hasta is not None:
+        condiciones.append(f"{columna_fecha} < ?")
+        parametros.append(_a_entero(hasta))
+    
+    if not condiciones:
+        return "", ()
+    return " WHERE " + " AND ".join(condiciones), tuple(parametros)
+
+
+class RepositorioSQLite:
+    # Los datos viven en un archivo SQLite; solo se cargan en memoria los objetos
+    # que pide cada consulta. Las escrituras se confirman cada tamano_lote
+    # operaciones o al salir de un bloque lote()
+    def __init__(self, ruta, tamano_lote=1):
+        if not ruta:
+            raise ValueError("La ruta de la base de datos no debe estar vacia")
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a cero")
+        
+        self.__conexion = sqlite3.connect(ruta, check_same_thread=False, cached_statements=64)
+        self.__conexion.execute("PRAGMA journal_mode=WAL")
+        self.__conexion.execute("PRAGMA foreign_keys=ON")
+        self.__conexion.executescript(ESQUEMA)
+
+        self.__tamano_lote = tamano_lote
+        self.__sin_confirmar = 0
+        self.__en_lote = 0
+        self.__lock = threading.RLock()
+
+    # Pacientes
+
+    def agregar_paciente(self, paciente):
+        self.__escribir(INSERTAR_PACIENTE, (paciente.obtener_dni(), paciente.obtener_nombre(),
+                                            paciente.obtener_fecha_nacimiento()))
+
+    def obtener_paciente(self, dni):
+        fila = self.__consultar_uno(OBTENER_PACIENTE, (dni,))
+        return Paciente(*fila) if fila is not None else None
+
+    def obtener_pacientes(self):
+        return [Paciente(*fila) for fila in self.__consultar(OBTENER_PACIENTES, ())]
+
+    def iterar_pacientes(self):
+        for filas in self.__recorrer(OBTENER_PACIENTES, ()):
+            yield from (Paciente(*fila) for fila in filas)
+
+    # Medicos
+
+    def agregar_medico(self, medico):
+        matricula = medico.obtener_matricula()
+
+        with self.lote():
+            self.__escribir(INSERTAR_MEDICO, (matricula, medico.obtener_nombre()))
+            for especialidad in medico.obtener_especialidades():
+                self.agregar_especialidad(matricula, especialidad)
+
+    def agregar_especialidad(self, matricula, especialidad):
+        self.__escribir(INSERTAR_ESPECIALIDAD, (matricula, especialidad.obtener_especialidad(),
+                                                ",".join(especialidad.obtener_dias())))
+
+    def obtener_medico(self, matricula):
+        fila = self.__consultar_uno(OBTENER_MEDICO, (matricula,))
+        return self.__crear_medico(fila) if fila is not None else None
+
+    def obtener_medicos(self):
+        return [self.__crear_medico(fila) for fila in self.__consultar(OBTENER_MEDICOS, ())]
+
+    def iterar_medicos(self):
+        # Las especialidades de cada medico se leen recien cuando se entrega
+        for filas in self.__recorrer(OBTENER_MEDICOS, ()):
+            yield from (self.__crear_medico(fila) for fila in filas)
+
+    # Turnos
+
+    def agregar_turno(self, turno):
+        parametros = (turno.obtener_paciente().obtener_dni(), turno.obtener_medico().obtener_matricula(),
+                      turno.obtener_especialidad(), _a_entero(turno.obtener_fecha_hora()),
+                      _a_entero(turno.obtener_fin()), turno.obtener_duracion())
+        try:
+            self.__escribir(INSERTAR_TURNO, parametros)
+        except sqlite3.IntegrityError as e:
+            # Solo la restriccion UNIQUE (matricula, fecha_hora) es un turno duplicado; las
+            # claves foraneas (paciente o medico que no estan guardados) siguen como error
+            if str(e) != RESTRICCION_TURNO_UNICO:
+                raise
+            raise TurnoOcupadoException(
+                f"El medico ya tiene un turno agendado en {turno.obtener_fecha_hora()}"
+            ) from e
+
+    def eliminar_turno(self, matricula, fecha_hora):
+        turno = self.obtener_turno(matricula, fecha_hora)
+        if turno is not None:
+            self.__escribir(ELIMINAR_TURNO, (matricula, _a_entero(fecha_hora)))
+        return turno
+
+    def obtener_turno(self, matricula, fecha_hora):
+        fila = self.__consultar_uno(OBTENER_TURNO, (matricula, _a_entero(fecha_hora)))
+        return self.__crear_turnos([fila])[0] if fila is not None else None
+
+    def obtener_turno_superpuesto(self, matricula, inicio, fin):
+        inicio_entero = _a_entero(inicio)
+
+        anterior = self.__consultar_uno(TURNO_ANTERIOR, (matricula, inicio_entero))
+        if anterior is not None and (anterior[3] == inicio_entero or anterior[5] > inicio_entero):
+            return self.__crear_turnos([anterior[:5]])[0]
+
+        siguiente = self.__consultar_uno(TURNO_SIGUIENTE, (matricula, inicio_entero, _a_entero(fin)))
+        if siguiente is not None:
+            return self.__crear_turnos([siguiente])[0]
+        return None
+
+    def obtener_huecos(self, matricula, desde, hasta):
+        desde_entero = _a_entero(desde)
+        intervalos = []
+
+        anterior = self.__consultar_uno(TURNO_ANTERIOR, (matricula, desde_entero))
+        if anterior is not None:
+            intervalos.append((_a_fecha(anterior[3]), _a_fecha(anterior[5])))
+        for inicio, fin in self.__consultar(TURNOS_EN_RANGO, (matricula, desde_entero, _a_entero(hasta))):
+            intervalos.append((_a_fecha(inicio), _a_fecha(fin)))
+
+        return calcular_huecos(intervalos, desde, hasta)
+
+    def obtener_turnos(self):
+        return self.__crear_turnos(self.__consultar(OBTENER_TURNOS, ()))
+
+    def obtener_turnos_entre(self, desde, hasta, matricula=None):
+        # El indice por fecha_hora hace de particion: solo se leen las filas del rango
+        if matricula is not None:
+            filas = self.__consultar(TURNOS_EN_RANGO_DE_MEDICO, (matricula, _a_entero(desde), _a_entero(hasta)))
+        else:
+            filas = self.__consultar(TURNOS_ENTRE, (_a_entero(desde), _a_entero(hasta)))
+        return self.__crear_turnos(filas)
+
+    def archivar_turnos(self, hasta):
+        with self.lote():
+            turnos = self.__crear_turnos(self.__consultar(TURNOS_ANTERIORES, (_a_entero(hasta),)))
+            self.__escribir(ARCHIVAR_TURNOS, (_a_entero(hasta),))
+        return turnos
+
+    def iterar_turnos(self, desde=None, hasta=None, matricula=None, dni=None):
+        condiciones, parametros = _filtros("fecha_hora", desde, hasta, matricula, dni)
+        # Con matricula el indice UNIQUE (matricula, fecha_hora) ya entrega el orden cronologico
+        orden = "fecha_hora" if matricula is not None else "id"
+        sentencia = f"SELECT {COLUMNAS_TURNO} FROM turnos{condiciones} ORDER BY {orden}"
+
+        for filas in self.__recorrer(sentencia, parametros):
+            yield from self.__crear_turnos(filas)
+
+    # Recetas e historias clinicas
+
+    def agregar_receta(self, receta):
+        self.__escribir(INSERTAR_RECETA, (receta.obtener_paciente().obtener_dni(),
+                                          receta.obtener_medico().obtener_matricula(),
+                                          _a_entero(receta.obtener_fecha()),
+                                          json.dumps(receta.obtener_medicamentos(), ensure_ascii=False)))
+
+    def obtener_recetas(self):
+        return self.__crear_recetas(self.__consultar(OBTENER_RECETAS, ()))
+
+    def iterar_recetas(self, desde=None, hasta=None, matricula=None, dni=None):
+        condiciones, parametros = _filtros("fecha", desde, hasta, matricula, dni)
+        sentencia = f"SELECT dni, matricula, fecha, medicamentos FROM recetas{condiciones} ORDER BY id"
+
+        for filas in self.__recorrer(sentencia, parametros):
+            yield from self.__crear_recetas(filas)
+
+    def obtener_historia_clinica(self, dni):
+        paciente = self.obtener_paciente(dni)
+        if paciente is None:
+            return None
+        
+        historia = HistoriaClinica(paciente)
+        for turno in self.__crear_turnos(self.__consultar(TURNOS_DE_PACIENTE, (dni,)), {dni: paciente}):
+            historia.agregar_turno(turno)
+        for receta in self.__crear_recetas(self.__consultar(RECETAS_DE_PACIENTE, (dni,)), {dni: paciente}):
+            historia.agregar_receta(receta)
+        return historia
+
+    # Transacciones
+
+    @contextmanager
+    def lote(self):
+        # Agrupa todas las escrituras del bloque en una sola transaccion
+        with self.__lock:
+            # Lo pendiente de antes del lote se confirma aparte: si el lote falla,
+            # el rollback solo debe deshacer lo escrito dentro del bloque
+            if self.__en_lote == 0 and self.__sin_confirmar > 0:
+                self.confirmar()
+            self.__en_lote += 1
+            try:
+                yield
+            except BaseException:
+                self.__en_lote -= 1
+                if self.__en_lote == 0:
+                    self.__conexion.rollback()
+                    self.__sin_confirmar = 0
+                raise
+            
+            self.__en_lote -= 1
+            if self.__en_lote == 0:
+                self.confirmar()
+
+    def confirmar(self):
+        with self.__lock:
+            self.__conexion.commit()
+            self.__sin_confirmar = 0
+
+    def cerrar(self):
+        with self.__lock:
+            self.__conexion.commit()
+            self.__conexion.close()
+
+    def __escribir(self, sentencia, parametros):
+        with self.__lock:
+            self.__conexion.execute(sentencia, parametros)
+            self.__sin_confirmar += 1
+            if self.__en_lote == 0 and self.__sin_confirmar >= self.__tamano_lote:
+                self.confirmar()
+
+    def __consultar(self, sentencia, parametros):
+        with self.__lock:
+            return self.__conexion.execute(sentencia, parametros).fetchall()
+
+    def __consultar_uno(self, sentencia, parametros):
+        with self.__lock:
+            return self.__conexion.execute(sentencia, parametros).fetchone()
+
+    def __recorrer(self, sentencia, parametros):
+        # Entrega la consulta de a FILAS_POR_LECTURA filas; el lock se toma solo
+        # mientras se lee cada tanda
+        with self.__lock:
+            cursor = self.__conexion.execute(sentencia, parametros)
+        try:
+            while True:
+                with self.__lock:
+                    filas = cursor.fetchmany(FILAS_POR_LECTURA)
+                if not filas:
+                    return
+                yield filas
+        finally:
+            cursor.close()
+
+    def __crear_medico(self, fila):
+        medico = Medico(*fila)
+        for tipo, dias in self.__consultar(OBTENER_ESPECIALIDADES, (fila[1],)):
+            medico.agregar_especialidad(Especialidad(tipo, dias.split(",")))
+        return medico
+
+    def __crear_turnos(self, filas, pacientes=None):
+        # Cada paciente y medico se construye una sola vez por consulta
+        pacientes = pacientes if pacientes is not None else {}
+        medicos = {}
+        turnos = []
+
+        for dni, matricula, especialidad, fecha_hora, duracion in filas:
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = pacientes[dni] = self.obtener_paciente(dni)
+            medico = medicos.get(matricula)
+            if medico is None:
+                medico = medicos[matricula] = self.obtener_medico(matricula)
+            
+            turnos.append(Turno(paciente, medico, _a_fecha(fecha_hora), especialidad, duracion))
+        return turnos
+
+    def __crear_recetas(self, filas, pacientes=None):
+        pacientes = pacientes if pacientes is not None else {}
+        medicos = {}
+        recetas = []
+
+        for dni, matricula, fecha, medicamentos in filas:
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = pacientes[dni] = self.obtener_paciente(dni)
+            medico = medicos.get(matricula)
+            if medico is None:
+                medico = medicos[matricula] = self.obtener_medico(matricula)
+            
+            recetas.append(Receta(paciente, medico, json.loads(medicamentos), _a_fecha(fecha)))
+        return recetas
@@ -0,0 +1,170 @@
+import os
+import struct
+import sys
+from datetime import datetime, timedelta
+
+MAGIA = b"CLSN"
+VERSION = 1
+
+# Todos los textos se guardan una sola vez en una tabla y los registros los
+# referencian por indice (uint32). Las fechas van como microsegundos desde EPOCA
+CABECERA = struct.Struct("<4sHQ")         # magia, version, generacion del journal
+CONTADOR = struct.Struct("<I")
+PACIENTE = struct.Struct("<III")          # nombre, dni, fecha de nacimiento
+MEDICO = struct.Struct("<IIH")            # nombre, matricula, cantidad de especialidades
+ESPECIALIDAD = struct.Struct("<IB")       # tipo, cantidad de dias (seguido de los dias)
+TURNO = struct.Struct("<IIIqI")           # dni, matricula, especialidad, fecha, duracion (0 = sin duracion)
+RECETA = struct.Struct("<IIqH")           # dni, matricula, fecha, cantidad de medicamentos
+INDICE = struct.Struct("<I")
+
+EPOCA = datetime(1970, 1, 1)
+MICROSEGUNDO = timedelta(microseconds=1)
+
+class Snapshot:
+    def __init__(self, ruta):
+        if not ruta:
+            raise ValueError("La ruta del snapshot no debe estar vacia")
+        
+        self.__ruta = ruta
+
+    def obtener_ruta(self):
+        return self.__ruta
+
+    def existe(self):
+        return os.path.exists(self.__ruta)
+
+    def obtener_generacion(self):
+        if not self.existe():
+            return 0
+        
+        with open(self.__ruta, "rb") as archivo:
+            return self.__leer_cabecera(archivo.read(CABECERA.size))
+
+    def escribir(self, pacientes, medicos, turnos, recetas, generacion):
+        # medicos es una lista de pares (medico, especialidades) tomada al capturar el estado
+        textos = {}
+
+        def indice(texto):
+            numero = textos.get(texto)
+            if numero is None:
+                numero = textos[texto] = len(textos)
+            return numero
+
+        cuerpo = bytearray()
+
+        cuerpo += CONTADOR.pack(len(pacientes))
+        for paciente in pacientes:
+            cuerpo += PACIENTE.pack(indice(paciente.obtener_nombre()), indice(paciente.obtener_dni()),
+                                    indice(paciente.obtener_fecha_nacimiento()))
+
+        cuerpo += CONTADOR.pack(len(medicos))
+        for medico, especialidades in medicos:
+            cuerpo += MEDICO.pack(indice(medico.obtener_nombre()), indice(medico.obtener_matricula()),
+                                  len(especialidades))
+            for especialidad in especialidades:
+                dias = especialidad.obtener_dias()
+                cuerpo += ESPECIALIDAD.pack(indice(especialidad.obtener_especialidad()), len(dias))
+                for dia in dias:
+                    cuerpo += INDICE.pack(indice(dia))
+
+        cuerpo += CONTADOR.pack(len(turnos))
+        empaquetar_turno = TURNO.pack
+        for turno in turnos:
+            cuerpo += empaquetar_turno(indice(turno.obtener_paciente().obtener_dni()),
+                                       indice(turno.obtener_medico().obtener_matricula()),
+                                       indice(turno.obtener_especialidad()),
+                                       (turno.obtener_fecha_hora() - EPOCA) // MICROSEGUNDO,
+                                       turno.obtener_duracion() or 0)
+
+        cuerpo += CONTADOR.pack(len(recetas))
+        for receta in recetas:
+            medicamentos = receta.obtener_medicamentos()
+            cuerpo += RECETA.pack(indice(receta.obtener_paciente().obtener_dni()),
+                                  indice(receta.obtener_medico().obtener_matricula()),
+                                  (receta.obtener_fecha() - EPOCA) // MICROSEGUNDO, len(medicamentos))
+            for medicamento in medicamentos:
+                cuerpo += INDICE.pack(indice(medicamento))
+
+        temporal = self.__ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(CABECERA.pack(MAGIA, VERSION, generacion))
+            archivo.write(CONTADOR.pack(len(textos)))
+            for texto in textos:
+                codificado = texto.encode("utf-8")
+                archivo.write(CONTADOR.pack(len(codificado)))
+                archivo.write(codificado)
+            archivo.write(cuerpo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+
+        # El snapshot anterior sigue siendo valido hasta que el nuevo esta completo
+        os.replace(temporal, self.__ruta)
+
+    def leer(self):
+        # Devuelve los mismos eventos que el journal, con las fechas ya convertidas
+        if not self.existe():
+            return
+        
+        with open(self.__ruta, "rb") as archivo:
+            datos = memoryview(archivo.read())
+
+        self.__leer_cabecera(datos[:CABECERA.size])
+        posicion = CABECERA.size
+
+        (cantidad,) = CONTADOR.unpack_from(datos, posicion)
+        posicion += CONTADOR.size
+        textos = []
+        for _ in range(cantidad):
+            (largo,) = CONTADOR.unpack_from(datos, posicion)
+            posicion += CONTADOR.size
+            textos.append(sys.intern(str(datos[posicion:posicion + largo], "utf-8")))
+            posicion += largo
+
+        (cantidad,) = CONTADOR.unpack_from(datos, posicion)
+        posicion += CONTADOR.size
+        fin = posicion + cantidad * PACIENTE.size
+        for nombre, dni, fecha_nacimiento in PACIENTE.iter_unpack(datos[posicion:fin]):
+            yield ("P", textos[nombre], textos[dni], textos[fecha_nacimiento])
+        posicion = fin
+
+        (cantidad,) = CONTADOR.unpack_from(datos, posicion)
+        posicion += CONTADOR.size
+        for _ in range(cantidad):
+            nombre, matricula, cantidad_especialidades = MEDICO.unpack_from(datos, posicion)
+            posicion += MEDICO.size
+            yield ("M", textos[nombre], textos[matricula])
+
+            for _ in range(cantidad_especialidades):
+                tipo, cantidad_dias = ESPECIALIDAD.unpack_from(datos, posicion)
+                posicion += ESPECIALIDAD.size
+                dias = [textos[dia] for dia in struct.unpack_from(f"<{cantidad_dias}I", datos, posicion)]
+                posicion += cantidad_dias * INDICE.size
+                yield ("E", textos[matricula], textos[tipo], dias)
+
+        (cantidad,) = CONTADOR.unpack_from(datos, posicion)
+        posicion += CONTADOR.size
+        fin = posicion + cantidad * TURNO.size
+        for dni, matricula, especialidad, fecha, duracion in TURNO.iter_unpack(datos[posicion:fin]):
+            yield ("T", textos[dni], textos[matricula], textos[especialidad],
+                   EPOCA + timedelta(microseconds=fecha), duracion or None)
+        posicion = fin
+
+        (cantidad,) = CONTADOR.unpack_from(datos, posicion)
+        posicion += CONTADOR.size
+        for _ in range(cantidad):
+            dni, matricula, fecha, cantidad_medicamentos = RECETA.unpack_from(datos, posicion)
+            posicion += RECETA.size
+            medicamentos = [textos[i] for i in struct.unpack_from(f"<{cantidad_medicamentos}I", datos, posicion)]
+            posicion += cantidad_medicamentos * INDICE.size
+            yield ("R", textos[dni], textos[matricula], medicamentos, EPOCA + timedelta(microseconds=fecha))
+
+    def __leer_cabecera(self, datos):
+        if len(datos) < CABECERA.size:
+            raise ValueError(f"Snapshot invalido: {self.__ruta}")
+        
+        magia, version, generacion = CABECERA.unpack(datos)
+        if magia != MAGIA:
+            raise ValueError(f"Snapshot invalido: {self.__ruta}")
+        if version != VERSION:
+            raise ValueError(f"Version de snapshot no soportada: {version}")
+        return generacion
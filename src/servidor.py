@@ -0,0 +1,168 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from .exportacion import COLUMNAS_TURNOS, COLUMNAS_RECETAS, filas_turnos, filas_recetas
+from .models.paciente import Paciente
+from .exceptions import (
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    RecetaInvalidaException,
+    TurnoNoEncontradoException
+)
+
+# Protocolo de lineas: cada solicitud es un objeto JSON en una linea
+#   {"id": 1, "accion": "agendar_turno", "datos": {...}}
+# y cada respuesta tambien, en el mismo orden en que llegaron las solicitudes
+#   {"id": 1, "ok": true, "resultado": ...}
+#   {"id": 1, "ok": false, "error": "TurnoOcupadoException", "mensaje": "..."}
+
+ERRORES_CLINICA = (
+    ValueError,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    RecetaInvalidaException,
+    TurnoNoEncontradoException
+)
+
+# Tamaño maximo de una linea de solicitud
+LIMITE_LINEA = 1 << 20
+
+_codificador = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_decodificador = json.JSONDecoder()
+
+
+def historia_a_diccionario(historia):
+    paciente = historia.obtener_paciente()
+    return {
+        "paciente": {"nombre": paciente.obtener_nombre(), "dni": paciente.obtener_dni(),
+                     "fecha_nacimiento": paciente.obtener_fecha_nacimiento()},
+        "turnos": [dict(zip(COLUMNAS_TURNOS, fila)) for fila in filas_turnos(historia.iterar_turnos())],
+        "recetas": [dict(zip(COLUMNAS_RECETAS, fila)) for fila in filas_recetas(historia.iterar_recetas())],
+    }
+
+
+class ServidorClinica:
+    # Atiende muchas conexiones en un solo event loop. Cada operacion sobre la
+    # Clinica (que puede esperar el fsync del journal o a SQLite) corre en un
+    # pool de hilos, por eso la Clinica tiene que crearse con concurrente=True
+    def __init__(self, clinica, hilos=32):
+        if hilos < 1:
+            raise ValueError("La cantidad de hilos debe ser mayor a cero")
+
+        self.__clinica = clinica
+        self.__ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="clinica")
+        self.__servidor = None
+        self.__acciones = {
+            "agregar_paciente": self.__agregar_paciente,
+            "agendar_turno": self.__agendar_turno,
+            "emitir_receta": self.__emitir_receta,
+            "obtener_historia_clinica": self.__obtener_historia_clinica,
+            "obtener_agenda_del_dia": self.__obtener_agenda_del_dia,
+            "metricas": self.__metricas,
+        }
+
+    async def iniciar(self, host="127.0.0.1", puerto=8765):
+        self.__servidor = await asyncio.start_server(self.__atender, host, puerto, limit=LIMITE_LINEA,
+                                                     backlog=4096)
+        return self.obtener_direccion()
+
+    def obtener_direccion(self):
+        if self.__servidor is None:
+            raise ValueError("El servidor no esta iniciado")
+        return self.__servidor.sockets[0].getsockname()[:2]
+
+    async def servir(self):
+        await self.__servidor.serve_forever()
+
+    async def cerrar(self):
+        if self.__servidor is not None:
+            self.__servidor.close()
+            await self.__servidor.wait_closed()
+            self.__servidor = None
+        self.__ejecutor.shutdown(wait=True)
+
+    async def __atender(self, lector, escritor):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:
+                    # La linea supera LIMITE_LINEA: no se puede seguir leyendo la conexion
+                    escritor.write(self.__error(None, "SolicitudInvalida", "Solicitud demasiado grande"))
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+
+                escritor.write(await self.__responder(loop, linea))
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def __responder(self, loop, linea):
+        try:
+            solicitud = _decodificador.decode(linea.decode("utf-8"))
+        except ValueError:
+            return self.__error(None, "SolicitudInvalida", "La solicitud no es JSON valido")
+        if not isinstance(solicitud, dict):
+            return self.__error(None, "SolicitudInvalida", "La solicitud debe ser un objeto JSON")
+
+        identificador = solicitud.get("id")
+        accion = self.__acciones.get(solicitud.get("accion"))
+        if accion is None:
+            return self.__error(identificador, "AccionDesconocida", f"Accion desconocida: {solicitud.get('accion')}")
+        datos = solicitud.get("datos") or {}
+        if not isinstance(datos, dict):
+            return self.__error(identificador, "SolicitudInvalida", "Los datos deben ser un objeto JSON")
+
+        try:
+            resultado = await loop.run_in_executor(self.__ejecutor, accion, datos)
+        except KeyError as e:
+            return self.__error(identificador, "SolicitudInvalida", f"Falta el campo {e}")
+        except (TypeError, AttributeError) as e:
+            # Campos con un tipo JSON que no corresponde (por ejemplo un numero en lugar de texto)
+            return self.__error(identificador, "SolicitudInvalida", str(e))
+        except ERRORES_CLINICA as e:
+            return self.__error(identificador, type(e).__name__, str(e))
+        except Exception as e:
+            return self.__error(identificador, "ErrorInterno", str(e))
+
+        return (_codificador.encode({"id": identificador, "ok": True, "resultado": resultado}) + "\n").encode("utf-8")
+
+    def __error(self, identificador, error, mensaje):
+        respuesta = {"id": identificador, "ok": False, "error": error, "mensaje": mensaje}
+        return (_codificador.encode(respuesta) + "\n").encode("utf-8")
+
+    # Acciones: corren en el pool de hilos
+
+    def __agregar_paciente(self, datos):
+        self.__clinica.agregar_paciente(Paciente(datos["nombre"], datos["dni"], datos["fecha_nacimiento"]))
+
+    def __agendar_turno(self, datos):
+        self.__clinica.agendar_turno(datos["dni"], datos["matricula"], datos["especialidad"],
+                                     datetime.fromisoformat(datos["fecha_hora"]), datos.get("duracion"))
+
+    def __emitir_receta(self, datos):
+        self.__clinica.emitir_receta(datos["dni"], datos["matricula"], datos["medicamentos"])
+
+    def __obtener_historia_clinica(self, datos):
+        return historia_a_diccionario(self.__clinica.obtener_historia_clinica(datos["dni"]))
+
+    def __obtener_agenda_del_dia(self, datos):
+        # "dia" en ISO (AAAA-MM-DD); sin dia es la agenda de hoy
+        dia = date.fromisoformat(datos["dia"]) if datos.get("dia") else None
+        turnos = self.__clinica.obtener_agenda_del_dia(datos["matricula"], dia)
+        return [dict(zip(COLUMNAS_TURNOS, fila)) for fila in filas_turnos(turnos)]
+
+    def __metricas(self, datos):
+        # Texto en formato de Prometheus
+        return self.__clinica.obtener_metricas().exportar()
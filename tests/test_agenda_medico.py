@@ -0,0 +1,86 @@
+import unittest
+from datetime import datetime
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.turno import Turno
+from src.models.agenda_medico import AgendaMedico
+
+class TestAgendaMedico(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Pepito Juan", "12345678", "17/07/1977")
+        self.medico = Medico("Dr. Juan Pepito", "MAT11111")
+        self.agenda = AgendaMedico()
+
+    def crear_turno(self, hora, minuto, duracion=None):
+        return Turno(self.paciente, self.medico, datetime(2030, 6, 17, hora, minuto), "Pediatria", duracion)
+
+    def test_agregar_y_obtener_turno(self):
+        turno = self.crear_turno(10, 0, 30)
+        self.agenda.agregar(turno)
+
+        self.assertEqual(len(self.agenda), 1)
+        self.assertEqual(self.agenda.obtener_turno(datetime(2030, 6, 17, 10, 0)), turno)
+        self.assertIsNone(self.agenda.obtener_turno(datetime(2030, 6, 17, 10, 15)))
+
+    def test_superposicion_con_duracion(self):
+        self.agenda.agregar(self.crear_turno(10, 0, 30))
+
+        self.assertIsNotNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 10, 15), datetime(2030, 6, 17, 10, 45)))
+        self.assertIsNotNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 9, 45), datetime(2030, 6, 17, 10, 15)))
+        self.assertIsNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 10, 30), datetime(2030, 6, 17, 11, 0)))
+        self.assertIsNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 9, 30), datetime(2030, 6, 17, 10, 0)))
+
+    def test_superposicion_turno_sin_duracion(self):
+        self.agenda.agregar(self.crear_turno(10, 0))
+
+        self.assertIsNotNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 10, 0), datetime(2030, 6, 17, 10, 0)))
+        self.assertIsNotNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 9, 45), datetime(2030, 6, 17, 10, 15)))
+        self.assertIsNone(self.agenda.obtener_superpuesto(datetime(2030, 6, 17, 10, 1), datetime(2030, 6, 17, 10, 1)))
+
+    def test_error_agregar_superpuesto(self):
+        self.agenda.agregar(self.crear_turno(10, 0, 30))
+
+        with self.assertRaises(ValueError):
+            self.agenda.agregar(self.crear_turno(10, 15, 30))
+
+    def test_eliminar(self):
+        turno = self.crear_turno(10, 0, 30)
+        self.agenda.agregar(turno)
+
+        self.assertEqual(self.agenda.eliminar(datetime(2030, 6, 17, 10, 0)), turno)
+        self.assertIsNone(self.agenda.eliminar(datetime(2030, 6, 17, 10, 0)))
+        self.assertEqual(len(self.agenda), 0)
+
+    def test_huecos(self):
+        self.agenda.agregar(self.crear_turno(10, 0, 30))
+        self.agenda.agregar(self.crear_turno(11, 0, 60))
+
+        huecos = self.agenda.obtener_huecos(datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 13, 0))
+
+        self.assertEqual(huecos, [
+            (datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 10, 0)),
+            (datetime(2030, 6, 17, 10, 30), datetime(2030, 6, 17, 11, 0)),
+            (datetime(2030, 6, 17, 12, 0), datetime(2030, 6, 17, 13, 0)),
+        ])
+
+    def test_huecos_rango_dentro_de_turno(self):
+        self.agenda.agregar(self.crear_turno(10, 0, 60))
+
+        huecos = self.agenda.obtener_huecos(datetime(2030, 6, 17, 10, 15), datetime(2030, 6, 17, 10, 45))
+        self.assertEqual(huecos, [])
+
+    def test_obtener_entre_es_una_copia(self):
+        primero = self.crear_turno(9, 0, 30)
+        segundo = self.crear_turno(10, 0, 30)
+        self.agenda.agregar(primero)
+        self.agenda.agregar(segundo)
+
+        turnos = self.agenda.obtener_entre(datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 11, 0))
+        self.agenda.eliminar(datetime(2030, 6, 17, 9, 0))
+
+        self.assertEqual(turnos, [primero, segundo])
+        self.assertEqual(self.agenda.obtener_entre(datetime(2030, 6, 17, 9, 30)), [segundo])
+
+if __name__ == "__main__":
+    unittest.main()
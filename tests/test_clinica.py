@@ -1,5 +1,7 @@
+import io
+import json
 import unittest
-from datetime import datetime
+from datetime import datetime, time
 from src.models.paciente import Paciente
 from src.models.medico import Medico
 from src.models.especialidad import Especialidad
@@ -9,7 +11,8 @@ from src.exceptions import (
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
-    RecetaInvalidaException
+    RecetaInvalidaException,
+    TurnoNoEncontradoException
 )
 
 class TestClinica(unittest.TestCase):
@@ -37,6 +40,16 @@ class TestClinica(unittest.TestCase):
         self.assertEqual(len(pacientes), 1)
         self.assertEqual(pacientes[0].obtener_dni(), "12345678")
     
+    def test_paginar_pacientes(self):
+        for i in range(25):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", str(10_000 + i), "01/01/2000"))
+
+        paginador = self.clinica.paginar_pacientes(10)
+        self.assertEqual([p.obtener_dni() for p in paginador.siguiente()], [str(10_000 + i) for i in range(10)])
+        paginador.siguiente()
+        self.assertEqual(len(paginador.siguiente()), 5)
+        self.assertFalse(paginador.hay_siguiente())
+
     def test_paciente_duplicado(self):
         self.clinica.agregar_paciente(self.paciente1)
         
@@ -44,6 +57,19 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.clinica.agregar_paciente(paciente_duplicado)
     
+    def test_buscar_pacientes(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.importar_pacientes([{"nombre": "Lucía Lopez", "dni": "11111111", "fecha_nacimiento": "15/03/1990"}])
+
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("LOPEZ")], ["11111111", "87654321"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes("carlos l", limite=1)], ["87654321"])
+        self.assertEqual([p.obtener_dni() for p in self.clinica.buscar_pacientes(fecha_nacimiento="15/03/1990")],
+                         ["12345678", "11111111"])
+        self.assertEqual(self.clinica.buscar_pacientes("martinez", fecha_nacimiento="20/05/1985"), [])
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_pacientes("  ")
+
     # Tests medicos
     
     def test_agregar_medico(self):
@@ -71,6 +97,34 @@ class TestClinica(unittest.TestCase):
         
         self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
     
+    def test_buscar_medicos_por_especialidad_y_dia(self):
+        self.clinica.agregar_medico(self.medico1)
+        medico2 = Medico("Dra. María García", "MAT67890")
+        medico2.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico2)
+        self.clinica.agregar_especialidad_a_medico("MAT67890", Especialidad("Pediatría", ["lunes", "viernes"]))
+
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.buscar_medicos("pediatría", "viernes")],
+                         ["MAT12345", "MAT67890"])
+        # El lunes la Dra. García ya atendia cardiologia
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.buscar_medicos("Pediatría", "lunes")],
+                         ["MAT12345"])
+        self.assertEqual(self.clinica.buscar_medicos("Pediatría", "martes"), [])
+        self.assertEqual(self.clinica.buscar_medicos("Neurología", "lunes"), [])
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_medicos("Pediatría", "feriado")
+
+    def test_validar_especialidad_por_nombre_o_indice_de_dia(self):
+        self.clinica.validar_especialidad_en_dia(self.medico1, "Pediatría", "lunes")
+        self.clinica.validar_especialidad_en_dia(self.medico1, "Pediatría", 0)
+
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.validar_especialidad_en_dia(self.medico1, "Pediatría", "martes")
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.validar_especialidad_en_dia(self.medico1, "Cardiología", 4)
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.validar_especialidad_en_dia(self.medico1, "Pediatría", "feriado")
+
     def test_error_agregar_especialidad(self):
         with self.assertRaises(MedicoNoEncontradoException):
             self.clinica.obtener_medico_por_matricula("MAT99999")
@@ -128,6 +182,276 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(MedicoNoDisponibleException):
             self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", fecha_martes)
     
+    def test_turno_distinto_horario_mismo_medico(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 11, 0))
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_paginar_turnos_con_filtros(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        for hora in range(8, 13):
+            self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, hora, 0))
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 19, 8, 0))
+
+        paginador = self.clinica.paginar_turnos(2, datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 18), "MAT12345")
+        horas = [turno.obtener_fecha_hora().hour for turno in paginador.siguiente()]
+        horas += [turno.obtener_fecha_hora().hour for turno in paginador.siguiente()]
+        self.assertEqual(horas, [9, 10, 11, 12])
+        self.assertFalse(paginador.hay_siguiente())
+
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.paginar_turnos(2, matricula="MAT99999")
+
+    def test_obtener_turnos_entre(self):
+        medico2 = Medico("Dra. Laura Gómez", "MAT54321")
+        medico2.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(medico2)
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 19, 8, 0))
+        self.clinica.agendar_turno("12345678", "MAT54321", "Pediatría", datetime(2030, 6, 17, 9, 0))
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 9, 0))
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 24, 8, 0))
+
+        turnos = self.clinica.obtener_turnos_entre(datetime(2030, 6, 17), datetime(2030, 6, 20))
+        self.assertEqual([(turno.obtener_fecha_hora().day, turno.obtener_medico().obtener_matricula())
+                          for turno in turnos], [(17, "MAT12345"), (17, "MAT54321"), (19, "MAT12345")])
+        turnos = self.clinica.obtener_turnos_entre(datetime(2030, 6, 17), datetime(2030, 6, 20), "MAT54321")
+        self.assertEqual(len(turnos), 1)
+
+        with self.assertRaises(ValueError):
+            self.clinica.obtener_turnos_entre(datetime(2030, 6, 20), datetime(2030, 6, 17))
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_turnos_entre(datetime(2030, 6, 17), datetime(2030, 6, 20), "MAT99999")
+
+    def test_agenda_del_dia(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 11, 0))
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 9, 0))
+        self.clinica.agendar_turnos_recurrentes("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 2)
+
+        agenda = self.clinica.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 17).date())
+        self.assertEqual([turno.obtener_fecha_hora().hour for turno in agenda], [9, 10, 11])
+        self.assertEqual(len(self.clinica.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 24))), 1)
+
+        self.clinica.cancelar_turno("MAT12345", datetime(2030, 6, 17, 10, 0))
+        self.clinica.archivar_turnos(datetime(2030, 6, 17, 10, 0))
+        agenda = self.clinica.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 17))
+        self.assertEqual([turno.obtener_fecha_hora().hour for turno in agenda], [11])
+        self.assertEqual(self.clinica.obtener_agenda_del_dia("MAT12345"), [])
+
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_agenda_del_dia("MAT99999")
+
+    def test_archivar_turnos(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        for dia in (17, 19, 21):
+            self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, dia, 8, 0))
+        archivo = io.StringIO()
+
+        self.assertEqual(self.clinica.archivar_turnos(datetime(2030, 6, 20), archivo), 2)
+
+        lineas = archivo.getvalue().splitlines()
+        self.assertEqual([json.loads(linea)["fecha_hora"] for linea in lineas],
+                         ["2030-06-17T08:00:00", "2030-06-19T08:00:00"])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 1)
+        self.assertEqual(self.clinica.obtener_huecos_libres("MAT12345", datetime(2030, 6, 17, 8, 0),
+                                                            datetime(2030, 6, 17, 9, 0)),
+                         [(datetime(2030, 6, 17, 8, 0), datetime(2030, 6, 17, 9, 0))])
+        # El horario archivado se puede volver a usar
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 8, 0))
+        self.assertEqual(self.clinica.archivar_turnos(datetime(2030, 6, 1)), 0)
+
+        with self.assertRaises(ValueError):
+            self.clinica.archivar_turnos(datetime(2030, 6, 20), archivo, "xml")
+
+    def test_archivar_dos_veces_en_csv_escribe_un_solo_encabezado(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        for dia in (17, 19):
+            self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, dia, 8, 0))
+        archivo = io.StringIO()
+
+        self.clinica.archivar_turnos(datetime(2030, 6, 18), archivo, "csv")
+        self.clinica.archivar_turnos(datetime(2030, 6, 20), archivo, "csv")
+
+        lineas = archivo.getvalue().splitlines()
+        self.assertEqual(len(lineas), 3)
+        self.assertTrue(lineas[0].startswith("fecha_hora,"))
+        self.assertTrue(lineas[2].startswith("2030-06-19T08:00:00,"))
+
+    def test_turno_superpuesto_por_duracion(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 15), 30)
+
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 30), 30)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_obtener_huecos_libres(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+
+        huecos = self.clinica.obtener_huecos_libres("MAT12345", datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 11, 0))
+
+        self.assertEqual(huecos, [
+            (datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 10, 0)),
+            (datetime(2030, 6, 17, 10, 30), datetime(2030, 6, 17, 11, 0)),
+        ])
+
+    def test_buscar_turnos_libres(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        medico2 = Medico("Dra. María García", "MAT67890")
+        medico2.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        medico2.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_medico(medico2)
+
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 8, 0), 60)
+        self.clinica.agendar_turno("12345678", "MAT67890", "Pediatría", datetime(2030, 6, 17, 8, 30))
+
+        libres = self.clinica.buscar_turnos_libres("pediatría", datetime(2030, 6, 16), datetime(2030, 6, 23), 30, 4)
+
+        self.assertEqual([(medico.obtener_matricula(), fecha) for medico, fecha in libres], [
+            ("MAT67890", datetime(2030, 6, 17, 8, 0)),
+            ("MAT12345", datetime(2030, 6, 17, 9, 0)),
+            ("MAT67890", datetime(2030, 6, 17, 9, 0)),
+            ("MAT12345", datetime(2030, 6, 17, 9, 30)),
+        ])
+
+    def test_buscar_turnos_libres_desde_ahora_sigue_la_grilla(self):
+        # Lunes a media mañana: el primer turno libre es el proximo de la grilla de 30 minutos
+        clinica = Clinica(reloj=lambda: datetime(2030, 6, 17, 10, 13, 22, 500000))
+        clinica.agregar_paciente(self.paciente1)
+        clinica.agregar_medico(self.medico1)
+
+        libres = clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 17), datetime(2030, 6, 18), 30, 3)
+
+        self.assertEqual([fecha for _, fecha in libres], [datetime(2030, 6, 17, 10, 30), datetime(2030, 6, 17, 11, 0),
+                                                          datetime(2030, 6, 17, 11, 30)])
+        with self.assertRaises(ValueError):
+            clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+
+    def test_buscar_turnos_libres_respeta_dias_y_rango(self):
+        self.clinica.agregar_medico(self.medico1)
+
+        # Martes a jueves: el medico solo atiende pediatria el miercoles
+        libres = self.clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 18), datetime(2030, 6, 20, 12, 0),
+                                                   60, 100, hora_inicio=time(9, 0), hora_fin=time(12, 0))
+
+        self.assertEqual([fecha for _, fecha in libres], [datetime(2030, 6, 19, 9, 0), datetime(2030, 6, 19, 10, 0),
+                                                          datetime(2030, 6, 19, 11, 0)])
+        self.assertEqual(self.clinica.buscar_turnos_libres("Neurología", datetime(2030, 6, 18),
+                                                           datetime(2030, 6, 20), 30), [])
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 18), datetime(2030, 6, 20), 0)
+
+    def test_error_huecos_rango_invalido(self):
+        self.clinica.agregar_medico(self.medico1)
+
+        with self.assertRaises(ValueError):
+            self.clinica.obtener_huecos_libres("MAT12345", datetime(2030, 6, 17, 11, 0), datetime(2030, 6, 17, 9, 0))
+
+    def test_cancelar_turno_libera_horario(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        fecha = datetime(2030, 6, 17, 10, 0)
+
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", fecha)
+        self.clinica.cancelar_turno("MAT12345", fecha)
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 0)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 0)
+
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", fecha)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_error_cancelar_turno_inexistente(self):
+        self.clinica.agregar_medico(self.medico1)
+
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("MAT12345", datetime(2030, 6, 17, 10, 0))
+
+    def test_agendar_turnos_lote(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+
+        turnos = self.clinica.agendar_turnos_lote([
+            ("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30),
+            ("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 30)),
+        ])
+
+        self.assertEqual(len(turnos), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 1)
+
+    def test_lote_con_error_no_agenda_ninguno(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 24, 10, 0))
+
+        # El segundo turno choca con uno guardado, el tercero es un martes
+        casos = [
+            (datetime(2030, 6, 24, 10, 0), TurnoOcupadoException),
+            (datetime(2030, 6, 18, 10, 0), MedicoNoDisponibleException),
+            (datetime(2020, 6, 15, 10, 0), ValueError),
+        ]
+        for fecha, excepcion in casos:
+            with self.assertRaises(excepcion) as contexto:
+                self.clinica.agendar_turnos_lote([
+                    ("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0)),
+                    ("12345678", "MAT12345", "Pediatría", fecha),
+                ])
+            self.assertIn("Turno 2 del lote", str(contexto.exception))
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        huecos = self.clinica.obtener_huecos_libres("MAT12345", datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 11, 0))
+        self.assertEqual(huecos, [(datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 17, 11, 0))])
+
+    def test_lote_con_turnos_superpuestos_entre_si(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turnos_lote([
+                ("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30),
+                ("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 15), 30),
+            ])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 0)
+
+    def test_agendar_turnos_recurrentes(self):
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+
+        turnos = self.clinica.agendar_turnos_recurrentes("12345678", "MAT12345", "Pediatría",
+                                                         datetime(2030, 6, 17, 10, 0), 10, duracion=45)
+
+        self.assertEqual(len(turnos), 10)
+        self.assertEqual(turnos[-1].obtener_fecha_hora(), datetime(2030, 8, 19, 10, 0))
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 10)
+
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_turnos_recurrentes("12345678", "MAT12345", "Pediatría",
+                                                    datetime(2030, 6, 17, 10, 0), 0)
+
     # Tests recetas
     
     def test_emitir_receta(self):
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.columnas_turnos import ColumnasTurnos, numpy
+from src.persistencia.journal import Journal
+
+class TestColumnasTurnos(unittest.TestCase):
+    usar_numpy = False
+
+    def setUp(self):
+        self.columnas = ColumnasTurnos(usar_numpy=self.usar_numpy)
+        self.columnas.agregar("MAT1", "100", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+        self.columnas.agregar("MAT1", "200", "pediatría", datetime(2030, 6, 17, 11, 0))
+        self.columnas.agregar("MAT1", "100", "Cardiología", datetime(2030, 6, 18, 10, 0), 20)
+        self.columnas.agregar("MAT2", "200", "Cardiología", datetime(2030, 6, 18, 10, 0), 45)
+
+    def test_contar_por_una_dimension(self):
+        self.assertEqual(len(self.columnas), 4)
+        self.assertEqual(self.columnas.contar("medico"), {"MAT1": 3, "MAT2": 1})
+        self.assertEqual(self.columnas.contar("especialidad"), {"Pediatría": 2, "Cardiología": 2})
+        self.assertEqual(self.columnas.contar("hora"), {10: 3, 11: 1})
+
+    def test_contar_por_especialidad_y_dia(self):
+        self.assertEqual(self.columnas.contar(("especialidad", "dia")),
+                         {("Pediatría", "lunes"): 2, ("Cardiología", "martes"): 2})
+
+    def test_contar_en_rango(self):
+        resultado = self.columnas.contar("paciente", desde=datetime(2030, 6, 17, 10, 30), hasta=datetime(2030, 6, 18))
+
+        self.assertEqual(resultado, {"200": 1})
+
+    def test_sumar_minutos(self):
+        self.assertEqual(self.columnas.sumar_minutos("medico"), {"MAT1": 50, "MAT2": 45})
+
+    def test_histograma(self):
+        histograma = self.columnas.histograma(datetime(2030, 6, 17), datetime(2030, 6, 19), timedelta(days=1))
+
+        self.assertEqual(histograma, [(datetime(2030, 6, 17), 2), (datetime(2030, 6, 18), 2)])
+
+    def test_eliminar(self):
+        self.assertTrue(self.columnas.eliminar("MAT2", datetime(2030, 6, 18, 10, 0)))
+        self.assertFalse(self.columnas.eliminar("MAT2", datetime(2030, 6, 18, 10, 0)))
+        self.assertFalse(self.columnas.eliminar("MAT9", datetime(2030, 6, 18, 10, 0)))
+
+        self.assertEqual(self.columnas.contar("medico"), {"MAT1": 3})
+
+    def test_eliminar_anteriores(self):
+        self.assertEqual(self.columnas.eliminar_anteriores(datetime(2030, 6, 17, 11, 0)), 1)
+        self.assertEqual(self.columnas.eliminar_anteriores(datetime(2030, 6, 17, 11, 0)), 0)
+
+        self.assertEqual(len(self.columnas), 3)
+        self.assertEqual(self.columnas.sumar_minutos("medico"), {"MAT1": 20, "MAT2": 45})
+
+    def test_dimension_invalida(self):
+        with self.assertRaises(ValueError):
+            self.columnas.contar("mes")
+        with self.assertRaises(ValueError):
+            self.columnas.histograma(datetime(2030, 6, 18), datetime(2030, 6, 17), timedelta(days=1))
+
+
+@unittest.skipIf(numpy is None, "NumPy no esta instalado")
+class TestColumnasTurnosNumpy(TestColumnasTurnos):
+    usar_numpy = True
+
+
+class TestColumnasTurnosEnClinica(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta_journal = os.path.join(self.directorio.name, "clinica.journal")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_clinica_mantiene_columnas(self):
+        clinica = Clinica(Journal(self.ruta_journal), columnas_turnos=ColumnasTurnos())
+        clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 24, 10, 0))
+        clinica.cancelar_turno("MAT12345", datetime(2030, 6, 17, 10, 0))
+
+        self.assertEqual(clinica.obtener_columnas_turnos().contar("dia"), {"lunes": 1})
+        clinica.cerrar()
+
+        # Al reabrir, las columnas se llenan con el estado reconstruido del journal
+        restaurada = Clinica(Journal(self.ruta_journal), columnas_turnos=ColumnasTurnos())
+        self.assertEqual(restaurada.obtener_columnas_turnos().contar("medico"), {"MAT12345": 1})
+        restaurada.cerrar()
+
+    def test_clinica_sin_columnas(self):
+        with self.assertRaises(ValueError):
+            Clinica().obtener_columnas_turnos()
+
+if __name__ == "__main__":
+    unittest.main()
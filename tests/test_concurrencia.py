@@ -0,0 +1,224 @@
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+from src.persistencia.snapshot import Snapshot
+from src.exceptions import TurnoOcupadoException
+
+HILOS = 32
+MEDICOS = 8
+TURNOS_POR_MEDICO = 40
+TODOS_LOS_DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+
+class TestConcurrencia(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta_journal = os.path.join(self.directorio.name, "clinica.journal")
+        self.ruta_snapshot = os.path.join(self.directorio.name, "clinica.snapshot")
+        self.inicio = datetime(2030, 1, 1, 8, 0)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def abrir_clinica(self):
+        return Clinica(Journal(self.ruta_journal), Snapshot(self.ruta_snapshot), snapshot_cada=50, concurrente=True)
+
+    def cargar_datos(self, clinica):
+        for i in range(HILOS):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990"))
+        for i in range(MEDICOS):
+            medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+            medico.agregar_especialidad(Especialidad("Clinica", TODOS_LOS_DIAS))
+            clinica.agregar_medico(medico)
+
+    def test_hilos_no_duplican_turnos(self):
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        agendados = [0] * HILOS
+        rechazados = [0] * HILOS
+        errores = []
+        barrera = threading.Barrier(HILOS)
+
+        def agendar(numero):
+            # Todos los hilos intentan los mismos horarios de todos los medicos
+            dni = str(10_000_000 + numero)
+            barrera.wait()
+            try:
+                for k in range(TURNOS_POR_MEDICO):
+                    for m in range(MEDICOS):
+                        fecha = self.inicio + timedelta(minutes=30 * k)
+                        try:
+                            clinica.agendar_turno(dni, f"MAT{(m + numero) % MEDICOS:05d}", "Clinica", fecha, 30)
+                            agendados[numero] += 1
+                        except TurnoOcupadoException:
+                            rechazados[numero] += 1
+            except Exception as e:
+                errores.append(e)
+
+        hilos = [threading.Thread(target=agendar, args=(i,)) for i in range(HILOS)]
+        t0 = time.perf_counter()
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        transcurrido = time.perf_counter() - t0
+
+        intentos = HILOS * MEDICOS * TURNOS_POR_MEDICO
+        self.assertEqual(errores, [])
+        self.assertEqual(sum(agendados), MEDICOS * TURNOS_POR_MEDICO)
+        self.assertEqual(sum(agendados) + sum(rechazados), intentos)
+        self.assertGreater(intentos / transcurrido, 0)
+
+        claves = [(t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora()) for t in clinica.obtener_turnos()]
+        self.assertEqual(len(claves), len(set(claves)))
+        # La consulta por rango ve los mismos turnos, en orden de horario y matricula
+        entre = clinica.obtener_turnos_entre(self.inicio, self.inicio + timedelta(days=1))
+        self.assertEqual([(t.obtener_fecha_hora(), t.obtener_medico().obtener_matricula()) for t in entre],
+                         sorted((fecha_hora, matricula) for matricula, fecha_hora in claves))
+        clinica.cerrar()
+
+        # El journal escrito por todos los hilos (con snapshots en el medio) reconstruye lo mismo
+        restaurada = self.abrir_clinica()
+        self.assertEqual(len(restaurada.obtener_turnos()), MEDICOS * TURNOS_POR_MEDICO)
+        restaurada.cerrar()
+
+    def test_consulta_por_rango_y_cancelaciones_concurrentes(self):
+        # Un medico por hilo, todos en el mismo dia: las particiones por dia son compartidas
+        clinica = Clinica(concurrente=True)
+        for i in range(HILOS):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990"))
+            medico = Medico(f"Medico {i}", f"MAT{i:05d}")
+            medico.agregar_especialidad(Especialidad("Clinica", TODOS_LOS_DIAS))
+            clinica.agregar_medico(medico)
+        errores = []
+        barrera = threading.Barrier(HILOS)
+        intervalo = sys.getswitchinterval()
+
+        def horarios(numero):
+            # Cada hilo agenda en otro orden, asi no todos caen al final del dia
+            orden = list(range(TURNOS_POR_MEDICO))
+            random.Random(numero).shuffle(orden)
+            return [self.inicio + timedelta(minutes=15 * k) for k in orden]
+
+        def agendar(numero):
+            barrera.wait()
+            try:
+                for fecha in horarios(numero):
+                    clinica.agendar_turno(str(10_000_000 + numero), f"MAT{numero:05d}", "Clinica", fecha, 15)
+            except Exception as e:
+                errores.append(e)
+
+        def cancelar(numero):
+            barrera.wait()
+            try:
+                for fecha in horarios(numero + 1):
+                    clinica.cancelar_turno(f"MAT{numero:05d}", fecha)
+            except Exception as e:
+                errores.append(e)
+
+        def correr(funcion):
+            hilos = [threading.Thread(target=funcion, args=(i,)) for i in range(HILOS)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+
+        # Cambios de hilo muy frecuentes para que las altas se intercalen
+        sys.setswitchinterval(1e-6)
+        try:
+            correr(agendar)
+            entre = clinica.obtener_turnos_entre(self.inicio, self.inicio + timedelta(days=1))
+            correr(cancelar)
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertEqual(errores, [])
+        claves = [(t.obtener_fecha_hora(), t.obtener_medico().obtener_matricula()) for t in entre]
+        self.assertEqual(len(claves), HILOS * TURNOS_POR_MEDICO)
+        self.assertEqual(claves, sorted(claves))
+        self.assertEqual(len(clinica.obtener_turnos()), 0)
+        self.assertEqual(clinica.obtener_turnos_entre(self.inicio, self.inicio + timedelta(days=1)), [])
+        clinica.cerrar()
+
+    def test_consulta_por_medico_mientras_se_cancela_y_reagenda(self):
+        clinica = Clinica(concurrente=True)
+        self.cargar_datos(clinica)
+        horarios = [self.inicio + timedelta(minutes=15 * k) for k in range(TURNOS_POR_MEDICO)]
+        for fecha in horarios:
+            clinica.agendar_turno("10000000", "MAT00000", "Clinica", fecha, 15)
+        fin = self.inicio + timedelta(days=1)
+        errores = []
+        terminado = threading.Event()
+        intervalo = sys.getswitchinterval()
+
+        def reagendar():
+            # Cancelar y volver a agendar corre las posiciones de la agenda del medico
+            try:
+                for _ in range(20):
+                    for fecha in random.Random(len(errores)).sample(horarios, len(horarios)):
+                        clinica.cancelar_turno("MAT00000", fecha)
+                        clinica.agendar_turno("10000000", "MAT00000", "Clinica", fecha, 15)
+            except Exception as e:
+                errores.append(e)
+            finally:
+                terminado.set()
+
+        def leer():
+            try:
+                while not terminado.is_set():
+                    turnos = clinica.obtener_turnos_entre(self.inicio, fin, "MAT00000")
+                    fechas = [t.obtener_fecha_hora() for t in turnos]
+                    if fechas != sorted(fechas) or len(fechas) < TURNOS_POR_MEDICO - 1:
+                        errores.append(AssertionError(fechas))
+            except Exception as e:
+                errores.append(e)
+
+        sys.setswitchinterval(1e-6)
+        try:
+            hilos = [threading.Thread(target=reagendar)] + [threading.Thread(target=leer) for _ in range(4)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertEqual(errores, [])
+        self.assertEqual(len(clinica.obtener_turnos_entre(self.inicio, fin, "MAT00000")), TURNOS_POR_MEDICO)
+        clinica.cerrar()
+
+    def test_altas_concurrentes_de_un_mismo_paciente(self):
+        clinica = self.abrir_clinica()
+        resultados = []
+        barrera = threading.Barrier(HILOS)
+
+        def agregar():
+            barrera.wait()
+            try:
+                clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+                resultados.append(True)
+            except ValueError:
+                resultados.append(False)
+
+        hilos = [threading.Thread(target=agregar) for _ in range(HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(resultados.count(True), 1)
+        self.assertEqual(len(clinica.obtener_pacientes()), 1)
+        clinica.cerrar()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
+import sys
+import threading
 import unittest
-from src.models.especialidad import Especialidad
+from src.models.especialidad import (Especialidad, obtener_id_especialidad, obtener_nombre_especialidad,
+                                     registrar_especialidad)
 
 class TestEspecialidad(unittest.TestCase):
 #Acordarse de cuando haga las clases y eso hacer algo para los acentos aca no los pongo pero es importante que este la logica
@@ -47,6 +50,18 @@ class TestEspecialidad(unittest.TestCase):
         self.assertTrue(especialidad1.verificar_dia("miercoles"))
         self.assertTrue(especialidad2.verificar_dia("miercoles"))
 
+    def test_indices_dias(self):
+        especialidad = Especialidad("Clinica", ["Lunes", "miércoles", "miercoles", "domingo"])
+
+        self.assertEqual(especialidad.obtener_indices_dias(), {0, 2, 6})
+        self.assertTrue(especialidad.verificar_indice_dia(2))
+        self.assertFalse(especialidad.verificar_indice_dia(1))
+
+    def test_verificar_dia_invalido(self):
+        especialidad = Especialidad("Clinica", ["lunes"])
+
+        self.assertFalse(especialidad.verificar_dia("lunez"))
+
     def test_str(self):
         especialidad = Especialidad("Traumatologia", ["lunes", "miercoles"])
         resultado = str(especialidad)
@@ -55,5 +70,43 @@ class TestEspecialidad(unittest.TestCase):
         self.assertIn("lunes", resultado)
         self.assertIn("miercoles", resultado)
 
+    def test_id_sin_distinguir_mayusculas(self):
+        especialidad = Especialidad("Oftalmología", ["lunes"])
+        otra = Especialidad(" OFTALMOLOGÍA ", ["martes"])
+
+        self.assertEqual(especialidad.obtener_id(), otra.obtener_id())
+        self.assertEqual(obtener_id_especialidad("oftalmología"), especialidad.obtener_id())
+        self.assertEqual(obtener_nombre_especialidad(especialidad.obtener_id()), "Oftalmología")
+        self.assertNotEqual(Especialidad("Pediatria", ["lunes"]).obtener_id(), especialidad.obtener_id())
+
+    def test_id_de_especialidad_no_registrada(self):
+        self.assertIsNone(obtener_id_especialidad("Especialidad Inexistente"))
+
+    def test_registro_concurrente_de_especialidades(self):
+        # Cada hilo registra especialidades nuevas distintas al mismo tiempo que los demas
+        registrados = {}
+        barrera = threading.Barrier(8)
+        intervalo = sys.getswitchinterval()
+
+        def registrar(numero):
+            barrera.wait()
+            for i in range(200):
+                nombre = f"Concurrente {numero}-{i}"
+                registrados[nombre] = registrar_especialidad(nombre)
+
+        sys.setswitchinterval(1e-6)
+        try:
+            hilos = [threading.Thread(target=registrar, args=(i,)) for i in range(8)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertEqual(len(set(registrados.values())), len(registrados))
+        for nombre, numero in registrados.items():
+            self.assertEqual(obtener_nombre_especialidad(numero), nombre)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
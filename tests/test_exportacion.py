@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.exportacion import exportar_turnos, exportar_recetas
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.exceptions import MedicoNoEncontradoException, PacienteNoEncontradoException
+
+class TestExportacion(unittest.TestCase):
+
+    def crear_clinica(self):
+        return Clinica()
+
+    def setUp(self):
+        self.clinica = self.crear_clinica()
+
+        self.clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("Carlos López", "87654321", "20/05/1985"))
+        for nombre, matricula in (("Dr. Juan Pérez", "MAT12345"), ("Dra. María García", "MAT67890")):
+            medico = Medico(nombre, matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+            self.clinica.agregar_medico(medico)
+
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 19, 10, 0), 30)
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        self.clinica.agendar_turno("12345678", "MAT67890", "Pediatría", datetime(2030, 6, 24, 9, 0))
+        self.clinica.emitir_receta("12345678", "MAT12345", ["Ibuprofeno", "Paracetamol"])
+        self.clinica.emitir_receta("87654321", "MAT67890", ["Amoxicilina"])
+
+    def tearDown(self):
+        self.clinica.cerrar()
+
+    def test_iterar_turnos_sin_filtros(self):
+        self.assertEqual(len(list(self.clinica.iterar_turnos())), 3)
+
+    def test_iterar_turnos_por_matricula_en_orden(self):
+        fechas = [turno.obtener_fecha_hora() for turno in self.clinica.iterar_turnos(matricula="MAT12345")]
+
+        self.assertEqual(fechas, [datetime(2030, 6, 17, 10, 0), datetime(2030, 6, 19, 10, 0)])
+
+    def test_iterar_turnos_por_rango_y_dni(self):
+        turnos = list(self.clinica.iterar_turnos(datetime(2030, 6, 18), datetime(2030, 6, 24, 9, 0), dni="12345678"))
+
+        self.assertEqual(len(turnos), 1)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), datetime(2030, 6, 19, 10, 0))
+
+    def test_iterar_con_filtros_invalidos(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.iterar_turnos(matricula="MAT00000")
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.iterar_recetas(dni="00000000")
+        with self.assertRaises(ValueError):
+            self.clinica.iterar_turnos(datetime(2030, 6, 20), datetime(2030, 6, 18))
+
+    def test_iterar_recetas_por_matricula(self):
+        recetas = list(self.clinica.iterar_recetas(matricula="MAT67890"))
+
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Amoxicilina"])
+
+    def test_exportar_turnos_csv(self):
+        salida = io.StringIO()
+
+        cantidad = exportar_turnos(self.clinica, salida, "csv", matricula="MAT12345")
+
+        filas = list(csv.DictReader(io.StringIO(salida.getvalue())))
+        self.assertEqual(cantidad, 2)
+        self.assertEqual(filas[0]["fecha_hora"], "2030-06-17T10:00:00")
+        self.assertEqual(filas[0]["duracion"], "")
+        self.assertEqual(filas[1]["paciente"], "Ana Martínez")
+        self.assertEqual(filas[1]["duracion"], "30")
+
+    def test_exportar_recetas_jsonl(self):
+        salida = io.StringIO()
+
+        cantidad = exportar_recetas(self.clinica, salida, "jsonl", dni="12345678")
+
+        filas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual(cantidad, 1)
+        self.assertEqual(filas[0]["medicamentos"], ["Ibuprofeno", "Paracetamol"])
+        self.assertEqual(filas[0]["matricula"], "MAT12345")
+
+    def test_exportar_recetas_csv_une_medicamentos(self):
+        salida = io.StringIO()
+
+        exportar_recetas(self.clinica, salida, "csv", dni="12345678")
+
+        filas = list(csv.DictReader(io.StringIO(salida.getvalue())))
+        self.assertEqual(filas[0]["medicamentos"], "Ibuprofeno; Paracetamol")
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(ValueError):
+            exportar_turnos(self.clinica, io.StringIO(), "xml")
+
+
+class TestExportacionSQLite(TestExportacion):
+
+    def crear_clinica(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        return Clinica(repositorio=RepositorioSQLite(os.path.join(self.directorio.name, "clinica.db")))
+
+    def tearDown(self):
+        super().tearDown()
+        self.directorio.cleanup()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,6 @@
+import io
+import sys
+import threading
 import unittest
 from datetime import datetime
 from src.models.paciente import Paciente
@@ -24,6 +27,7 @@ class TestHistoriaClinica(unittest.TestCase):
     def test_crear_historia_clinica(self):
         self.assertEqual(len(self.historia.obtener_turnos()), 0)
         self.assertEqual(len(self.historia.obtener_recetas()), 0)
+        self.assertIs(self.historia.obtener_paciente(), self.paciente)
         self.assertIn("Luis Rodríguez", str(self.historia))
     
     def test_agregar_turno(self):
@@ -40,14 +44,24 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertEqual(len(recetas), 1)
         self.assertEqual(recetas[0], self.receta)
     
-    def test_obtener_copias_no_referencias(self):
+    def test_obtener_vistas_de_solo_lectura(self):
         self.historia.agregar_turno(self.turno)
         
         turnos_obtenidos = self.historia.obtener_turnos()
-        turnos_obtenidos.clear()  # Modificar la copia
+        with self.assertRaises(AttributeError):
+            turnos_obtenidos.clear()
+        with self.assertRaises(TypeError):
+            turnos_obtenidos[0] = None
         
         # La lista original no debe verse afectada
         self.assertEqual(len(self.historia.obtener_turnos()), 1)
+
+    def test_vista_refleja_cambios(self):
+        turnos_obtenidos = self.historia.obtener_turnos()
+        
+        self.historia.agregar_turno(self.turno)
+        
+        self.assertEqual(turnos_obtenidos, [self.turno])
     
     def test_agregar_turno_none(self):
         with self.assertRaises(ValueError):
@@ -67,5 +81,59 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertIn("Recetas", resultado)
         self.assertIn("Dr. Patricia Silva", resultado)
 
+    def test_str_se_actualiza_al_cambiar(self):
+        self.assertIn("No hay turnos registrados", str(self.historia))
+
+        self.historia.agregar_turno(self.turno)
+        self.assertIn("Turnos (1):\n1. Turno: 11111111 (Luis Rodríguez)", str(self.historia))
+
+        self.historia.eliminar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+        resultado = str(self.historia)
+        self.assertIn("No hay turnos registrados", resultado)
+        self.assertIn("Recetas (1):\n1. Receta - Paciente: Luis Rodríguez", resultado)
+
+    def test_render_escribe_lo_mismo_que_str(self):
+        self.historia.agregar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+
+        archivo = io.StringIO()
+        self.historia.render(archivo)
+        self.assertEqual(archivo.getvalue(), str(self.historia))
+
+        # Con el texto ya armado tambien
+        archivo = io.StringIO()
+        self.historia.render(archivo)
+        self.assertEqual(archivo.getvalue(), str(self.historia))
+
+    def test_str_no_queda_desactualizado_con_cambios_concurrentes(self):
+        # Varios hilos agregan recetas mientras otro arma el texto una y otra vez
+        terminado = threading.Event()
+        intervalo = sys.getswitchinterval()
+
+        def agregar():
+            for _ in range(500):
+                self.historia.agregar_receta(Receta(self.paciente, self.medico, ["Aspirina 100mg"]))
+
+        def leer():
+            while not terminado.is_set():
+                str(self.historia)
+
+        sys.setswitchinterval(1e-6)
+        try:
+            lector = threading.Thread(target=leer)
+            lector.start()
+            hilos = [threading.Thread(target=agregar) for _ in range(4)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+            terminado.set()
+            lector.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertIn("Recetas (2000):", str(self.historia))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
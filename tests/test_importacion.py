@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from src.importacion import leer_filas, ResultadoImportacion
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+
+class TestImportacion(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def crear_archivo(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_leer_filas_csv(self):
+        ruta = self.crear_archivo("pacientes.csv", "nombre,dni,fecha_nacimiento\nAna,1,01/01/1990\n")
+
+        self.assertEqual(list(leer_filas(ruta)), [{"nombre": "Ana", "dni": "1", "fecha_nacimiento": "01/01/1990"}])
+
+    def test_leer_filas_jsonl_con_linea_invalida(self):
+        ruta = self.crear_archivo("pacientes.jsonl", '{"nombre": "Ana"}\n\nno es json\n')
+
+        self.assertEqual(list(leer_filas(ruta)), [{"nombre": "Ana"}, None])
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(ValueError):
+            list(leer_filas("pacientes.xls"))
+
+    def test_importar_pacientes(self):
+        filas = [
+            {"nombre": "Ana Martínez", "dni": "12345678", "fecha_nacimiento": "15/03/1990"},
+            {"nombre": "Carlos López", "dni": "87654321", "fecha_nacimiento": "20/05/1985"},
+        ]
+
+        resultado = self.clinica.importar_pacientes(filas)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual(resultado.obtener_rechazados(), [])
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+        self.clinica.obtener_historia_clinica("87654321")
+
+    def test_importar_pacientes_rechaza_sin_cortar(self):
+        self.clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        filas = [
+            {"nombre": "Ana Duplicada", "dni": "12345678", "fecha_nacimiento": "15/03/1990"},
+            {"nombre": "Sin Fecha", "dni": "11111111", "fecha_nacimiento": "31/02/1990"},
+            None,
+            {"nombre": "Carlos López", "dni": "87654321", "fecha_nacimiento": "20/05/1985"},
+            {"nombre": "Carlos Repetido", "dni": "87654321", "fecha_nacimiento": "20/05/1985"},
+        ]
+
+        resultado = self.clinica.importar_pacientes(filas, tamano_lote=2)
+
+        self.assertEqual(resultado.obtener_importados(), 1)
+        self.assertEqual([numero for numero, _ in resultado.obtener_rechazados()], [1, 2, 3, 5])
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+
+    def test_importar_medicos_con_especialidades(self):
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        filas = [
+            {"nombre": "Dra. Eva Gómez", "matricula": "MAT1", "especialidad": "Clínica", "dias": "lunes;martes"},
+            {"nombre": "Dra. Eva Gómez", "matricula": "MAT1", "especialidad": "Pediatría", "dias": ["viernes"]},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "Cardiología", "dias": "martes"},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "Pediatría", "dias": "jueves"},
+            {"nombre": "Dr. Sin Dias", "matricula": "MAT2", "especialidad": "Clínica", "dias": ""},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345"},
+        ]
+
+        resultado = self.clinica.importar_medicos(filas)
+
+        self.assertEqual(resultado.obtener_importados(), 3)
+        self.assertEqual([numero for numero, _ in resultado.obtener_rechazados()], [4, 5, 6])
+        eva = self.clinica.obtener_medico_por_matricula("MAT1")
+        self.assertEqual(eva.obtener_especialidad_para_dia("viernes"), "Pediatría")
+        juan = self.clinica.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(juan.obtener_especialidad_para_dia("martes"), "Cardiología")
+
+    def test_importar_medicos_rechaza_especialidad_repetida_de_medico_existente(self):
+        self.clinica.agregar_medico(Medico("Dr. Juan Pérez", "MAT12345"))
+        filas = [
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "Cardiología", "dias": "martes"},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "CARDIOLOGÍA", "dias": "jueves"},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "Pediatría", "dias": "lunes"},
+            {"nombre": "Dr. Juan Pérez", "matricula": "MAT12345", "especialidad": "Cardiología", "dias": "viernes"},
+        ]
+
+        # Con lotes de 2 la ultima fila cae en otro lote y choca con la especialidad ya guardada
+        resultado = self.clinica.importar_medicos(filas, 2)
+
+        self.assertEqual(resultado.obtener_importados(), 2)
+        self.assertEqual([numero for numero, _ in resultado.obtener_rechazados()], [2, 4])
+        juan = self.clinica.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(juan.obtener_especialidad_para_dia("lunes"), "Pediatría")
+
+    def test_importacion_queda_en_journal(self):
+        ruta = os.path.join(self.directorio.name, "clinica.journal")
+        clinica = Clinica(Journal(ruta))
+        clinica.importar_pacientes([{"nombre": "Ana", "dni": "1", "fecha_nacimiento": "01/01/1990"}])
+        clinica.importar_medicos([{"nombre": "Dr. Juan", "matricula": "MAT1", "especialidad": "Clínica", "dias": "lunes"}])
+        clinica.cerrar()
+
+        restaurada = Clinica(Journal(ruta))
+        self.assertEqual(len(restaurada.obtener_pacientes()), 1)
+        self.assertEqual(restaurada.obtener_medico_por_matricula("MAT1").obtener_especialidad_para_dia("lunes"), "Clínica")
+        restaurada.cerrar()
+
+    def test_resultado_str(self):
+        resultado = ResultadoImportacion()
+        resultado.sumar_importados(3)
+        resultado.rechazar(2, "DNI invalido")
+
+        self.assertIn("Importados: 3", str(resultado))
+        self.assertIn("Rechazados: 1", str(resultado))
+
+if __name__ == "__main__":
+    unittest.main()
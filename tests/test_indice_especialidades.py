@@ -0,0 +1,36 @@
+import unittest
+from src.models.indice_especialidades import IndiceEspecialidades
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+class TestIndiceEspecialidades(unittest.TestCase):
+
+    def setUp(self):
+        self.indice = IndiceEspecialidades()
+        self.pediatria = Especialidad("Pediatría", ["lunes", "miércoles"])
+        self.cardiologia = Especialidad("Cardiología", ["lunes", "martes"])
+
+    def test_indexa_por_especialidad_y_dia(self):
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(self.pediatria)
+        self.indice.agregar_medico(medico)
+
+        self.assertEqual(self.indice.obtener_matriculas(self.pediatria.obtener_id(), 2), ("MAT12345",))
+        self.assertEqual(self.indice.obtener_matriculas(self.pediatria.obtener_id(), 1), ())
+        self.assertEqual(self.indice.obtener_matriculas(self.pediatria.obtener_id()), ("MAT12345",))
+        self.assertEqual(len(self.indice), 2)
+
+    def test_dia_ocupado_queda_con_la_primera_especialidad(self):
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(self.pediatria)
+        self.indice.agregar_medico(medico)
+
+        medico.agregar_especialidad(self.cardiologia)
+        self.indice.agregar(medico, self.cardiologia)
+
+        self.assertEqual(self.indice.obtener_matriculas(self.cardiologia.obtener_id(), 0), ())
+        self.assertEqual(self.indice.obtener_matriculas(self.cardiologia.obtener_id(), 1), ("MAT12345",))
+        self.assertEqual(self.indice.obtener_matriculas(self.pediatria.obtener_id(), 0), ("MAT12345",))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from src.models import indice_pacientes
+from src.models.indice_pacientes import IndicePacientes, normalizar_nombre
+from src.models.paciente import Paciente
+
+class TestIndicePacientes(unittest.TestCase):
+
+    def setUp(self):
+        self.indice = IndicePacientes()
+        self.indice.agregar_varios([
+            Paciente("Ana María López", "1", "15/03/1990"),
+            Paciente("José Martínez", "2", "15/03/1990"),
+            Paciente("Lucía López Anaya", "3", "20/05/1985"),
+        ])
+
+    def test_normalizar_nombre(self):
+        self.assertEqual(normalizar_nombre("  JOSÉ   Martínez "), "jose martinez")
+
+    def test_buscar_por_prefijo_de_cualquier_palabra(self):
+        self.assertEqual(self.indice.buscar("lóp", 10), ["1", "3"])
+        self.assertEqual(self.indice.buscar("MARIA LO", 10), ["1"])
+        self.assertEqual(self.indice.buscar("ana", 10), ["1", "3"])
+        self.assertEqual(self.indice.buscar("ana", 1), ["1"])
+        self.assertEqual(self.indice.buscar("zz", 10), [])
+
+    def test_altas_pendientes_y_ya_ordenadas(self):
+        # Mas altas que MINIMO_PENDIENTES: parte de las claves pasa a la lista principal
+        cantidad = indice_pacientes.MINIMO_PENDIENTES
+        for i in range(cantidad):
+            self.indice.agregar(Paciente(f"Paciente Lopez{i:04d}", str(10_000 + i), "01/01/2000"))
+
+        self.assertEqual(self.indice.buscar("lopez", cantidad + 2),
+                         ["1", "3"] + [str(10_000 + i) for i in range(cantidad)])
+        self.assertEqual(self.indice.buscar("paciente lopez0005", 10), ["10005"])
+        self.assertEqual(len(self.indice), 8 + 2 * cantidad)
+
+    def test_buscar_por_nacimiento(self):
+        self.assertEqual(self.indice.buscar_por_nacimiento("15/03/1990", "", 10), ["1", "2"])
+        self.assertEqual(self.indice.buscar_por_nacimiento("15/03/1990", "mart", 10), ["2"])
+        self.assertEqual(self.indice.buscar_por_nacimiento("01/01/1900", "", 10), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.journal")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def crear_clinica(self):
+        clinica = Clinica(Journal(self.ruta))
+        clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        clinica.agregar_paciente(Paciente("Carlos López", "87654321", "20/05/1985"))
+
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad_a_medico("MAT12345", Especialidad("Cardiología", ["martes"]))
+        return clinica
+
+    def test_registrar_y_leer(self):
+        journal = Journal(self.ruta)
+        journal.registrar(["P", "Ana", "1", "01/01/1990"])
+        journal.registrar_lote([["M", "Dr. Juan", "MAT1"], ["E", "MAT1", "Clinica", ["lunes"]]])
+        journal.cerrar()
+
+        eventos = list(Journal(self.ruta).leer())
+        self.assertEqual(len(eventos), 3)
+        self.assertEqual(eventos[2], ["E", "MAT1", "Clinica", ["lunes"]])
+
+    def test_lote_confirma_al_completarse(self):
+        journal = Journal(self.ruta, tamano_lote=3)
+        journal.registrar(["P", "Ana", "1", "01/01/1990"])
+        journal.registrar(["P", "Luis", "2", "01/01/1990"])
+        self.assertEqual(list(Journal(self.ruta).leer()), [])
+
+        journal.registrar(["P", "Eva", "3", "01/01/1990"])
+        self.assertEqual(len(list(Journal(self.ruta).leer())), 3)
+        journal.cerrar()
+
+    def test_linea_incompleta_se_descarta(self):
+        journal = Journal(self.ruta)
+        journal.registrar(["P", "Ana", "1", "01/01/1990"])
+        journal.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as archivo:
+            archivo.write('["P","Lu')
+
+        self.assertEqual(len(list(Journal(self.ruta).leer())), 1)
+
+        journal = Journal(self.ruta)
+        journal.registrar(["P", "Eva", "3", "01/01/1990"])
+        journal.cerrar()
+        self.assertEqual(len(list(Journal(self.ruta).leer())), 2)
+
+    def test_tamano_lote_invalido(self):
+        with self.assertRaises(ValueError):
+            Journal(self.ruta, tamano_lote=0)
+
+    def test_clinica_se_reconstruye_desde_journal(self):
+        clinica = self.crear_clinica()
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+        clinica.agendar_turno("87654321", "MAT12345", "Cardiología", datetime(2030, 6, 18, 10, 0))
+        clinica.cancelar_turno("MAT12345", datetime(2030, 6, 18, 10, 0))
+        clinica.emitir_receta("12345678", "MAT12345", ["Paracetamol 500mg"])
+        clinica.cerrar()
+
+        restaurada = Clinica(Journal(self.ruta))
+
+        self.assertEqual(len(restaurada.obtener_pacientes()), 2)
+        self.assertEqual(len(restaurada.obtener_medicos()), 1)
+        self.assertEqual(len(restaurada.obtener_turnos()), 1)
+        self.assertEqual(restaurada.obtener_turnos()[0].obtener_duracion(), 30)
+        medico = restaurada.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+        libres = restaurada.buscar_turnos_libres("Cardiología", datetime(2030, 6, 17), datetime(2030, 6, 19), 30, 1)
+        self.assertEqual(libres[0][0].obtener_matricula(), "MAT12345")
+
+        historia = restaurada.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol 500mg"])
+        self.assertEqual(len(restaurada.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 17))), 1)
+        self.assertEqual(restaurada.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 18)), [])
+        restaurada.cerrar()
+
+    def test_lote_de_turnos_se_reconstruye(self):
+        clinica = self.crear_clinica()
+        clinica.agendar_turnos_recurrentes("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 4, duracion=30)
+        clinica.cerrar()
+
+        restaurada = Clinica(Journal(self.ruta))
+        turnos = restaurada.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual([turno.obtener_fecha_hora().day for turno in turnos], [17, 24, 1, 8])
+        self.assertEqual(turnos[0].obtener_duracion(), 30)
+        restaurada.cerrar()
+
+    def test_archivo_de_turnos_se_reconstruye(self):
+        clinica = self.crear_clinica()
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 19, 10, 0))
+        clinica.archivar_turnos(datetime(2030, 6, 18))
+        clinica.cerrar()
+
+        restaurada = Clinica(Journal(self.ruta))
+        self.assertEqual([turno.obtener_fecha_hora().day for turno in restaurada.obtener_turnos()], [19])
+        self.assertEqual(restaurada.obtener_turnos_entre(datetime(2030, 6, 1), datetime(2030, 7, 1)),
+                         restaurada.obtener_turnos())
+        self.assertEqual(restaurada.obtener_historia_clinica("12345678").obtener_turnos(), [])
+        restaurada.cerrar()
+
+    def test_reproducir_no_vuelve_a_registrar(self):
+        self.crear_clinica().cerrar()
+        cantidad = len(list(Journal(self.ruta).leer()))
+
+        Clinica(Journal(self.ruta)).cerrar()
+
+        self.assertEqual(len(list(Journal(self.ruta).leer())), cantidad)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,15 @@ class TestMedico(unittest.TestCase):
         medico.agregar_especialidad(self.pediatria)
         with self.assertRaises(ValueError):
             medico.agregar_especialidad(self.pediatria)
+        with self.assertRaises(ValueError):
+            medico.agregar_especialidad(Especialidad("PEDIATRIA", ["sabado"]))
+
+    def test_id_especialidad_para_indice(self):
+        medico = Medico("Dr. Juan Pepito", "MAT12345")
+        medico.agregar_especialidad(self.pediatria)
+
+        self.assertEqual(medico.obtener_id_especialidad_para_indice(0), self.pediatria.obtener_id())
+        self.assertIsNone(medico.obtener_id_especialidad_para_indice(1))
 
     def test_especialidad_para_dia_disponible(self):
         medico = Medico("Dr. Juanito", "MAT11111")
@@ -38,6 +47,23 @@ class TestMedico(unittest.TestCase):
         self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiologia")
         self.assertIsNone(medico.obtener_especialidad_para_dia("sabado"))
 
+    def test_especialidad_para_indice(self):
+        medico = Medico("Dr. Juanito", "MAT11111")
+        medico.agregar_especialidad(self.pediatria)
+        medico.agregar_especialidad(self.cardiologia)
+
+        self.assertEqual(medico.obtener_especialidad_para_indice(0), "Pediatria")
+        self.assertEqual(medico.obtener_especialidad_para_indice(3), "Cardiologia")
+        self.assertIsNone(medico.obtener_especialidad_para_indice(6))
+
+    def test_primera_especialidad_del_dia_tiene_prioridad(self):
+        medico = Medico("Dr. Juanito", "MAT11111")
+        medico.agregar_especialidad(self.pediatria)
+        medico.agregar_especialidad(Especialidad("Clinica", ["lunes", "sabado"]))
+
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "Pediatria")
+        self.assertEqual(medico.obtener_especialidad_para_dia("sábado"), "Clinica")
+
     def test_nombre_vacio(self):
         with self.assertRaises(ValueError):
             Medico("", "MAT33333")
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+from src.metricas import Metricas, Histograma, LIMITES_LATENCIA
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.exceptions import PacienteNoEncontradoException, TurnoOcupadoException
+
+class TestMetricas(unittest.TestCase):
+
+    def test_histograma_por_bucket(self):
+        histograma = Histograma()
+        histograma.registrar(0.00001)
+        histograma.registrar(0.0003)
+        histograma.registrar(100)
+
+        cuentas = histograma.obtener_cuentas()
+        self.assertEqual(cuentas[0], 1)
+        self.assertEqual(cuentas[LIMITES_LATENCIA.index(0.0005)], 1)
+        self.assertEqual(cuentas[-1], 1)
+        self.assertEqual(histograma.obtener_total(), 3)
+
+    def test_medir_cuenta_errores_y_relanza(self):
+        metricas = Metricas()
+
+        def fallar():
+            raise ValueError("dato invalido")
+
+        medida = metricas.medir("fallar", fallar)
+        with self.assertRaises(ValueError):
+            medida()
+        self.assertEqual(metricas.obtener_errores(), {("fallar", "ValueError"): 1})
+        self.assertEqual(metricas.obtener_histograma("fallar").obtener_total(), 1)
+
+    def test_exportar_formato_prometheus(self):
+        metricas = Metricas()
+        metricas.medir("sumar", lambda a, b: a + b)(1, 2)
+        metricas.registrar_medida("tamano", "Tamaño de prueba", lambda: 42)
+
+        texto = metricas.exportar()
+        self.assertIn("# TYPE clinica_operacion_segundos histogram", texto)
+        self.assertIn('clinica_operacion_segundos_bucket{operacion="sumar",le="+Inf"} 1', texto)
+        self.assertIn('clinica_operacion_segundos_count{operacion="sumar"} 1', texto)
+        self.assertIn("# TYPE clinica_tamano gauge\nclinica_tamano 42", texto)
+
+    def test_clinica_con_metricas(self):
+        metricas = Metricas()
+        clinica = Clinica(metricas=metricas)
+        clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        with self.assertRaises(PacienteNoEncontradoException):
+            clinica.obtener_historia_clinica("99999999")
+
+        self.assertIs(clinica.obtener_metricas(), metricas)
+        self.assertEqual(metricas.obtener_histograma("agendar_turno").obtener_total(), 2)
+        self.assertEqual(metricas.obtener_errores(), {
+            ("agendar_turno", "TurnoOcupadoException"): 1,
+            ("obtener_historia_clinica", "PacienteNoEncontradoException"): 1,
+        })
+        texto = metricas.exportar()
+        self.assertIn("clinica_indice_pacientes_claves 2", texto)
+        self.assertIn("clinica_indice_especialidades_entradas 1", texto)
+
+    def test_clinica_sin_metricas_no_envuelve(self):
+        clinica = Clinica()
+
+        self.assertNotIn("agendar_turno", vars(clinica))
+        with self.assertRaises(ValueError):
+            clinica.obtener_metricas()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from src.models.paginador import Paginador
+
+class TestPaginador(unittest.TestCase):
+
+    def test_avanzar_y_volver(self):
+        paginador = Paginador(range(1, 8), 3)
+
+        self.assertEqual(paginador.obtener_numero_pagina(), 0)
+        self.assertEqual(paginador.siguiente(), [1, 2, 3])
+        self.assertFalse(paginador.hay_anterior())
+        self.assertEqual(paginador.siguiente(), [4, 5, 6])
+        self.assertEqual(paginador.obtener_posicion_inicial(), 4)
+        self.assertEqual(paginador.siguiente(), [7])
+        self.assertFalse(paginador.hay_siguiente())
+        self.assertEqual(paginador.siguiente(), [])
+
+        self.assertEqual(paginador.anterior(), [4, 5, 6])
+        self.assertEqual(paginador.anterior(), [1, 2, 3])
+        self.assertEqual(paginador.anterior(), [])
+        self.assertEqual(paginador.siguiente(), [4, 5, 6])
+        self.assertEqual(paginador.obtener_numero_pagina(), 2)
+
+    def test_lee_solo_lo_necesario(self):
+        leidos = []
+
+        def generar():
+            for i in range(1000):
+                leidos.append(i)
+                yield i
+
+        paginador = Paginador(generar(), 10)
+        paginador.siguiente()
+        # La pagina y un elemento de mas para saber si hay otra
+        self.assertEqual(len(leidos), 11)
+
+    def test_cantidad_exacta_y_vacio(self):
+        paginador = Paginador([1, 2], 2)
+        self.assertEqual(paginador.siguiente(), [1, 2])
+        self.assertFalse(paginador.hay_siguiente())
+
+        vacio = Paginador([], 5)
+        self.assertFalse(vacio.hay_siguiente())
+        self.assertEqual(vacio.siguiente(), [])
+
+    def test_tamano_invalido(self):
+        with self.assertRaises(ValueError):
+            Paginador([1], 0)
+
+if __name__ == "__main__":
+    unittest.main()
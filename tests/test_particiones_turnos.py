@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.turno import Turno
+from src.persistencia.particiones_turnos import ParticionesTurnos
+
+class TestParticionesTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Ana Martínez", "12345678", "15/03/1990")
+        self.medico1 = Medico("Dr. Juan Pérez", "MAT12345")
+        self.medico2 = Medico("Dra. Laura Gómez", "MAT54321")
+        self.particiones = ParticionesTurnos()
+
+    def agregar(self, medico, *fecha):
+        turno = Turno(self.paciente, medico, datetime(*fecha), "Pediatría")
+        self.particiones.agregar(turno)
+        return turno
+
+    def test_obtener_en_orden_dentro_del_rango(self):
+        self.agregar(self.medico1, 2030, 6, 19, 9, 0)
+        self.agregar(self.medico2, 2030, 6, 17, 10, 0)
+        self.agregar(self.medico1, 2030, 6, 17, 10, 0)
+        self.agregar(self.medico1, 2030, 6, 17, 8, 0)
+        self.agregar(self.medico1, 2030, 6, 20, 8, 0)
+
+        turnos = self.particiones.obtener_entre(datetime(2030, 6, 17, 9, 0), datetime(2030, 6, 20, 8, 0))
+        self.assertEqual([(turno.obtener_fecha_hora().day, turno.obtener_medico().obtener_matricula())
+                          for turno in turnos],
+                         [(17, "MAT12345"), (17, "MAT54321"), (19, "MAT12345")])
+        self.assertEqual(len(self.particiones), 5)
+        self.assertEqual(self.particiones.obtener_cantidad_particiones(), 3)
+
+    def test_rango_que_termina_en_un_dia_sin_turnos(self):
+        self.agregar(self.medico1, 2030, 6, 17, 8, 0)
+        self.agregar(self.medico1, 2030, 6, 19, 8, 0)
+
+        turnos = self.particiones.obtener_entre(datetime(2030, 6, 17), datetime(2030, 6, 18, 12, 0))
+        self.assertEqual(len(turnos), 1)
+
+    def test_eliminar_borra_la_particion_vacia(self):
+        turno = self.agregar(self.medico1, 2030, 6, 17, 8, 0)
+
+        self.particiones.eliminar(turno)
+        with self.assertRaises(ValueError):
+            self.particiones.eliminar(turno)
+        self.assertEqual(len(self.particiones), 0)
+        self.assertEqual(self.particiones.obtener_cantidad_particiones(), 0)
+
+    def test_quitar_anteriores(self):
+        self.agregar(self.medico1, 2030, 6, 16, 8, 0)
+        self.agregar(self.medico1, 2030, 6, 17, 8, 0)
+        self.agregar(self.medico1, 2030, 6, 17, 12, 0)
+        self.agregar(self.medico1, 2030, 6, 18, 8, 0)
+
+        quitados = self.particiones.quitar_anteriores(datetime(2030, 6, 17, 10, 0))
+        self.assertEqual([(turno.obtener_fecha_hora().day, turno.obtener_fecha_hora().hour) for turno in quitados],
+                         [(16, 8), (17, 8)])
+        self.assertEqual(len(self.particiones), 2)
+        self.assertEqual(self.particiones.obtener_cantidad_particiones(), 2)
+
+        self.particiones.quitar_anteriores(datetime(2030, 6, 17, 13, 0))
+        self.assertEqual(self.particiones.obtener_cantidad_particiones(), 1)
+        restantes = self.particiones.obtener_entre(datetime(2030, 6, 1), datetime(2030, 7, 1))
+        self.assertEqual(restantes[0].obtener_fecha_hora().day, 18)
+
+if __name__ == "__main__":
+    unittest.main()
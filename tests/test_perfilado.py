@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from src.perfilado import Perfilador
+
+def sumar_cuadrados(cantidad):
+    return sum(i * i for i in range(cantidad))
+
+class TestPerfilador(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_archivo_por_llamada_y_resumen(self):
+        perfilador = Perfilador(self.directorio.name, cantidad=5)
+        perfilada = perfilador.perfilar("cuadrados", sumar_cuadrados)
+
+        self.assertEqual(perfilada(100), sumar_cuadrados(100))
+        perfilada(1000)
+
+        self.assertEqual(sorted(os.listdir(self.directorio.name)), ["0001-cuadrados.prof", "0002-cuadrados.prof"])
+        self.assertEqual(perfilador.obtener_acciones(), {"cuadrados": 2})
+        resumen = perfilador.resumen()
+        self.assertIn("cuadrados: 2 llamadas", resumen)
+        self.assertIn("sumar_cuadrados (test_perfilado.py:", resumen)
+
+    def test_accion_anidada_no_abre_otro_perfil(self):
+        perfilador = Perfilador(self.directorio.name)
+        interna = perfilador.perfilar("interna", sumar_cuadrados)
+        externa = perfilador.perfilar("externa", lambda: interna(10))
+
+        self.assertEqual(externa(), sumar_cuadrados(10))
+        self.assertEqual(perfilador.obtener_acciones(), {"externa": 1})
+
+    def test_excepcion_se_propaga_y_se_guarda_el_perfil(self):
+        perfilador = Perfilador(self.directorio.name)
+
+        def fallar():
+            raise ValueError("dato invalido")
+
+        with self.assertRaises(ValueError):
+            perfilador.perfilar("fallar", fallar)()
+        self.assertEqual(os.listdir(self.directorio.name), ["0001-fallar.prof"])
+
+    def test_memoria(self):
+        perfilador = Perfilador(self.directorio.name, memoria=True)
+        perfilador.perfilar("listas", lambda: [list(range(100)) for _ in range(1000)])()
+
+        self.assertIn("memoria asignada", perfilador.resumen())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+from src.models.registro_ids import RegistroIds
+
+class TestRegistroIds(unittest.TestCase):
+
+    def setUp(self):
+        self.registro = RegistroIds()
+
+    def test_ids_densos_en_orden_de_registro(self):
+        self.assertEqual(self.registro.registrar("12345678"), 0)
+        self.assertEqual(self.registro.registrar("87654321"), 1)
+        self.assertEqual(self.registro.registrar("12345678"), 0)
+        self.assertEqual(len(self.registro), 2)
+
+    def test_buscar(self):
+        self.registro.registrar("MAT12345")
+
+        self.assertEqual(self.registro.obtener_id("MAT12345"), 0)
+        self.assertIsNone(self.registro.obtener_id("MAT00000"))
+        self.assertEqual(self.registro.obtener_clave(0), "MAT12345")
+        self.assertIn("MAT12345", self.registro)
+
+if __name__ == "__main__":
+    unittest.main()
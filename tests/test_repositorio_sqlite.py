@@ -0,0 +1,175 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.exceptions import (
+    PacienteNoEncontradoException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException
+)
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.clinica = self.abrir_clinica()
+
+        self.clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("Carlos López", "87654321", "20/05/1985"))
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+
+    def tearDown(self):
+        self.clinica.cerrar()
+        self.directorio.cleanup()
+
+    def abrir_clinica(self):
+        return Clinica(repositorio=RepositorioSQLite(self.ruta))
+
+    def test_pacientes_y_medicos(self):
+        self.assertEqual([p.obtener_dni() for p in self.clinica.obtener_pacientes()], ["12345678", "87654321"])
+
+        medico = self.clinica.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("miercoles"), "Pediatría")
+
+        with self.assertRaises(ValueError):
+            self.clinica.agregar_paciente(Paciente("Ana Duplicada", "12345678", "01/01/2000"))
+
+    def test_paginar_pacientes_y_medicos(self):
+        paginador = self.clinica.paginar_pacientes(1)
+        self.assertEqual([p.obtener_dni() for p in paginador.siguiente()], ["12345678"])
+        self.assertEqual([p.obtener_dni() for p in paginador.siguiente()], ["87654321"])
+        self.assertFalse(paginador.hay_siguiente())
+
+        medicos = self.clinica.paginar_medicos(10).siguiente()
+        self.assertEqual(medicos[0].obtener_especialidad_para_dia("lunes"), "Pediatría")
+
+    def test_agregar_especialidad_a_medico(self):
+        self.clinica.agregar_especialidad_a_medico("MAT12345", Especialidad("Cardiología", ["martes"]))
+
+        medico = self.clinica.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+
+    def test_turnos_superpuestos(self):
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 15), 30)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 9, 45), 30)
+
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 30), 30)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_restriccion_unica_en_repositorio(self):
+        repositorio = RepositorioSQLite(os.path.join(self.directorio.name, "otra.db"))
+        paciente = Paciente("Ana Martínez", "12345678", "15/03/1990")
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        repositorio.agregar_paciente(paciente)
+        repositorio.agregar_medico(medico)
+        fecha = datetime(2030, 6, 17, 10, 0)
+        repositorio.agregar_turno(Turno(paciente, medico, fecha, "Pediatría"))
+
+        with self.assertRaises(TurnoOcupadoException):
+            repositorio.agregar_turno(Turno(paciente, medico, fecha, "Pediatría"))
+        # Un paciente que no esta guardado no es un horario ocupado
+        desconocido = Paciente("Carlos López", "87654321", "20/05/1985")
+        with self.assertRaises(sqlite3.IntegrityError):
+            repositorio.agregar_turno(Turno(desconocido, medico, datetime(2030, 6, 17, 11, 0), "Pediatría"))
+        repositorio.cerrar()
+
+    def test_huecos_libres(self):
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+        self.clinica.agendar_turno("87654321", "MAT12345", "Pediatría", datetime(2030, 6, 17, 11, 0), 60)
+
+        huecos = self.clinica.obtener_huecos_libres("MAT12345", datetime(2030, 6, 17, 10, 15), datetime(2030, 6, 17, 13, 0))
+
+        self.assertEqual(huecos, [
+            (datetime(2030, 6, 17, 10, 30), datetime(2030, 6, 17, 11, 0)),
+            (datetime(2030, 6, 17, 12, 0), datetime(2030, 6, 17, 13, 0)),
+        ])
+
+    def test_cancelar_turno(self):
+        fecha = datetime(2030, 6, 17, 10, 0)
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", fecha)
+        self.clinica.cancelar_turno("MAT12345", fecha)
+
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("MAT12345", fecha)
+
+    def test_turnos_entre_y_archivar(self):
+        for dia in (17, 19, 24):
+            self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, dia, 10, 0))
+
+        turnos = self.clinica.obtener_turnos_entre(datetime(2030, 6, 18), datetime(2030, 6, 25))
+        self.assertEqual([turno.obtener_fecha_hora().day for turno in turnos], [19, 24])
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(datetime(2030, 6, 18), datetime(2030, 6, 25),
+                                                               "MAT12345")), 2)
+
+        agenda = self.clinica.obtener_agenda_del_dia("MAT12345", datetime(2030, 6, 19).date())
+        self.assertEqual([turno.obtener_fecha_hora() for turno in agenda], [datetime(2030, 6, 19, 10, 0)])
+
+        self.assertEqual(self.clinica.archivar_turnos(datetime(2030, 6, 20)), 2)
+        self.assertEqual([turno.obtener_fecha_hora().day for turno in self.clinica.obtener_turnos()], [24])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 1)
+
+    def test_historia_clinica(self):
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+        self.clinica.emitir_receta("12345678", "MAT12345", ["Paracetamol 500mg"])
+
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(historia.obtener_turnos()[0].obtener_duracion(), 30)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol 500mg"])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 0)
+
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.obtener_historia_clinica("99999999")
+
+    def test_datos_persisten_al_reabrir(self):
+        self.clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0))
+        self.clinica.cerrar()
+
+        self.clinica = self.abrir_clinica()
+
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        # El indice de especialidades se arma con los medicos guardados en la base
+        self.assertEqual([m.obtener_matricula() for m in self.clinica.buscar_medicos("Pediatría", "lunes")],
+                         ["MAT12345"])
+
+    def test_lote_se_deshace_ante_error(self):
+        repositorio = RepositorioSQLite(os.path.join(self.directorio.name, "lote.db"))
+
+        with self.assertRaises(ValueError):
+            with repositorio.lote():
+                repositorio.agregar_paciente(Paciente("Eva Gómez", "11111111", "01/01/2000"))
+                raise ValueError("error en medio del lote")
+
+        self.assertIsNone(repositorio.obtener_paciente("11111111"))
+        repositorio.cerrar()
+
+    def test_lote_fallido_no_deshace_escrituras_previas(self):
+        repositorio = RepositorioSQLite(os.path.join(self.directorio.name, "lote.db"), tamano_lote=10)
+        repositorio.agregar_paciente(Paciente("Eva Gómez", "11111111", "01/01/2000"))
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with repositorio.lote():
+                repositorio.agregar_paciente(Paciente("Eva Gómez", "11111111", "01/01/2000"))
+
+        self.assertIsNotNone(repositorio.obtener_paciente("11111111"))
+        repositorio.cerrar()
+
+if __name__ == "__main__":
+    unittest.main()
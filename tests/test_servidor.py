@@ -0,0 +1,131 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.servidor import ServidorClinica
+from src.metricas import Metricas
+
+TODOS_LOS_DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+
+class TestServidor(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.clinica = Clinica(concurrente=True)
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", TODOS_LOS_DIAS))
+        self.clinica.agregar_medico(medico)
+
+        self.servidor = ServidorClinica(self.clinica, hilos=4)
+        self.host, self.puerto = await self.servidor.iniciar("127.0.0.1", 0)
+
+    async def asyncTearDown(self):
+        await self.servidor.cerrar()
+
+    async def conectar(self):
+        return await asyncio.open_connection(self.host, self.puerto)
+
+    async def enviar(self, lector, escritor, linea):
+        escritor.write(linea.encode("utf-8") + b"\n")
+        await escritor.drain()
+        return json.loads(await lector.readline())
+
+    async def pedir(self, accion, datos, identificador=1):
+        lector, escritor = await self.conectar()
+        try:
+            solicitud = json.dumps({"id": identificador, "accion": accion, "datos": datos})
+            return await self.enviar(lector, escritor, solicitud)
+        finally:
+            escritor.close()
+            await escritor.wait_closed()
+
+    async def test_flujo_completo(self):
+        respuesta = await self.pedir("agregar_paciente", {"nombre": "Ana Martínez", "dni": "12345678",
+                                                          "fecha_nacimiento": "15/03/1990"})
+        self.assertEqual(respuesta, {"id": 1, "ok": True, "resultado": None})
+
+        respuesta = await self.pedir("agendar_turno", {"dni": "12345678", "matricula": "MAT12345",
+                                                       "especialidad": "Pediatría",
+                                                       "fecha_hora": "2030-01-07T10:00", "duracion": 30}, 2)
+        self.assertTrue(respuesta["ok"])
+        self.assertEqual(respuesta["id"], 2)
+
+        respuesta = await self.pedir("emitir_receta", {"dni": "12345678", "matricula": "MAT12345",
+                                                       "medicamentos": ["Ibuprofeno"]})
+        self.assertTrue(respuesta["ok"])
+
+        respuesta = await self.pedir("obtener_historia_clinica", {"dni": "12345678"})
+        historia = respuesta["resultado"]
+        self.assertEqual(historia["paciente"]["nombre"], "Ana Martínez")
+        self.assertEqual(len(historia["turnos"]), 1)
+        self.assertEqual(historia["turnos"][0]["fecha_hora"], datetime(2030, 1, 7, 10, 0).isoformat())
+        self.assertEqual(historia["turnos"][0]["duracion"], 30)
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["Ibuprofeno"])
+
+        respuesta = await self.pedir("obtener_agenda_del_dia", {"matricula": "MAT12345", "dia": "2030-01-07"})
+        self.assertEqual([turno["dni"] for turno in respuesta["resultado"]], ["12345678"])
+
+    async def test_errores_de_la_clinica(self):
+        respuesta = await self.pedir("obtener_historia_clinica", {"dni": "99999999"})
+        self.assertFalse(respuesta["ok"])
+        self.assertEqual(respuesta["error"], "PacienteNoEncontradoException")
+
+        respuesta = await self.pedir("agregar_paciente", {"nombre": "", "dni": "1", "fecha_nacimiento": "01/01/1990"})
+        self.assertEqual(respuesta["error"], "ValueError")
+
+    async def test_metricas(self):
+        respuesta = await self.pedir("metricas", {})
+        self.assertEqual(respuesta["error"], "ValueError")
+
+        clinica = Clinica(concurrente=True, metricas=Metricas())
+        servidor = ServidorClinica(clinica, hilos=1)
+        host, puerto = await servidor.iniciar("127.0.0.1", 0)
+        try:
+            lector, escritor = await asyncio.open_connection(host, puerto)
+            await self.enviar(lector, escritor, json.dumps({"id": 1, "accion": "obtener_historia_clinica",
+                                                            "datos": {"dni": "1"}}))
+            respuesta = await self.enviar(lector, escritor, json.dumps({"id": 2, "accion": "metricas"}))
+            escritor.close()
+            await escritor.wait_closed()
+        finally:
+            await servidor.cerrar()
+
+        self.assertIn('excepcion="PacienteNoEncontradoException"} 1', respuesta["resultado"])
+
+    async def test_solicitudes_invalidas(self):
+        lector, escritor = await self.conectar()
+        try:
+            respuesta = await self.enviar(lector, escritor, "esto no es json")
+            self.assertEqual(respuesta["error"], "SolicitudInvalida")
+
+            respuesta = await self.enviar(lector, escritor, json.dumps({"id": 5, "accion": "borrar_todo"}))
+            self.assertEqual((respuesta["id"], respuesta["error"]), (5, "AccionDesconocida"))
+
+            respuesta = await self.enviar(lector, escritor, json.dumps({"id": 6, "accion": "agregar_paciente",
+                                                                        "datos": {"nombre": "Ana"}}))
+            self.assertEqual(respuesta["error"], "SolicitudInvalida")
+
+            # La conexion sigue atendiendo despues de los errores
+            respuesta = await self.enviar(lector, escritor, json.dumps({"id": 7, "accion": "agregar_paciente",
+                "datos": {"nombre": "Ana", "dni": "1", "fecha_nacimiento": "01/01/1990"}}))
+            self.assertTrue(respuesta["ok"])
+        finally:
+            escritor.close()
+            await escritor.wait_closed()
+
+    async def test_conexiones_concurrentes_comparten_la_clinica(self):
+        # Muchos clientes piden el mismo horario: solo uno puede quedarse con el turno
+        await self.pedir("agregar_paciente", {"nombre": "Ana", "dni": "1", "fecha_nacimiento": "01/01/1990"})
+        datos = {"dni": "1", "matricula": "MAT12345", "especialidad": "Pediatría", "fecha_hora": "2030-01-07T10:00"}
+
+        respuestas = await asyncio.gather(*(self.pedir("agendar_turno", datos, i) for i in range(50)))
+
+        self.assertEqual(sum(respuesta["ok"] for respuesta in respuestas), 1)
+        self.assertTrue(all(respuesta["error"] == "TurnoOcupadoException"
+                            for respuesta in respuestas if not respuesta["ok"]))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+if __name__ == "__main__":
+    unittest.main()
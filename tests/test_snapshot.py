@@ -0,0 +1,136 @@
+import glob
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+from src.persistencia.snapshot import Snapshot
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta_journal = os.path.join(self.directorio.name, "clinica.journal")
+        self.ruta_snapshot = os.path.join(self.directorio.name, "clinica.snapshot")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def abrir_clinica(self, snapshot_cada=None):
+        return Clinica(Journal(self.ruta_journal), Snapshot(self.ruta_snapshot), snapshot_cada)
+
+    def cargar_datos(self, clinica):
+        clinica.agregar_paciente(Paciente("Ana Martínez", "12345678", "15/03/1990"))
+        clinica.agregar_paciente(Paciente("Carlos López", "87654321", "20/05/1985"))
+
+        medico = Medico("Dr. Juan Pérez", "MAT12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad_a_medico("MAT12345", Especialidad("Cardiología", ["martes"]))
+
+        clinica.agendar_turno("12345678", "MAT12345", "Pediatría", datetime(2030, 6, 17, 10, 0), 30)
+        clinica.agendar_turno("87654321", "MAT12345", "Cardiología", datetime(2030, 6, 18, 10, 0))
+        clinica.emitir_receta("12345678", "MAT12345", ["Paracetamol 500mg", "Ibuprofeno 400mg"])
+
+    def test_snapshot_restaura_estado(self):
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        clinica.tomar_snapshot(en_segundo_plano=False)
+        clinica.cerrar()
+
+        restaurada = Clinica(snapshot=Snapshot(self.ruta_snapshot))
+
+        self.assertEqual(len(restaurada.obtener_pacientes()), 2)
+        self.assertEqual(len(restaurada.obtener_turnos()), 2)
+        turno = restaurada.obtener_historia_clinica("12345678").obtener_turnos()[0]
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2030, 6, 17, 10, 0))
+        self.assertEqual(turno.obtener_duracion(), 30)
+        self.assertIsNone(restaurada.obtener_historia_clinica("87654321").obtener_turnos()[0].obtener_duracion())
+
+        medico = restaurada.obtener_medico_por_matricula("MAT12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("miércoles"), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+
+        receta = restaurada.obtener_historia_clinica("12345678").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol 500mg", "Ibuprofeno 400mg"])
+
+    def test_snapshot_y_cola_del_journal(self):
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        clinica.tomar_snapshot(en_segundo_plano=False)
+        clinica.cancelar_turno("MAT12345", datetime(2030, 6, 18, 10, 0))
+        clinica.agregar_paciente(Paciente("Eva Gómez", "11111111", "01/01/2000"))
+        clinica.cerrar()
+
+        restaurada = self.abrir_clinica()
+
+        self.assertEqual(len(restaurada.obtener_pacientes()), 3)
+        self.assertEqual(len(restaurada.obtener_turnos()), 1)
+        restaurada.cerrar()
+
+    def test_snapshot_trunca_journal(self):
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        clinica.tomar_snapshot(en_segundo_plano=False)
+        clinica.cerrar()
+
+        self.assertEqual(glob.glob(self.ruta_journal + ".*"), [])
+        self.assertEqual(list(Journal(self.ruta_journal).leer()), [])
+
+    def test_segmento_sin_snapshot_se_reproduce(self):
+        # Simula una caida despues de rotar el journal y antes de terminar el snapshot
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        clinica.cerrar()
+        journal = Journal(self.ruta_journal)
+        journal.rotar()
+        journal.registrar(["P", "Eva Gómez", "11111111", "01/01/2000"])
+        journal.cerrar()
+
+        restaurada = self.abrir_clinica()
+
+        self.assertEqual(len(restaurada.obtener_pacientes()), 3)
+        self.assertEqual(len(restaurada.obtener_turnos()), 2)
+        restaurada.cerrar()
+
+    def test_snapshot_en_segundo_plano(self):
+        clinica = self.abrir_clinica()
+        self.cargar_datos(clinica)
+        clinica.tomar_snapshot()
+        clinica.agregar_paciente(Paciente("Eva Gómez", "11111111", "01/01/2000"))
+        clinica.cerrar()
+
+        restaurada = self.abrir_clinica()
+        self.assertEqual(len(restaurada.obtener_pacientes()), 3)
+        self.assertEqual(len(restaurada.obtener_turnos()), 2)
+        restaurada.cerrar()
+
+    def test_snapshot_periodico(self):
+        clinica = self.abrir_clinica(snapshot_cada=3)
+        self.cargar_datos(clinica)
+        clinica.cerrar()
+
+        self.assertTrue(os.path.exists(self.ruta_snapshot))
+        self.assertGreater(Snapshot(self.ruta_snapshot).obtener_generacion(), 0)
+
+        restaurada = self.abrir_clinica()
+        self.assertEqual(len(restaurada.obtener_turnos()), 2)
+        restaurada.cerrar()
+
+    def test_error_snapshot_no_configurado(self):
+        with self.assertRaises(ValueError):
+            Clinica().tomar_snapshot()
+
+    def test_error_archivo_invalido(self):
+        with open(self.ruta_snapshot, "wb") as archivo:
+            archivo.write(b"no es un snapshot")
+
+        with self.assertRaises(ValueError):
+            Snapshot(self.ruta_snapshot).obtener_generacion()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,14 @@ class TestTurno(unittest.TestCase):
         self.assertIn("Dr. Juan Pepito", str(turno))
         self.assertIn("Pediatria", str(turno))
 
+    def test_str_con_coma_en_el_nombre(self):
+        paciente = Paciente("Gomez, Ana", "87654321", "01/01/1990")
+        turno = Turno(paciente, self.medico, self.fecha_hora, "Pediatria", 30)
+
+        self.assertEqual(str(turno), "Turno: 87654321 (Gomez, Ana) con Dr. Dr. Juan Pepito "
+                                     "- Especialidad: Pediatria - Fecha: 16/06/2025 14:30 - Duracion: 30 min")
+        self.assertIs(str(turno), str(turno))
+
     def test_paciente_none(self):
         with self.assertRaises(ValueError):
             Turno(None, self.medico, self.fecha_hora, "Pediatria")
@@ -39,6 +47,25 @@ class TestTurno(unittest.TestCase):
         with self.assertRaises(ValueError):
             Turno(self.paciente, self.medico, self.fecha_hora, "")
 
+    def test_turno_con_duracion(self):
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatria", 30)
+
+        self.assertEqual(turno.obtener_duracion(), 30)
+        self.assertEqual(turno.obtener_fin(), datetime(2025, 6, 16, 15, 0))
+        self.assertIn("30 min", str(turno))
+
+    def test_turno_sin_duracion(self):
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatria")
+
+        self.assertIsNone(turno.obtener_duracion())
+        self.assertEqual(turno.obtener_fin(), self.fecha_hora)
+
+    def test_duracion_invalida(self):
+        with self.assertRaises(ValueError):
+            Turno(self.paciente, self.medico, self.fecha_hora, "Pediatria", 0)
+        with self.assertRaises(ValueError):
+            Turno(self.paciente, self.medico, self.fecha_hora, "Pediatria", -15)
+
     def test_str_(self):
         turno = Turno(self.paciente, self.medico, self.fecha_hora, "Pediatria")
         resultado = str(turno)
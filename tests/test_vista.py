@@ -0,0 +1,38 @@
+import unittest
+from src.models.vista import VistaLista
+
+class TestVistaLista(unittest.TestCase):
+
+    def setUp(self):
+        self.lista = ["a", "b", "c"]
+        self.vista = VistaLista(self.lista)
+
+    def test_lectura(self):
+        self.assertEqual(len(self.vista), 3)
+        self.assertEqual(self.vista[0], "a")
+        self.assertEqual(self.vista[-1], "c")
+        self.assertEqual(self.vista[1:], ["b", "c"])
+        self.assertIn("b", self.vista)
+        self.assertEqual(list(reversed(self.vista)), ["c", "b", "a"])
+        self.assertEqual(self.vista.index("c"), 2)
+
+    def test_no_permite_modificar(self):
+        with self.assertRaises(TypeError):
+            self.vista[0] = "z"
+        with self.assertRaises(AttributeError):
+            self.vista.append("d")
+        self.assertEqual(self.lista, ["a", "b", "c"])
+
+    def test_slice_es_una_copia(self):
+        parte = self.vista[:2]
+        parte.clear()
+
+        self.assertEqual(len(self.vista), 3)
+
+    def test_igualdad_con_listas(self):
+        self.assertEqual(self.vista, ["a", "b", "c"])
+        self.assertEqual(VistaLista([]), [])
+        self.assertNotEqual(self.vista, ["a"])
+
+if __name__ == "__main__":
+    unittest.main()